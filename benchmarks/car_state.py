@@ -0,0 +1,126 @@
+"""
+Car State Benchmark - Memory and serialisation cost of Car
+
+Compares the slotted Car against the same class with a per-instance
+__dict__ (how Car was laid out before __slots__), and pickling against
+Car.to_bytes()/Car.from_bytes().
+
+Usage:
+    python benchmarks/car_state.py
+    python benchmarks/car_state.py --cars 20000 --repeat 5
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from race.car import Car
+from race.race_engine import RaceEngine
+from settings.race_settings import RaceSettings
+
+
+def _dict_car_class():
+    """Car with the same methods but a per-instance __dict__ instead of __slots__."""
+    namespace = {
+        name: value for name, value in vars(Car).items()
+        if name not in Car.__slots__ and name not in ("__slots__", "__dict__", "__weakref__")
+    }
+    namespace["__module__"] = __name__
+    namespace["__qualname__"] = "DictCar"
+    return type("DictCar", (), namespace)
+
+
+DictCar = _dict_car_class()
+
+
+def _race_cars():
+    """The field of a seeded race, two laps in."""
+    settings = RaceSettings.from_runtime_config().replace(race_laps=10)
+    engine = RaceEngine(circuit_id="monza", seed=1, settings=settings)
+    engine.start_race()
+    while engine.leader_lap() < 3:
+        engine.step()
+    return list(engine.cars)
+
+
+def _object_size(car):
+    """Bytes held by the object itself (plus its __dict__, if it has one)."""
+    size = sys.getsizeof(car)
+    if hasattr(car, "__dict__"):
+        size += sys.getsizeof(car.__dict__)
+    return size
+
+
+def _allocated_per_car(car_class, template, count):
+    """Bytes allocated per car when rebuilding count cars from a record."""
+    data = template.to_bytes()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cars = [car_class.from_bytes(data, template.settings) for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del cars
+    return (after - before) / count
+
+
+def _time_per_call(func, items, repeat):
+    """Best-of-repeat time per item, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark Car memory and serialisation")
+    parser.add_argument("--cars", type=int, default=10000, help="Cars allocated for the memory test")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats (best is reported)")
+    args = parser.parse_args()
+
+    slotted = _race_cars()
+    dicted = [DictCar.from_bytes(car.to_bytes(), car.settings) for car in slotted]
+    fields = len(Car.__slots__)
+
+    print(f"Car: {fields} attributes, field of {len(slotted)} cars on lap 3\n")
+
+    print("Memory per car")
+    print(f"  {'':28}{'__dict__':>12}{'__slots__':>12}")
+    print(f"  {'object (+ __dict__)':28}{_object_size(dicted[0]):>10} B{_object_size(slotted[0]):>10} B")
+    print(f"  {'allocated incl. lists/RNG':28}"
+          f"{_allocated_per_car(DictCar, slotted[0], args.cars):>10.0f} B"
+          f"{_allocated_per_car(Car, slotted[0], args.cars):>10.0f} B")
+
+    # Whole-field transfer, as a worker would send it
+    pickled_dict = [pickle.dumps(car) for car in dicted]
+    pickled_slots = [pickle.dumps(car) for car in slotted]
+    records = [car.to_bytes() for car in slotted]
+    states = [car.pack_state() for car in slotted]
+
+    print("\nSerialisation per car")
+    print(f"  {'':28}{'size':>8}{'dump':>12}{'load':>12}")
+    rows = [
+        ("pickle (__dict__)", pickled_dict, lambda: _time_per_call(pickle.dumps, dicted, args.repeat),
+         lambda: _time_per_call(pickle.loads, pickled_dict, args.repeat)),
+        ("pickle (__slots__)", pickled_slots, lambda: _time_per_call(pickle.dumps, slotted, args.repeat),
+         lambda: _time_per_call(pickle.loads, pickled_slots, args.repeat)),
+        ("to_bytes / from_bytes", records, lambda: _time_per_call(Car.to_bytes, slotted, args.repeat),
+         lambda: _time_per_call(lambda data: Car.from_bytes(data, slotted[0].settings), records, args.repeat)),
+        ("pack_state / restore_state", states, lambda: _time_per_call(Car.pack_state, slotted, args.repeat),
+         lambda: _time_per_call(lambda pair: pair[0].restore_state(pair[1]), list(zip(slotted, states)), args.repeat)),
+    ]
+    for name, payloads, dump, load in rows:
+        size = sum(len(p) for p in payloads) / len(payloads)
+        print(f"  {name:28}{size:>6.0f} B{dump():>9.2f} us{load():>9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
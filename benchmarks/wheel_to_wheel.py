@@ -0,0 +1,61 @@
+"""
+Wheel-to-Wheel Benchmark - Per-step cost of racing the car ahead
+
+Each car only races its neighbour in the sorted order (Car._race_car_ahead),
+so a step should cost the same per car whatever the field size. This times
+steps of the Python and vector engines with wheel-to-wheel racing on and
+off, for fields of 20 up to 200 cars.
+
+Usage:
+    python benchmarks/wheel_to_wheel.py
+    python benchmarks/wheel_to_wheel.py --fields 20 100 200 --steps 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from race.race_engine import create_race_engine
+from settings.race_settings import RaceSettings
+
+
+def _time_per_step(backend, field_size, steps, repeat, wheel_to_wheel):
+    """Best-of-repeat mean seconds per step over steps steps, after a lap of warm-up."""
+    settings = RaceSettings.from_runtime_config().replace(race_laps=50, wheel_to_wheel=wheel_to_wheel)
+    engine = create_race_engine(backend, circuit_id="monza", field_size=field_size, seed=1, settings=settings)
+    engine.start_race()
+    # Warm up until the field has spread out and is racing in groups
+    while engine.leader_lap() < 2:
+        engine.step()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(steps):
+            engine.step()
+        best = min(best, time.perf_counter() - start)
+    return best / steps
+
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark wheel-to-wheel racing cost per step")
+    parser.add_argument("--fields", type=int, nargs="+", default=[20, 50, 100, 200], help="Field sizes")
+    parser.add_argument("--steps", type=int, default=1000, help="Steps timed per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats (best is reported)")
+    parser.add_argument("--backends", nargs="+", default=["python", "vector"], help="Engine backends")
+    args = parser.parse_args()
+
+    print(f"{'backend':8}{'cars':>6}{'alone':>12}{'racing':>12}{'per car':>12}{'overhead':>10}")
+    for backend in args.backends:
+        for field_size in args.fields:
+            alone = _time_per_step(backend, field_size, args.steps, args.repeat, False)
+            racing = _time_per_step(backend, field_size, args.steps, args.repeat, True)
+            print(f"{backend:8}{field_size:>6}{alone * 1e3:>9.3f} ms{racing * 1e3:>9.3f} ms"
+                  f"{racing / field_size * 1e6:>9.2f} us{(racing / alone - 1) * 100:>9.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ BASE_WIDTH = 1600
 BASE_HEIGHT = 900
 FULLSCREEN = True
 SCALE_FACTOR = 1.0  # Will be calculated at runtime
+DIRTY_RECT_RENDERING = True  # Race view: update only the screen areas that changed instead of flipping every frame
 
 # Supported resolutions
 SUPPORTED_RESOLUTIONS = [
@@ -40,16 +41,61 @@ TRACK_OUTER_RADIUS = 350
 TRACK_INNER_RADIUS = 250
 TRACK_WIDTH = TRACK_OUTER_RADIUS - TRACK_INNER_RADIUS
 
+# Track length (in distance units; BASE_SPEED is units per frame)
+# Progress is arc-length uniform, so lap time depends on track length, not waypoint count.
+TRACK_UNITS_PER_KM = 23.0       # Real circuits: length_km x this (average waypoint density of the bundled circuits)
+TRACK_UNIT_PIXELS = 60.0        # Custom tracks: drawn length in pixels / this
+TRACK_RESAMPLE_SPACING = None   # Resample undecorated tracks to this waypoint spacing in pixels (None = off)
+NUM_SECTORS = 3                 # Timing sectors per lap (equal distance unless a circuit defines "sector_lines")
+MINI_SECTORS_PER_SECTOR = 8     # Timing loops per sector; time gaps update as cars cross them
+TIMING_RING_LAPS = 1            # Laps of loop crossing times kept per car
+
 # Car settings
 CAR_SIZE = 12
 CAR_SPACING = 25  # Minimum distance between cars on same position
+
+# Text rendering (ui/text_cache.py)
+TEXT_CACHE_SIZE = 1024  # Rendered strings kept in the shared LRU (numbers are drawn from glyphs instead)
+
+# Static track surface cache (ui/track_cache.py)
+TRACK_CACHE_SIZE = 4                    # Pre-rendered track surfaces kept in memory
+TRACK_CACHE_DIRECTORY = ".track_cache"  # PNG copies reused across launches (None = memory only)
+TRACK_CACHE_DISK_ENTRIES = 64           # PNG copies kept (least recently used removed first)
+TRACK_CACHE_DISK_MIN_BUILD_MS = 30      # Only save tracks slower to draw than this (loading a PNG isn't free)
 BASE_SPEED = 0.014  # Base speed - ~80 second lap times (realistic F1)
 SPEED_VARIANCE = 0.3  # Speed variation between cars
-CAR_SMOOTHING = 0.15  # Lerp factor for smooth car movement (0.1 = smooth, 0.3 = responsive)
 
 # Simulation Speed Control
 SIMULATION_SPEED_DEFAULT = 1.0  # 1x = real-time (~80 second laps)
-SIMULATION_SPEED_OPTIONS = [1, 2, 5, 10, 20]  # Available speed multipliers
+SIMULATION_SPEED_OPTIONS = [1, 2, 5, 10, 20, 50]  # Available speed multipliers
+
+# Fixed-timestep simulation
+# The engine always advances in fixed steps, so any speed is physically identical to 1x;
+# higher speeds just run more steps per rendered frame.
+SIM_TIMESTEP = 1.0                  # Default step size in frames (1.0 = 1/60 s of race time; batch runs, tests)
+SIM_TICK_RATE = 20                  # Steps per second of race time for races shown on screen (the view interpolates)
+SIM_MAX_SUBSTEPS_PER_FRAME = 20     # Substep budget per engine update() call
+SIM_MAX_BACKLOG_FRAMES = 240         # Unsimulated time kept when the budget can't keep up (avoids spiral of death)
+SIM_THREAD_IDLE_SLEEP = 0.002       # Seconds the sim thread sleeps when it has caught up with real time
+
+# Fast-forward (F = to the flag, G = ahead FAST_FORWARD_LAPS laps): simulate without rendering
+FAST_FORWARD_LAPS = 5
+FAST_FORWARD_FRAME_BUDGET_MS = 40   # Simulation time between progress-bar updates while fast-forwarding
+FAST_FORWARD_FPS = 15               # UI frame cap while fast-forwarding (leaves the sim thread more CPU)
+
+# Simulation backend
+# "python": per-car objects (reference implementation)
+# "vector": NumPy struct-of-arrays, scales to large fields and batch runs (needs numpy)
+# "event": jumps from event to event (laps, pits, DRS zones) instead of stepping frames
+ENGINE_BACKENDS = ["python", "vector", "event"]
+ENGINE_BACKEND = "python"
+
+# Race replays (binary recordings, see race/replay.py)
+REPLAY_ENABLED = True               # Record every race shown on screen
+REPLAY_DIRECTORY = "replays"
+REPLAY_MAX_FILES = 10                # Recordings kept in REPLAY_DIRECTORY (oldest removed first)
+REPLAY_RECORD_INTERVAL = 1          # Record every Nth simulation step (1 = every SIM_TICK_RATE tick)
+REPLAY_BLOCK_FRAMES = 512           # Frames per fixed-size block in the file
 
 # Race settings
 NUM_CARS = 20
@@ -66,6 +112,9 @@ TEXT_COLOR = (255, 255, 255)
 TEXT_GRAY = (150, 150, 150)
 POSITION_GAIN_COLOR = (0, 255, 100)
 POSITION_LOSS_COLOR = (255, 50, 50)
+POSITION_CHANGE_DISPLAY_TIME = 3.0  # Seconds a gain/loss arrow stays on the timing tower
+TIMING_GAP_UPDATE_HZ = 5            # Gap refreshes per second on the timing tower (None = every frame)
+OVERTAKE_HOLD_TIME = 1.0            # Seconds a pass must be held before it is logged as an overtake
 
 # Fonts
 FONT_SIZE_LARGE = 32
@@ -79,6 +128,7 @@ GAME_STATE_RACING = "racing"
 GAME_STATE_RESULTS = "results"
 GAME_STATE_SETTINGS = "settings"  # Now for display settings
 GAME_STATE_CONFIG = "config"      # Renamed from settings (gameplay config)
+GAME_STATE_REPLAY = "replay"
 
 # Track Loading
 TRACKS_DIRECTORY = "tools/tracks"
@@ -186,6 +236,22 @@ DRS_DETECTION_TIME = 1.0      # Gap required to car ahead (in seconds)
 DRS_SPEED_BOOST = 0.08        # +8% speed boost when DRS is active
 DRS_ENABLED_FROM_LAP = 2      # DRS becomes available from this lap onwards
 
+# Wheel-to-wheel racing (each car races only the car ahead of it in the order)
+WHEEL_TO_WHEEL = True              # Dirty air, blocking and overtakes (False = cars drive through each other)
+DIRTY_AIR_GAP = 1.5                # Seconds behind the car ahead where dirty air costs pace
+DIRTY_AIR_PACE_LOSS = 0.02         # Pace lost right behind the car ahead (fades out by DIRTY_AIR_GAP)
+DIRTY_AIR_CORNERING_FACTOR = 0.15  # Share of the loss saved per point of car cornering (-2 to +2)
+FOLLOW_GAP = 0.3                   # Seconds behind the car ahead where a faster car is held up
+OVERTAKE_CHANCE_PER_SECOND = 0.25  # Chance per second held up that a pass sticks (equal racecraft)
+OVERTAKE_RACECRAFT_FACTOR = 0.25   # Change in that chance per point of racecraft over the defender
+OVERTAKE_DRS_FACTOR = 3.0          # Pass chance multiplier with DRS open
+OVERTAKING_DIFFICULTY = {          # Pass chance multiplier per circuit overtaking difficulty
+    "low": 1.5,
+    "medium": 1.0,
+    "high": 0.6,
+    "very_high": 0.3,
+}
+
 # Track Characteristics
 DEFAULT_TIRE_DEG_MULTIPLIER = 1.0  # Default tire degradation multiplier for custom tracks
 
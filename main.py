@@ -2,10 +2,13 @@
 F1 Manager - Phase 1: Live Race Visualization
 Main game loop with state machine
 """
+import os
 import pygame
 import sys
 import config
-from race.race_engine import RaceEngine
+from race.race_engine import create_race_engine
+from race.replay import ReplayRecorder, ReplayPlayer, new_replay_path, prune_replays
+from race.sim_thread import RaceView, SimulationThread
 from race.track_loader import get_default_waypoints
 from ui.renderer import TrackRenderer
 from ui.timing_screen import TimingScreen
@@ -16,11 +19,23 @@ from ui.settings_screen import SettingsScreen
 from ui.settings_display_simple import SettingsDisplayScreen
 from settings.runtime_config import runtime_config
 from settings.persistence import SettingsPersistence
+from ui.text_cache import text_cache
+from ui.track_cache import track_surface_cache
 
 
 class F1Manager:
     """Main game class with state machine"""
 
+    # Speed keys (1-6) -> simulation / playback speed
+    SPEED_KEYS = {
+        pygame.K_1: 1,
+        pygame.K_2: 2,
+        pygame.K_3: 5,
+        pygame.K_4: 10,
+        pygame.K_5: 20,
+        pygame.K_6: 50,
+    }
+
     def __init__(self):
         # Initialize pygame
         pygame.init()
@@ -99,6 +114,12 @@ class F1Manager:
         self.state = config.GAME_STATE_MENU
         self.running = True
         self.paused = False
+
+        # Fast-forward (race simulated without rendering, see _start_fast_forward)
+        self.fast_forwarding = False
+        self.fast_forward_target = None  # Lap to stop at (None = the chequered flag)
+        self.fast_forward_from = 0.0     # Leader's total progress when fast-forward started
+        self.fast_forward_dimmed = False  # Race view behind the progress bar has been dimmed
         
         # Current track waypoints, decorations, and circuit ID (None = default)
         self.current_waypoints = None
@@ -119,24 +140,50 @@ class F1Manager:
         self.display_settings_screen = SettingsDisplayScreen(self.screen, self.native_resolution)
         
         # Cache FPS font
-        self.fps_font = pygame.font.Font(None, 20)
+        self.fps_font = text_cache.font(20)
+        self.fps_rect = pygame.Rect(0, 0, 0, 0)
+
+        # Dirty-rect rendering: the race view frame last drawn in full (None = draw the next one in full)
+        self.dirty_frame_key = None
         
         # Initialize race components (created when race starts)
         self.race_engine = None
         self.track_renderer = None
         self.timing_screen = None
         self.results_screen = None
+
+        # Live race: the engine runs on the sim thread, the UI draws from race_view
+        self.simulation = None
+        self.race_view = None
+
+        # Race replays
+        self.race_recorder = None
+        self.replay_player = None
+        self.last_replay_path = None
     
     def _start_race(self, waypoints=None, decorations=None, circuit_id=None):
         """Initialize and start a race with optional custom waypoints, decorations, or circuit ID"""
         self.current_waypoints = waypoints
         self.current_decorations = decorations
         self.current_circuit_id = circuit_id
-        self.race_engine = RaceEngine(waypoints=waypoints, decorations=decorations, circuit_id=circuit_id)
+        self._close_replay()
+        self.race_engine = create_race_engine(waypoints=waypoints, decorations=decorations, circuit_id=circuit_id,
+                                              tick_rate=config.SIM_TICK_RATE)
+        if config.REPLAY_ENABLED:
+            os.makedirs(config.REPLAY_DIRECTORY, exist_ok=True)
+            self.last_replay_path = new_replay_path(config.REPLAY_DIRECTORY)
+            self.race_recorder = ReplayRecorder(self.last_replay_path, self.race_engine)
+            prune_replays(config.REPLAY_DIRECTORY, keep=self.last_replay_path)
+            self.race_engine.recorder = self.race_recorder
+        self.simulation = SimulationThread(self.race_engine)
+        self.race_view = RaceView(self.race_engine, self.simulation.buffer, self.simulation.events,
+                                  self.simulation.watch_events)
+        self.simulation.start()
         self.track_renderer = TrackRenderer(self.screen)
         self.timing_screen = TimingScreen(self.screen)
-        self.results_screen = ResultsScreen(self.screen)
+        self.results_screen = ResultsScreen(self.screen, self.race_view.events)
         self.paused = False
+        self.fast_forwarding = False
         self.state = config.GAME_STATE_RACING
 
     def _return_to_menu(self):
@@ -144,9 +191,11 @@ class F1Manager:
         # Reset track renderer cache if it exists
         if self.track_renderer:
             self.track_renderer.reset_cache()
+        self._close_replay()
         
         # Clear race components
         self.race_engine = None
+        self.race_view = None
         self.track_renderer = None
         self.timing_screen = None
         self.results_screen = None
@@ -155,6 +204,40 @@ class F1Manager:
         self.main_menu.selected_index = 0
         self.state = config.GAME_STATE_MENU
     
+    def _stop_simulation(self):
+        """Stop the sim thread (the engine can be used directly afterwards)"""
+        if self.simulation:
+            self.simulation.stop()
+            self.simulation = None
+
+    def _finish_recording(self):
+        """Finalise the current race's replay file (it can be played from then on)"""
+        self._stop_simulation()  # The sim thread writes to the recorder
+        if self.race_recorder:
+            self.race_recorder.close()
+            self.race_engine.recorder = None
+            self.race_recorder = None
+
+    def _close_replay(self):
+        """Stop recording and close any open replay"""
+        self._finish_recording()
+        if self.replay_player:
+            self.replay_player.close()
+            self.replay_player = None
+
+    def _start_replay(self):
+        """Play back the race that just finished"""
+        self._finish_recording()
+        if not self.last_replay_path or not os.path.exists(self.last_replay_path):
+            return
+        if self.replay_player:
+            self.replay_player.close()
+        self.replay_player = ReplayPlayer(self.last_replay_path)
+        self.track_renderer = TrackRenderer(self.screen)
+        self.timing_screen = TimingScreen(self.screen)
+        self.paused = False
+        self.state = config.GAME_STATE_REPLAY
+
     def _handle_window_resize(self, width, height):
         """Handle window resize event"""
         # Update the screen surface
@@ -201,13 +284,14 @@ class F1Manager:
         self.display_settings_screen = SettingsDisplayScreen(self.screen, self.native_resolution)
         
         # Recreate race components if in race
-        if self.state == config.GAME_STATE_RACING and self.race_engine:
+        if self.state in (config.GAME_STATE_RACING, config.GAME_STATE_REPLAY) and self.race_engine:
             self.track_renderer = TrackRenderer(self.screen)
             self.timing_screen = TimingScreen(self.screen)
-            self.results_screen = ResultsScreen(self.screen)
+            self.results_screen = ResultsScreen(self.screen, self.race_view.events if self.race_view else None,
+                                                self.results_screen)
         
         # Recreate FPS font
-        self.fps_font = pygame.font.Font(None, 20)
+        self.fps_font = text_cache.font(20)
 
     def handle_events(self):
         """Handle user input based on current state"""
@@ -220,6 +304,10 @@ class F1Manager:
             elif event.type == pygame.VIDEORESIZE:
                 self._handle_window_resize(event.w, event.h)
 
+            # The window contents may have been lost; draw the next frame in full
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.dirty_frame_key = None
+
             # Route events based on state
             if self.state == config.GAME_STATE_MENU:
                 self._handle_menu_event(event)
@@ -233,6 +321,8 @@ class F1Manager:
                 self._handle_racing_event(event)
             elif self.state == config.GAME_STATE_RESULTS:
                 self._handle_results_event(event)
+            elif self.state == config.GAME_STATE_REPLAY:
+                self._handle_replay_event(event)
 
     def _handle_menu_event(self, event):
         """Handle events in main menu state"""
@@ -302,42 +392,80 @@ class F1Manager:
             SettingsPersistence.save(runtime_config)
             self.state = config.GAME_STATE_MENU
 
+    def _start_fast_forward(self, target_lap=None):
+        """
+        Simulate the race without rendering until the leader starts target_lap.
+
+        The sim thread runs flat out while a progress bar is drawn over the
+        last race frame. Rendering resumes from the resulting state.
+
+        Args:
+            target_lap: Lap to stop at (None or past the last lap = the chequered flag)
+        """
+        view = self.race_view
+        if view.is_race_finished():
+            return
+        if target_lap is not None and target_lap > view.total_laps:
+            target_lap = None
+        self.paused = False
+        self.fast_forwarding = True
+        self.fast_forward_target = target_lap
+        self.fast_forward_from = view.get_leader().get_total_progress()
+        self.fast_forward_dimmed = False
+        self.simulation.fast_forward(target_lap)
+
+    def _stop_fast_forward(self):
+        """Resume normal rendering from wherever fast-forward got to"""
+        self.fast_forwarding = False
+        self.simulation.cancel_fast_forward()
+
     def _handle_racing_event(self, event):
         """Handle events during racing"""
+        if self.fast_forwarding:
+            # ESC / SPACE stop fast-forwarding where the race is now
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_SPACE):
+                self._stop_fast_forward()
+            return
+
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self._return_to_menu()
                 return
 
             elif event.key == pygame.K_SPACE:
-                if self.race_engine.is_race_finished():
+                if self.race_view.is_race_finished():
                     # Race finished - go to results
+                    self._finish_recording()
                     self.state = config.GAME_STATE_RESULTS
-                elif not self.race_engine.race_started:
-                    self.race_engine.start_race()
+                elif not self.race_view.race_started:
+                    self.simulation.start_race()
                 else:
                     self.paused = not self.paused
+                    self.simulation.set_paused(self.paused)
 
             elif event.key == pygame.K_r:
                 # Restart race with same track
                 self._start_race(waypoints=self.current_waypoints, decorations=self.current_decorations, circuit_id=self.current_circuit_id)
 
-            # Speed control keys (1-5)
-            elif event.key == pygame.K_1:
-                self.race_engine.set_simulation_speed(1)
-            elif event.key == pygame.K_2:
-                self.race_engine.set_simulation_speed(2)
-            elif event.key == pygame.K_3:
-                self.race_engine.set_simulation_speed(5)
-            elif event.key == pygame.K_4:
-                self.race_engine.set_simulation_speed(10)
-            elif event.key == pygame.K_5:
-                self.race_engine.set_simulation_speed(20)
+            elif event.key == pygame.K_LEFTBRACKET:
+                # Rewind to the start of the previous lap (the race resumes from there)
+                if self.race_view.race_started:
+                    self.simulation.rewind_to_lap(self.race_view.leader_lap() - 1)
+
+            # Fast-forward to the flag / a few laps ahead
+            elif event.key == pygame.K_f:
+                self._start_fast_forward()
+            elif event.key == pygame.K_g:
+                self._start_fast_forward(self.race_view.leader_lap() + config.FAST_FORWARD_LAPS)
+
+            # Speed control keys (1-6)
+            elif event.key in self.SPEED_KEYS:
+                self.simulation.set_simulation_speed(self.SPEED_KEYS[event.key])
 
         # Handle mouse clicks for speed buttons
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                self._handle_speed_button_click(event.pos)
+                self._handle_speed_button_click(event.pos, self.simulation)
 
     def _handle_results_event(self, event):
         """Handle events on results screen"""
@@ -355,6 +483,11 @@ class F1Manager:
                 # Restart race with same track
                 self._start_race(waypoints=self.current_waypoints, decorations=self.current_decorations, circuit_id=self.current_circuit_id)
                 return
+
+            elif event.key == pygame.K_v:
+                # Watch the race again
+                self._start_replay()
+                return
             
             # Scroll events
             elif event.key in (pygame.K_UP, pygame.K_DOWN):
@@ -364,8 +497,37 @@ class F1Manager:
         elif event.type == pygame.MOUSEWHEEL:
             self.results_screen.handle_scroll(event)
 
-    def _handle_speed_button_click(self, pos):
-        """Check if a speed button was clicked"""
+    def _handle_replay_event(self, event):
+        """Handle events while watching a replay"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                # Back to the results
+                self.replay_player.close()
+                self.replay_player = None
+                self.state = config.GAME_STATE_RESULTS
+
+            elif event.key == pygame.K_SPACE:
+                self.paused = not self.paused
+
+            # Jump a lap back / forward
+            elif event.key == pygame.K_LEFT:
+                self.replay_player.seek_lap(self.replay_player.current_lap() - 1)
+            elif event.key == pygame.K_RIGHT:
+                self.replay_player.seek_lap(self.replay_player.current_lap() + 1)
+
+            elif event.key == pygame.K_HOME:
+                self.replay_player.seek_frame(0)
+
+            # Playback speed keys (same as racing)
+            elif event.key in self.SPEED_KEYS:
+                self.replay_player.set_simulation_speed(self.SPEED_KEYS[event.key])
+
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                self._handle_speed_button_click(event.pos, self.replay_player)
+
+    def _handle_speed_button_click(self, pos, engine):
+        """Check if a speed button was clicked (engine: sim thread or replay player)"""
         x, y = pos
         options = config.SIMULATION_SPEED_OPTIONS
         button_width = 35
@@ -378,7 +540,7 @@ class F1Manager:
             for i, speed in enumerate(options):
                 btn_x = start_x + i * (button_width + margin)
                 if btn_x <= x <= btn_x + button_width:
-                    self.race_engine.set_simulation_speed(speed)
+                    engine.set_simulation_speed(speed)
                     break
 
     def update(self):
@@ -392,15 +554,27 @@ class F1Manager:
         elif self.state == config.GAME_STATE_SETTINGS:
             self.display_settings_screen.update()
         elif self.state == config.GAME_STATE_RACING:
-            if self.race_engine and self.race_engine.race_started and not self.paused:
-                if self.race_engine.is_race_finished():
-                    # Auto-transition to results
-                    self.state = config.GAME_STATE_RESULTS
-                else:
-                    self.race_engine.update()
+            # The sim thread keeps its own time; take its latest snapshot
+            self.race_view.refresh()
+            if self.fast_forwarding and not self.simulation.fast_forwarding:
+                self._stop_fast_forward()
+            if self.race_view.is_race_finished() and not self.paused:
+                # Auto-transition to results
+                self._finish_recording()
+                self.state = config.GAME_STATE_RESULTS
+        elif self.state == config.GAME_STATE_REPLAY:
+            if not self.paused:
+                self.replay_player.update(self.clock.get_time() / 1000.0 * config.FPS)
 
     def render(self):
         """Render based on current state"""
+        if self.state == config.GAME_STATE_RACING and self.fast_forwarding:
+            self._render_fast_forward()
+            return
+
+        if self._render_race_dirty():
+            return
+
         # Clear screen
         self.screen.fill(config.BG_COLOR)
 
@@ -416,40 +590,104 @@ class F1Manager:
             self.display_settings_screen.render()
             
         elif self.state == config.GAME_STATE_RACING:
-            self._render_race()
+            self._render_race(self.race_view)
+
+        elif self.state == config.GAME_STATE_REPLAY:
+            self._render_race(self.replay_player)
             
         elif self.state == config.GAME_STATE_RESULTS:
             self.results_screen.render(self.race_engine)
 
         # Show FPS (always)
-        fps = int(self.clock.get_fps())
-        fps_text = self.fps_font.render(f"FPS: {fps}", True, config.TEXT_GRAY)
-        self.screen.blit(fps_text, (config.SCREEN_WIDTH - 80, 10))
+        self._draw_fps()
 
         # Update display
         pygame.display.flip()
 
-    def _render_race(self):
-        """Render the race view"""
+    def _render_race_dirty(self):
+        """
+        Draw a race view frame updating only the screen areas that changed.
+
+        The frame is drawn in full instead (returning False) when dirty-rect
+        rendering is off, while paused, or when anything but the race moved
+        on since the last frame: another screen, race, renderer or size.
+
+        Returns:
+            bool: True if the frame was drawn
+        """
+        if self.state == config.GAME_STATE_RACING:
+            engine = self.race_view
+        elif self.state == config.GAME_STATE_REPLAY:
+            engine = self.replay_player
+        else:
+            engine = None
+        if engine is None or self.paused or not config.DIRTY_RECT_RENDERING:
+            self.dirty_frame_key = None
+            return False
+
+        key = (self.state, engine, self.track_renderer, self.timing_screen, self.screen.get_size())
+        if key != self.dirty_frame_key:
+            # This frame is drawn in full; the next ones only redraw what changed
+            self.dirty_frame_key = key
+            return False
+
+        rects = self._render_race(engine, dirty=True)
+        rects.append(self._draw_fps(restore=True))
+        pygame.display.update(rects)
+        return True
+
+    def _draw_fps(self, restore=False):
+        """
+        Draw the FPS counter (top right, over the timing screen header).
+
+        Args:
+            restore: Redraw the timing screen under last frame's counter first
+
+        Returns:
+            pygame.Rect: Screen area changed
+        """
+        fps = int(self.clock.get_fps())
+        fps_text = text_cache.render(self.fps_font, f"FPS: {fps}", True, config.TEXT_GRAY)
+        rect = fps_text.get_rect(topleft=(config.SCREEN_WIDTH - 80, 10))
+        changed = rect
+        if restore:
+            changed = rect.union(self.fps_rect)
+            self.screen.blit(self.timing_screen.timing_surface, changed,
+                             changed.move(-config.TIMING_VIEW_X, 0))
+        self.screen.blit(fps_text, rect)
+        self.fps_rect = rect
+        return changed
+
+    def _render_race(self, engine, dirty=False):
+        """
+        Render the race view of a live race or a replay.
+
+        Args:
+            engine: Race view or replay player to show
+            dirty: Only redraw what changed since the last frame
+
+        Returns:
+            list: Screen rectangles that changed
+        """
         # Render track and cars
-        self.track_renderer.render(self.race_engine)
+        rects = self.track_renderer.render(engine, dirty)
 
         # Render timing screen
-        self.timing_screen.render(self.race_engine)
+        rects += self.timing_screen.render(engine, dirty=dirty)
 
         # Draw separator line
-        pygame.draw.line(
+        rects.append(pygame.draw.line(
             self.screen,
             config.TRACK_LINE_COLOR,
             (config.TRACK_VIEW_WIDTH, 0),
             (config.TRACK_VIEW_WIDTH, config.SCREEN_HEIGHT),
             2
-        )
+        ))
 
         # Show pause indicator
         if self.paused:
-            font = pygame.font.Font(None, 48)
-            pause_text = font.render("PAUSED", True, config.TEXT_COLOR)
+            font = text_cache.font(48)
+            pause_text = text_cache.render(font, "PAUSED", True, config.TEXT_COLOR)
             pause_rect = pause_text.get_rect(
                 center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2)
             )
@@ -460,6 +698,55 @@ class F1Manager:
             overlay.fill((0, 0, 0))
             self.screen.blit(overlay, bg_rect)
             self.screen.blit(pause_text, pause_rect)
+        return rects
+
+    def _render_fast_forward(self):
+        """
+        Draw the fast-forward progress bar over the last race frame.
+
+        The track and timing screen are not redrawn while fast-forwarding:
+        the race view is dimmed once, then only the progress panel is
+        updated on the display.
+        """
+        engine = self.race_view
+        if not self.fast_forward_dimmed:
+            overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            overlay.set_alpha(160)
+            overlay.fill((0, 0, 0))
+            self.screen.blit(overlay, (0, 0))
+
+        # Progress from where fast-forward started to the target lap (or the flag)
+        target = self.fast_forward_target or engine.total_laps + 1
+        current = engine.get_leader().get_total_progress()
+        span = (target - 1) - self.fast_forward_from
+        fraction = 1.0 if span <= 0 else min(1.0, max(0.0, (current - self.fast_forward_from) / span))
+
+        width, height = config.get_scaled(420), config.get_scaled(110)
+        panel = pygame.Rect(0, 0, width, height)
+        panel.center = (config.TRACK_VIEW_WIDTH // 2, config.SCREEN_HEIGHT // 2)
+        pygame.draw.rect(self.screen, (20, 20, 20), panel)
+        pygame.draw.rect(self.screen, config.TRACK_LINE_COLOR, panel, 2)
+
+        font = text_cache.font(config.FONT_SIZE_MEDIUM)
+        title = "SIMULATING TO FINISH" if self.fast_forward_target is None else f"FAST FORWARD TO LAP {target}"
+        margin = config.get_scaled(16)
+        title_text = text_cache.render(font, title, True, config.TEXT_COLOR)
+        self.screen.blit(title_text, (panel.x + margin, panel.y + margin))
+
+        bar = pygame.Rect(panel.x + margin, panel.centery - config.get_scaled(8),
+                          width - 2 * margin, config.get_scaled(16))
+        pygame.draw.rect(self.screen, (60, 60, 60), bar)
+        pygame.draw.rect(self.screen, config.TEXT_COLOR, (bar.x, bar.y, int(bar.width * fraction), bar.height))
+
+        status = f"{engine.get_race_status()}  |  ESC to stop"
+        status_text = text_cache.render(font, status, True, config.TEXT_GRAY)
+        self.screen.blit(status_text, (panel.x + margin, panel.bottom - margin - status_text.get_height()))
+
+        if self.fast_forward_dimmed:
+            pygame.display.update(panel)
+        else:
+            pygame.display.flip()
+            self.fast_forward_dimmed = True
 
     def run(self):
         """Main game loop"""
@@ -467,10 +754,12 @@ class F1Manager:
             self.handle_events()
             self.update()
             self.render()
-            self.clock.tick(config.FPS)
+            self.clock.tick(config.FAST_FORWARD_FPS if self.fast_forwarding else config.FPS)
         
         # Save settings before quitting
         SettingsPersistence.save(runtime_config)
+        self._close_replay()  # Stops the sim thread and finalises the recording
+        track_surface_cache.wait()
         pygame.quit()
         sys.exit()
 
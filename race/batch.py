@@ -0,0 +1,236 @@
+"""
+Batch Race Simulator - Runs many headless races across worker processes
+
+Builds on RaceEngine and Car without touching pygame, so thousands of races
+can be simulated per circuit for strategy analysis and balance testing.
+"""
+import csv
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from race.race_engine import create_race_engine
+from settings.race_settings import RaceSettings
+
+
+def simulate_race(circuit_id=None, seed=None, waypoints=None, decorations=None,
+                  backend=None, field_size=None, settings=None):
+    """
+    Run a single race to the chequered flag without rendering.
+
+    Args:
+        circuit_id: ID of real F1 circuit (e.g., "monaco"), None for default track
+        seed: Race seed (None = random, recorded in the summary)
+        waypoints: Custom waypoints (overrides circuit_id if both provided)
+        decorations: Custom track decorations
+        backend: Engine backend (see config.ENGINE_BACKENDS)
+        field_size: Number of cars (default: full grid from TEAMS_DATA)
+        settings: RaceSettings for the race (default: snapshot of runtime_config)
+
+    Returns:
+        dict: Race summary with finishing order, lap times and pit counts
+    """
+    engine = create_race_engine(backend, waypoints=waypoints, decorations=decorations,
+                                circuit_id=circuit_id, field_size=field_size, seed=seed,
+                                settings=settings)
+    engine.start_race()
+    engine.run_to_finish()
+
+    return summarize_race(engine)
+
+
+def summarize_race(engine):
+    """
+    Build a plain-data summary of a finished race (picklable across processes).
+
+    Args:
+        engine: RaceEngine after the race has finished
+
+    Returns:
+        dict: Race summary
+    """
+    cars = []
+    for car in engine.get_cars_by_position():
+        cars.append({
+            "position": car.position,
+            "driver_number": car.driver_number,
+            "driver_short": car.driver_short,
+            "team": car.team,
+            "starting_position": car.starting_position,
+            "laps_completed": car.total_laps,
+            "pit_stops": car.pit_stops,
+            "best_lap_time": car.best_lap_time,
+            "lap_times": list(car.lap_times),
+        })
+
+    return {
+        "seed": engine.seed,
+        "state_hash": engine.get_state_hash(),
+        "circuit_id": engine.track.circuit_id,
+        "total_laps": engine.total_laps,
+        "race_time": engine.race_time,
+        "finishing_order": [c["driver_short"] for c in cars],
+        "cars": cars,
+    }
+
+
+def _run_job(job):
+    """Worker entry point: job is (run_index, seed, race_kwargs)."""
+    run_index, seed, race_kwargs = job
+    result = simulate_race(seed=seed, **race_kwargs)
+    result["run"] = run_index
+    return result
+
+
+def run_batch(circuit_id=None, runs=1, workers=1, seed=None, waypoints=None, decorations=None,
+              backend=None, field_size=None, settings=None, progress_callback=None):
+    """
+    Simulate a batch of races, optionally spread over a process pool.
+
+    Race i is run with seed (seed + i), so any single race can be reproduced
+    on its own with simulate_race().
+
+    Args:
+        circuit_id: ID of real F1 circuit, None for default track
+        runs: Number of races to simulate
+        workers: Number of worker processes (1 = run in this process)
+        seed: Base seed (None = pick one at random, recorded in results)
+        waypoints: Custom waypoints (overrides circuit_id)
+        decorations: Custom track decorations
+        backend: Engine backend (see config.ENGINE_BACKENDS)
+        field_size: Number of cars (default: full grid from TEAMS_DATA)
+        settings: RaceSettings for every race (default: snapshot of runtime_config
+                  taken now, so workers don't depend on the global)
+        progress_callback: Optional callable(completed, total) after each race
+
+    Returns:
+        list: Race summaries ordered by run index
+    """
+    if seed is None:
+        seed = random.randrange(2 ** 31)
+    if settings is None:
+        settings = RaceSettings.from_runtime_config()
+
+    race_kwargs = {
+        "circuit_id": circuit_id,
+        "waypoints": waypoints,
+        "decorations": decorations,
+        "backend": backend,
+        "field_size": field_size,
+        "settings": settings,
+    }
+    jobs = [(i, seed + i, race_kwargs) for i in range(runs)]
+    results = []
+
+    if workers <= 1:
+        for job in jobs:
+            results.append(_run_job(job))
+            if progress_callback:
+                progress_callback(len(results), runs)
+        return results
+
+    # Settings travel with each job, so spawned workers need no global setup
+    chunksize = max(1, runs // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(_run_job, jobs, chunksize=chunksize):
+            results.append(result)
+            if progress_callback:
+                progress_callback(len(results), runs)
+
+    return results
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+CSV_COLUMNS = [
+    "run", "seed", "circuit_id", "position", "driver_number", "driver_short", "team",
+    "starting_position", "laps_completed", "pit_stops", "best_lap_time", "race_time", "lap_times",
+]
+
+
+def write_csv(results, filepath):
+    """
+    Write batch results as CSV, one row per car per race.
+
+    Lap times are stored in a single column, separated by ';'.
+
+    Args:
+        results: List of race summaries from run_batch()
+        filepath: Output file path
+    """
+    with open(filepath, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        for result in results:
+            for car in result["cars"]:
+                writer.writerow([
+                    result.get("run", 0),
+                    result["seed"],
+                    result["circuit_id"] or "",
+                    car["position"],
+                    car["driver_number"],
+                    car["driver_short"],
+                    car["team"],
+                    car["starting_position"],
+                    car["laps_completed"],
+                    car["pit_stops"],
+                    "" if car["best_lap_time"] is None else f"{car['best_lap_time']:.4f}",
+                    f"{result['race_time']:.4f}",
+                    ";".join(f"{t:.4f}" for t in car["lap_times"]),
+                ])
+
+
+def write_npz(results, filepath):
+    """
+    Write batch results as a compressed NumPy archive.
+
+    Arrays (R = races, C = cars, L = most laps completed by any car):
+        seeds            (R,)       int64
+        race_time        (R,)       float64
+        driver_numbers   (C,)       int32   - column order for the per-car arrays
+        finishing_order  (R, C)     int32   - driver numbers in finishing order
+        positions        (R, C)     int32   - finishing position per driver column
+        pit_stops        (R, C)     int32
+        lap_times        (R, C, L)  float64 - NaN where a car did not complete a lap
+
+    Requires numpy (optional dependency, only needed for NPZ export).
+
+    Args:
+        results: List of race summaries from run_batch()
+        filepath: Output file path
+    """
+    import numpy as np
+
+    if not results:
+        raise ValueError("No results to write")
+
+    driver_numbers = sorted(car["driver_number"] for car in results[0]["cars"])
+    column = {number: i for i, number in enumerate(driver_numbers)}
+    num_races = len(results)
+    num_cars = len(driver_numbers)
+    max_laps = max(len(car["lap_times"]) for result in results for car in result["cars"])
+
+    finishing_order = np.zeros((num_races, num_cars), dtype=np.int32)
+    positions = np.zeros((num_races, num_cars), dtype=np.int32)
+    pit_stops = np.zeros((num_races, num_cars), dtype=np.int32)
+    lap_times = np.full((num_races, num_cars, max_laps), np.nan)
+
+    for r, result in enumerate(results):
+        for car in result["cars"]:
+            c = column[car["driver_number"]]
+            finishing_order[r, car["position"] - 1] = car["driver_number"]
+            positions[r, c] = car["position"]
+            pit_stops[r, c] = car["pit_stops"]
+            lap_times[r, c, :len(car["lap_times"])] = car["lap_times"]
+
+    np.savez_compressed(
+        filepath,
+        seeds=np.array([result["seed"] for result in results], dtype=np.int64),
+        race_time=np.array([result["race_time"] for result in results]),
+        driver_numbers=np.array(driver_numbers, dtype=np.int32),
+        finishing_order=finishing_order,
+        positions=positions,
+        pit_stops=pit_stops,
+        lap_times=lap_times,
+    )
@@ -1,16 +1,91 @@
 """
 F1 Car - Individual car with dynamic pace calculation
 Phase 1: Foundation - Fuel, Tires, Synergy, Pit Stops
+
+Cars use __slots__ (no per-instance __dict__) and serialise to a compact
+byte record (to_bytes/from_bytes) for checkpoints and worker processes.
 """
-import random
+import math
+import struct
+
 import config
-from settings.runtime_config import runtime_config
+from settings.race_settings import COMPOUNDS, RaceSettings
+from race.rng import RaceRandom, RandomStream, state_hash
+
+# Packed race state of one car (see Car.pack_state): 15 floats (NaN = None),
+# lap, laps completed, position, position change, tire age, pit stops,
+# RNG lap, RNG draws, compound index, flags
+CAR_STATE = struct.Struct("<15dIIHhHHIHBB")
+
+# Car state flags
+_STATE_PITTING = 1
+_STATE_DRS_AVAILABLE = 2
+_STATE_DRS_ACTIVE = 4
+_STATE_FINISHED = 8
+_STATE_PASSING = 16
+
+# Identity record that precedes the race state in Car.to_bytes: driver skill,
+# RNG seed, driver number, starting position, consistency, racecraft,
+# balance, cornering, traction, rookie flag, then the length of the text
+# fields (name, short name, style, team, tier, RNG key; joined by _TEXT_SEP)
+CAR_IDENTITY = struct.Struct("<dqIHbbbbb?H")
+_TEXT_SEP = "\x1f"
+
+
+class _PaceInput:
+    """Car attribute that invalidates the cached pace when assigned."""
+
+    def __init__(self, static=False):
+        self.static = static
+
+    def __set_name__(self, owner, name):
+        self.storage = "_" + name
+
+    def __get__(self, car, owner=None):
+        if car is None:
+            return self
+        return getattr(car, self.storage)
+
+    def __set__(self, car, value):
+        setattr(car, self.storage, value)
+        if self.static:
+            car._static_pace_dirty = True
+        car._pace_dirty = True
 
 
 class Car:
     """Represents a single F1 car in the race with dynamic performance."""
 
-    def __init__(self, driver_data, team_data, starting_position):
+    # Pace inputs (see _calculate_current_pace). Static ones only change with settings.
+    team_tier = _PaceInput(static=True)
+    driver_skill = _PaceInput(static=True)
+    synergy_level = _PaceInput(static=True)
+    fuel_load = _PaceInput()
+    tire_compound = _PaceInput()
+    tire_age = _PaceInput()
+    track_tire_deg_multiplier = _PaceInput()
+    current_lap_variance = _PaceInput()
+
+    __slots__ = (
+        # Driver and team
+        "driver_number", "driver_name", "driver_short", "driver_consistency", "driver_racecraft",
+        "driver_style", "is_rookie", "rng", "settings", "team", "car_balance", "car_cornering", "car_traction",
+        # Race state
+        "position", "starting_position", "position_change", "position_change_time",
+        "progress", "lap", "total_laps", "race_finished", "pit_stops", "is_pitting",
+        "pit_time_remaining", "is_drs_available", "is_drs_active", "is_passing", "current_pace",
+        # Timing
+        "lap_time", "best_lap_time", "last_lap_time", "lap_times", "lap_hashes",
+        "gap_to_leader", "gap_to_ahead", "gap_to_leader_time", "gap_to_ahead_time",
+        # Visual
+        "lateral_offset",
+        # Pace inputs (_PaceInput storage) and pace cache
+        "_team_tier", "_driver_skill", "_synergy_level", "_fuel_load", "_tire_compound",
+        "_tire_age", "_track_tire_deg_multiplier", "_current_lap_variance",
+        "_static_pace", "_cached_pace", "_pace_dirty", "_static_pace_dirty",
+    )
+
+    def __init__(self, driver_data, team_data, starting_position, rng=None, settings=None):
         """
         Initialize a car with driver and team data.
         
@@ -18,7 +93,11 @@ class Car:
             driver_data: Dict with driver info (number, name, short, skill, etc.)
             team_data: Dict with team info (name, tier, characteristics)
             starting_position: Grid position (1-20)
+            rng: RandomStream for this car (default: a stream from a fresh race seed)
+            settings: RaceSettings of the race (default: snapshot of runtime_config)
         """
+        self.settings = settings if settings is not None else RaceSettings.from_runtime_config()
+
         # Driver info
         self.driver_number = driver_data["number"]
         self.driver_name = driver_data["name"]
@@ -28,6 +107,9 @@ class Car:
         self.driver_racecraft = driver_data.get("racecraft", 3)
         self.driver_style = driver_data.get("style", "adaptive")
         self.is_rookie = driver_data.get("rookie", False)
+
+        # Random stream (all of this car's random decisions come from here)
+        self.rng = rng if rng is not None else RaceRandom().car_stream(self.driver_number)
         
         # Team info
         self.team = team_data["name"]
@@ -39,6 +121,8 @@ class Car:
         # Race state
         self.position = starting_position
         self.starting_position = starting_position
+        self.position_change = 0            # Places gained (+) or lost (-) at the last change
+        self.position_change_time = None    # Race time of the last position change
         self.progress = 0.0
         self.lap = 1
         self.total_laps = 0
@@ -64,13 +148,22 @@ class Car:
         self.is_drs_available = False  # True if within 1 second of car ahead
         self.is_drs_active = False     # True if DRS available AND in DRS zone
 
+        # Wheel-to-wheel: set once a pass on the car ahead has stuck, until it's done
+        self.is_passing = False
+
         # Dynamic speed (recalculated each frame)
         self.current_pace = config.BASE_SPEED
 
+        # Pace cache (invalidated by pace inputs; settings are frozen for the race)
+        self._static_pace = config.BASE_SPEED
+        self._cached_pace = config.BASE_SPEED
+
         # Timing
         self.lap_time = 0.0
         self.best_lap_time = None
         self.last_lap_time = None
+        self.lap_times = []  # Completed lap times in seconds (for results/export)
+        self.lap_hashes = []  # State hash at each lap completion (for reproducibility checks)
         self.gap_to_leader = 0.0
         self.gap_to_ahead = 0.0
         self.gap_to_leader_time = 0.0
@@ -79,9 +172,6 @@ class Car:
         # Visual
         self.lateral_offset = 0
 
-        # Smooth display position (for rendering)
-        self.display_x = None  # Initialized on first render
-        self.display_y = None
         self.current_lap_variance = 1.0  # Variance calculated once per lap
 
     def _choose_starting_tire(self, position):
@@ -90,7 +180,7 @@ class Car:
         if position <= 10:
             return config.TIRE_SOFT
         else:
-            return random.choice([config.TIRE_MEDIUM, config.TIRE_SOFT])
+            return self.rng.choice([config.TIRE_MEDIUM, config.TIRE_SOFT])
 
     def _calculate_synergy(self):
         """
@@ -130,14 +220,38 @@ class Car:
         Formula:
             PACE = BASE × TIER × SKILL × SYNERGY × FUEL × TIRE × VARIANCE
         
+        BASE × TIER × SKILL × SYNERGY is fixed for the race and the rest only
+        changes at lap boundaries and pit stops, so both are cached and
+        recomputed only when an input changes.
+
         Returns:
             float: Current pace (speed per frame)
         """
+        if self._static_pace_dirty:
+            self._static_pace = self._calculate_static_pace()
+            self._static_pace_dirty = False
+
+        if self._pace_dirty:
+            self._cached_pace = self._calculate_dynamic_pace(self._static_pace)
+            self._pace_dirty = False
+
+        # 8. DRS boost (if available and in DRS zone)
+        if self.is_drs_active:
+            return self._cached_pace * (1.0 + config.DRS_SPEED_BOOST)
+        return self._cached_pace
+
+    def _calculate_static_pace(self):
+        """
+        Pace factors fixed for the whole race.
+
+        Returns:
+            float: BASE × TIER × SKILL × SYNERGY
+        """
         # 1. Base pace from config
         pace = config.BASE_SPEED
         
         # 2. Team tier modifier (+4% to -5%)
-        tier_mod = runtime_config.tier_modifiers.get(self.team_tier, 1.0)
+        tier_mod = self.settings.tier_modifier(self.team_tier)
         pace *= tier_mod
         
         # 3. Driver skill (70-99 → normalized to 0.85-1.00 range)
@@ -147,33 +261,42 @@ class Car:
         pace *= skill_factor
         
         # 4. Synergy modifier
-        synergy_mod = runtime_config.synergy_modifiers.get(self.synergy_level, 1.0)
+        synergy_mod = self.settings.synergy_modifier(self.synergy_level)
         pace *= synergy_mod
-        
+
+        return pace
+
+    def _calculate_dynamic_pace(self, pace):
+        """
+        Apply the factors that change during the race (excluding DRS).
+
+        Args:
+            pace: Static pace from _calculate_static_pace()
+
+        Returns:
+            float: pace × FUEL × TIRE × VARIANCE
+        """
+        settings = self.settings
+
         # 5. Fuel load penalty (full tank = -4%, empty = 0%)
-        fuel_penalty = self.fuel_load * runtime_config.fuel_start_penalty
+        fuel_penalty = self.fuel_load * settings.fuel_start_penalty
         pace *= (1.0 - fuel_penalty)
         
         # 6. Tire degradation (with track-specific multiplier)
-        deg_rate = runtime_config.tire_deg_rates.get(self.tire_compound, 0.002)
+        deg_rate = settings.tire_deg_rates[self.tire_compound]
         # Apply track characteristics: circuits like Suzuka (1.4x) wear tires faster than Monaco (0.7x)
         tire_penalty = self.tire_age * deg_rate * self.track_tire_deg_multiplier
 
         # Check for tire cliff
-        cliff_lap = runtime_config.tire_cliff_laps.get(self.tire_compound, 20)
-        if self.tire_age >= cliff_lap:
-            tire_penalty += runtime_config.tire_cliff_penalty
+        if self.tire_age >= settings.tire_cliff_laps[self.tire_compound]:
+            tire_penalty += settings.tire_cliff_penalty
 
         # Cap tire penalty at maximum
-        pace *= (1.0 - min(tire_penalty, runtime_config.max_tire_penalty))
+        pace *= (1.0 - min(tire_penalty, settings.max_tire_penalty))
 
-        # 7. Lap-to-lap variance (calculated once per lap in update())
+        # 7. Lap-to-lap variance (calculated once per lap in complete_lap())
         pace *= self.current_lap_variance
 
-        # 8. DRS boost (if available and in DRS zone)
-        if self.is_drs_active:
-            pace *= (1.0 + config.DRS_SPEED_BOOST)
-
         return pace
 
     def should_pit(self, total_race_laps):
@@ -190,20 +313,22 @@ class Car:
         if self.is_pitting:
             return False
         
+        settings = self.settings
+
         # Don't pit on first lap or last few laps
-        if self.lap <= 1 or self.lap >= total_race_laps - runtime_config.last_laps_no_pit:
+        if self.lap <= 1 or self.lap >= total_race_laps - settings.last_laps_no_pit:
             return False
         
         # Check if past tire cliff
-        cliff_lap = runtime_config.tire_cliff_laps.get(self.tire_compound, 20)
+        cliff_lap = settings.tire_cliff_laps[self.tire_compound]
         
         # Pit if at or past cliff, with some randomness
         if self.tire_age >= cliff_lap:
-            return random.random() < runtime_config.pit_chance_after_cliff
+            return self.rng.random() < settings.pit_chance_after_cliff
         
         # Pit if very close to cliff (within window) with lower probability
-        if self.tire_age >= cliff_lap - runtime_config.pit_window_laps:
-            return random.random() < runtime_config.pit_chance_near_cliff
+        if self.tire_age >= cliff_lap - settings.pit_window_laps:
+            return self.rng.random() < settings.pit_chance_near_cliff
         
         return False
 
@@ -212,8 +337,8 @@ class Car:
         self.is_pitting = True
         
         # Calculate pit stop time with variance
-        base_time = runtime_config.pit_stop_base_time
-        variance = (random.random() * 2 - 1) * runtime_config.pit_stop_variance
+        base_time = self.settings.pit_stop_base_time
+        variance = (self.rng.random() * 2 - 1) * self.settings.pit_stop_variance
         self.pit_time_remaining = base_time + variance
         
         self.pit_stops += 1
@@ -226,18 +351,62 @@ class Car:
         # Choose new tire compound (simple strategy)
         if self.tire_compound == config.TIRE_SOFT:
             # Soft → Medium or Hard
-            self.tire_compound = random.choice([config.TIRE_MEDIUM, config.TIRE_HARD])
+            self.tire_compound = self.rng.choice([config.TIRE_MEDIUM, config.TIRE_HARD])
         elif self.tire_compound == config.TIRE_MEDIUM:
             # Medium → Hard or Soft
-            self.tire_compound = random.choice([config.TIRE_HARD, config.TIRE_SOFT])
+            self.tire_compound = self.rng.choice([config.TIRE_HARD, config.TIRE_SOFT])
         else:
             # Hard → Medium or Soft
-            self.tire_compound = random.choice([config.TIRE_MEDIUM, config.TIRE_SOFT])
+            self.tire_compound = self.rng.choice([config.TIRE_MEDIUM, config.TIRE_SOFT])
         
         # Reset tire age
         self.tire_age = 0
 
-    def update(self, track, dt=1.0, total_race_laps=20):
+    def _race_car_ahead(self, ahead, pace, track, dt):
+        """
+        Wheel-to-wheel: pace after racing the car ahead in the order.
+
+        Only the neighbour in the sorted order is looked at, so the whole
+        field costs O(N) per step. Within config.DIRTY_AIR_GAP seconds the
+        turbulent air costs pace (less for cars that corner well). Within
+        config.FOLLOW_GAP a faster car is held up at the car ahead's pace
+        until a pass sticks: the chance per second grows with racecraft over
+        the defender and DRS, and shrinks on tracks where overtaking is hard.
+
+        Args:
+            ahead: Car ahead in the order (already updated this step)
+            pace: This car's pace before the interaction
+            track: Track (for length and overtaking difficulty)
+            dt: Delta time in frames
+
+        Returns:
+            float: Pace after dirty air and blocking
+        """
+        if self.is_pitting or ahead.is_pitting:
+            return pace
+        # Gap in seconds at this car's pace (a lap or more ahead = not racing)
+        gap = (ahead.get_total_progress() - self.get_total_progress()) * track.track_length / (pace * config.FPS)
+        if gap >= config.DIRTY_AIR_GAP or gap <= 0:
+            self.is_passing = False
+            return pace
+
+        loss = config.DIRTY_AIR_PACE_LOSS * (1.0 - gap / config.DIRTY_AIR_GAP)
+        pace *= 1.0 - loss * (1.0 - config.DIRTY_AIR_CORNERING_FACTOR * self.car_cornering)
+
+        if gap >= config.FOLLOW_GAP:
+            self.is_passing = False
+        elif not self.is_passing and pace > ahead.current_pace:
+            chance = (config.OVERTAKE_CHANCE_PER_SECOND * track.get_overtaking_multiplier()
+                      * max(0.1, 1.0 + config.OVERTAKE_RACECRAFT_FACTOR * (self.driver_racecraft - ahead.driver_racecraft)))
+            if self.is_drs_active:
+                chance *= config.OVERTAKE_DRS_FACTOR
+            if self.rng.random() < chance * dt / config.FPS:
+                self.is_passing = True
+            else:
+                pace = ahead.current_pace  # Held up
+        return pace
+
+    def update(self, track, dt=1.0, total_race_laps=20, ahead=None):
         """
         Update car position with dynamic pace calculation.
 
@@ -245,11 +414,14 @@ class Car:
             track: Track object for position calculation
             dt: Delta time in frames
             total_race_laps: Total laps in the race (for pit strategy)
+            ahead: Car ahead in the order, to race wheel-to-wheel (None = drive alone)
         """
         # Get track-specific tire degradation multiplier
         # This allows circuits to have different tire wear characteristics
         # (e.g., Suzuka 1.4x harder on tires than Monaco 0.7x)
-        self.track_tire_deg_multiplier = track.get_tire_degradation_multiplier()
+        tire_deg_multiplier = track.get_tire_degradation_multiplier()
+        if tire_deg_multiplier != self.track_tire_deg_multiplier:
+            self.track_tire_deg_multiplier = tire_deg_multiplier
 
         # DRS Detection and Activation
         # DRS is available if within 1 second of car ahead (from previous frame)
@@ -272,66 +444,228 @@ class Car:
 
         # Calculate current pace (dynamic each frame)
         self.current_pace = self._calculate_current_pace()
+        if ahead is not None:
+            self.current_pace = self._race_car_ahead(ahead, self.current_pace, track, dt)
         
         # Apply pit stop penalty (reduced speed while "pitting")
         effective_pace = self.current_pace
         if self.is_pitting:
-            effective_pace *= runtime_config.pit_speed_penalty  # Slow down during pit
+            effective_pace *= self.settings.pit_speed_penalty  # Slow down during pit
         
         # Move car forward
         speed_per_frame = effective_pace / track.track_length
         self.progress += speed_per_frame * dt
+        self.lap_time += dt / config.FPS
 
-        # Handle lap completion
+        # Handle lap completion, timed to the moment the line was crossed
+        # within the step (so lap times don't snap to the tick rate)
         if self.progress >= 1.0:
             self.progress -= 1.0
-            self.lap += 1
-            self.total_laps += 1
-            self.tire_age += 1
-            
-            # Burn fuel (linear over race distance)
-            fuel_burn = 1.0 / total_race_laps
-            self.fuel_load = max(0.0, self.fuel_load - fuel_burn)
+            overshoot = self.progress / (speed_per_frame * config.FPS)
+            self.lap_time -= overshoot
+            self.complete_lap(total_race_laps)
+            self.lap_time = overshoot
 
-            # Calculate new lap variance for next lap
-            variance_factor = runtime_config.lap_variance_base * (6 - self.driver_consistency) / 5
-            self.current_lap_variance = 1.0 + (random.random() * 2 - 1) * variance_factor
+    def complete_lap(self, total_race_laps):
+        """
+        Lap bookkeeping when crossing the line: tires, fuel, variance, timing, pit call.
 
-            # Record lap time
-            if self.last_lap_time is not None:
-                if self.best_lap_time is None or self.last_lap_time < self.best_lap_time:
-                    self.best_lap_time = self.last_lap_time
+        Args:
+            total_race_laps: Total laps in the race (for fuel burn and pit strategy)
+        """
+        self.lap += 1
+        self.total_laps += 1
+        self.tire_age += 1
+        self.rng.start_lap(self.lap)
+        
+        # Burn fuel (linear over race distance)
+        fuel_burn = 1.0 / total_race_laps
+        self.fuel_load = max(0.0, self.fuel_load - fuel_burn)
 
-            self.last_lap_time = self.lap_time
-            self.lap_time = 0.0
-            
-            # Check if should pit (at start of new lap)
-            if self.should_pit(total_race_laps):
-                self.start_pit_stop()
+        # Calculate new lap variance for next lap
+        variance_factor = self.settings.lap_variance_base * (6 - self.driver_consistency) / 5
+        self.current_lap_variance = 1.0 + (self.rng.random() * 2 - 1) * variance_factor
 
-        # Increment lap time
-        self.lap_time += dt / config.FPS
+        # Record lap time
+        if self.last_lap_time is not None:
+            if self.best_lap_time is None or self.last_lap_time < self.best_lap_time:
+                self.best_lap_time = self.last_lap_time
+
+        self.last_lap_time = self.lap_time
+        self.lap_times.append(self.lap_time)
+        self.lap_time = 0.0
+        
+        # Check if should pit (at start of new lap)
+        if self.should_pit(total_race_laps):
+            self.start_pit_stop()
+
+        self.lap_hashes.append(self.get_state_hash())
+
+    def get_state_hash(self):
+        """
+        Hash of the car's race state (bit-exact floats plus RNG position).
+
+        Two runs of the same race with the same seed produce identical hashes.
+
+        Returns:
+            str: Hex digest
+        """
+        return state_hash(
+            self.driver_number, self.lap, self.progress, self.lap_time, self.last_lap_time,
+            self.fuel_load, self.tire_compound, self.tire_age, self.current_lap_variance,
+            self.is_pitting, self.pit_time_remaining, self.pit_stops, self.is_passing,
+            self.rng.lap, self.rng.draws,
+        )
+
+    def pack_state(self):
+        """
+        Pack the car's race state (not its driver/team data) into bytes.
+
+        Everything that changes during a race is included, including the
+        RNG position, so restore_state() resumes the race exactly.
+
+        Returns:
+            bytes: CAR_STATE.size bytes
+        """
+        flags = ((_STATE_PITTING if self.is_pitting else 0)
+                 | (_STATE_DRS_AVAILABLE if self.is_drs_available else 0)
+                 | (_STATE_DRS_ACTIVE if self.is_drs_active else 0)
+                 | (_STATE_FINISHED if self.race_finished else 0)
+                 | (_STATE_PASSING if self.is_passing else 0))
+        nan = math.nan
+        return CAR_STATE.pack(
+            self.progress, self.lap_time,
+            nan if self.last_lap_time is None else self.last_lap_time,
+            nan if self.best_lap_time is None else self.best_lap_time,
+            self.fuel_load, self.current_lap_variance, self.track_tire_deg_multiplier,
+            self.pit_time_remaining, self.current_pace,
+            self.gap_to_leader, self.gap_to_ahead, self.gap_to_leader_time, self.gap_to_ahead_time,
+            nan if self.position_change_time is None else self.position_change_time,
+            self.lateral_offset,
+            self.lap, self.total_laps, self.position, self.position_change, self.tire_age, self.pit_stops,
+            self.rng.lap, self.rng.draws, COMPOUNDS.index(self.tire_compound), flags,
+        )
+
+    def restore_state(self, data):
+        """
+        Restore race state written by pack_state().
+
+        Lap times and lap hashes recorded after the snapshot are dropped.
+
+        Args:
+            data: Bytes from pack_state() (or a buffer at least CAR_STATE.size long)
+        """
+        (self.progress, self.lap_time, last_lap_time, best_lap_time,
+         self.fuel_load, self.current_lap_variance, self.track_tire_deg_multiplier,
+         self.pit_time_remaining, self.current_pace,
+         self.gap_to_leader, self.gap_to_ahead, self.gap_to_leader_time, self.gap_to_ahead_time,
+         position_change_time, self.lateral_offset,
+         self.lap, self.total_laps, self.position, self.position_change, self.tire_age, self.pit_stops,
+         rng_lap, rng_draws, compound, flags) = CAR_STATE.unpack_from(data)
+
+        self.last_lap_time = None if math.isnan(last_lap_time) else last_lap_time
+        self.best_lap_time = None if math.isnan(best_lap_time) else best_lap_time
+        self.position_change_time = None if math.isnan(position_change_time) else position_change_time
+        self.tire_compound = COMPOUNDS[compound]
+        self.is_pitting = bool(flags & _STATE_PITTING)
+        self.is_drs_available = bool(flags & _STATE_DRS_AVAILABLE)
+        self.is_drs_active = bool(flags & _STATE_DRS_ACTIVE)
+        self.race_finished = bool(flags & _STATE_FINISHED)
+        self.is_passing = bool(flags & _STATE_PASSING)
+        self.rng.restore(rng_lap, rng_draws)
+
+        # Both lists gain one entry per completed lap
+        del self.lap_times[self.total_laps:]
+        del self.lap_hashes[self.total_laps:]
+
+    def to_bytes(self):
+        """
+        Serialise the whole car (identity and race state) to bytes.
+
+        Much smaller and faster than pickling the object; use from_bytes()
+        to rebuild it, e.g. in another process.
+
+        Returns:
+            bytes: Identity record, text fields, pack_state() record, then
+                   one float64 lap time and one 8-byte hash per completed lap
+        """
+        text = _TEXT_SEP.join((self.driver_name, self.driver_short, self.driver_style,
+                               self.team, self.team_tier, self.rng.key)).encode()
+        identity = CAR_IDENTITY.pack(
+            self.driver_skill, self.rng.race_seed, self.driver_number, self.starting_position,
+            self.driver_consistency, self.driver_racecraft, self.car_balance, self.car_cornering,
+            self.car_traction, self.is_rookie, len(text),
+        )
+        laps = len(self.lap_times)
+        return b"".join((
+            identity, text, self.pack_state(),
+            struct.pack(f"<{laps}d", *self.lap_times),
+            b"".join(bytes.fromhex(h) for h in self.lap_hashes),
+        ))
+
+    @classmethod
+    def from_bytes(cls, data, settings=None):
+        """
+        Rebuild a car written by to_bytes().
+
+        Args:
+            data: Bytes (or buffer) from to_bytes()
+            settings: RaceSettings of the race (default: snapshot of runtime_config)
+
+        Returns:
+            Car: Car in the same race state, drawing the same random numbers
+        """
+        (skill, seed, number, starting_position, consistency, racecraft,
+         balance, cornering, traction, rookie, text_len) = CAR_IDENTITY.unpack_from(data)
+        offset = CAR_IDENTITY.size
+        name, short, style, team, tier, key = bytes(data[offset:offset + text_len]).decode().split(_TEXT_SEP)
+        offset += text_len
+
+        # Built field by field rather than through __init__ (no grid tyre
+        # choice or RNG seeding; restore_state() sets the race state)
+        car = cls.__new__(cls)
+        car.settings = settings if settings is not None else RaceSettings.from_runtime_config()
+        car.driver_number = number
+        car.driver_name = name
+        car.driver_short = short
+        car.driver_skill = skill
+        car.driver_consistency = consistency
+        car.driver_racecraft = racecraft
+        car.driver_style = style
+        car.is_rookie = rookie
+        car.rng = RandomStream.resume(seed, key, 1, 0)
+        car.team = team
+        car.team_tier = tier
+        car.car_balance = balance
+        car.car_cornering = cornering
+        car.car_traction = traction
+        car.starting_position = starting_position
+        car.synergy_level = car._calculate_synergy()
+        car._static_pace = config.BASE_SPEED
+        car._cached_pace = config.BASE_SPEED
+        car.lap_times = []
+        car.lap_hashes = []
+        car.restore_state(data[offset:offset + CAR_STATE.size])
+        offset += CAR_STATE.size
+
+        laps = car.total_laps
+        car.lap_times = list(struct.unpack_from(f"<{laps}d", data, offset))
+        offset += 8 * laps
+        car.lap_hashes = [bytes(data[offset + 8 * i:offset + 8 * (i + 1)]).hex() for i in range(laps)]
+        return car
 
     def get_position_on_track(self, track):
         """Get x, y coordinates on track."""
         return track.get_offset_position(self.progress, self.lateral_offset)
 
     def get_display_position(self, track):
-        """Get smoothed x, y coordinates for rendering."""
-        # Get actual position
-        target_x, target_y = track.get_offset_position(self.progress, self.lateral_offset)
-        
-        # Initialize display position on first call
-        if self.display_x is None:
-            self.display_x = target_x
-            self.display_y = target_y
-            return target_x, target_y
-        
-        # Lerp toward target position
-        self.display_x += (target_x - self.display_x) * config.CAR_SMOOTHING
-        self.display_y += (target_y - self.display_y) * config.CAR_SMOOTHING
-        
-        return self.display_x, self.display_y
+        """
+        Get x, y coordinates for rendering (the car's current sim state).
+
+        The live race and replays are drawn from ReplayCar views instead,
+        which interpolate between sim ticks (see race/replay.py).
+        """
+        return track.get_offset_position(self.progress, self.lateral_offset)
 
     def get_total_progress(self):
         """Get total progress including laps."""
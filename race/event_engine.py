@@ -0,0 +1,254 @@
+"""
+Event Race Engine - Jumps from event to event instead of stepping frames
+
+Between events a car's pace is constant, so its motion is known in closed
+form. Each car's next event (lap completion, DRS zone boundary, pit exit)
+is computed directly and kept in a priority queue; the race advances by
+popping events rather than by calling Car.update every 1/60 s.
+
+A full race takes a few thousand events instead of hundreds of thousands of
+frame updates. For rendering, step() advances the queue by one timestep and
+places every car at its closed-form position.
+
+Model differences from the frame-stepped engine:
+- DRS availability is decided when a car enters a zone (like a real DRS
+  detection point), using the time gap to the car ahead at that moment.
+- Timing is continuous, so lap times are not quantised to 1/60 s.
+- No wheel-to-wheel racing: cars never hold each other up (see
+  Car._race_car_ahead), as that would need a new event whenever a car
+  closes on the one ahead.
+"""
+import heapq
+import itertools
+
+import config
+from race.race_engine import RaceEngine
+
+# Event kinds
+EVENT_LAP = "lap"
+EVENT_ZONE = "zone"
+EVENT_PIT_EXIT = "pit_exit"
+
+
+class EventRaceEngine(RaceEngine):
+    """RaceEngine backend driven by a priority queue of per-car events"""
+
+    def __init__(self, waypoints=None, decorations=None, circuit_id=None, field_size=None, seed=None,
+                 settings=None, tick_rate=None):
+        """
+        Initialize the event engine.
+
+        Args:
+            waypoints: Custom waypoints (overrides circuit_id if both provided)
+            decorations: Track decorations (kerbs, gravel)
+            circuit_id: ID of real F1 circuit to load
+            field_size: Number of cars (default: one per driver in TEAMS_DATA)
+            seed: Race seed (default: drawn from the global random module)
+            settings: RaceSettings for this race (default: snapshot of runtime_config)
+            tick_rate: Simulation steps per second of race time (default: 60 Hz)
+        """
+        super().__init__(waypoints=waypoints, decorations=decorations,
+                         circuit_id=circuit_id, field_size=field_size, seed=seed, settings=settings,
+                         tick_rate=tick_rate)
+
+        # DRS zones as non-wrapping [start, end] intervals (wrapping zones are split at the line)
+        self.drs_intervals = []
+        for zone in self.track.get_drs_zones():
+            if zone["start"] <= zone["end"]:
+                self.drs_intervals.append((zone["start"], zone["end"]))
+            else:
+                self.drs_intervals.append((zone["start"], 1.0))
+                self.drs_intervals.append((0.0, zone["end"]))
+        self.drs_intervals.sort()
+        self.zone_boundaries = sorted(set(b for interval in self.drs_intervals for b in interval))
+
+        # Event queue: (time, seq, car index, version, kind). Entries whose version
+        # no longer matches the car's version are stale and skipped.
+        self.event_time = 0.0      # Simulated time the queue has been advanced to (seconds)
+        self.finish_time = None    # Time the leader took the chequered flag
+        self._queue = []
+        self._seq = itertools.count()
+        self._car_list = list(self.cars)
+        n = len(self._car_list)
+        self._ref_time = [0.0] * n    # Time at which car.progress was last set
+        self._rate = [0.0] * n        # Progress per second since _ref_time
+        self._lap_start = [0.0] * n   # Time the current lap started
+        self._version = [0] * n
+        self._in_zone = [False] * n
+
+        tire_mult = self.track.get_tire_degradation_multiplier()
+        for i, car in enumerate(self._car_list):
+            car.track_tire_deg_multiplier = tire_mult
+            self._in_zone[i] = self._zone_ahead(car.progress)
+            self._reschedule(i)
+
+    # =========================================================================
+    # CLOSED-FORM MOTION
+    # =========================================================================
+
+    def _zone_ahead(self, progress):
+        """Check if the track just ahead of progress is in a DRS zone (start <= p < end)."""
+        for start, end in self.drs_intervals:
+            if start <= progress < end:
+                return True
+        return False
+
+    def _progress_at(self, i, t):
+        """Closed-form progress of car i at time t (within its current lap)."""
+        return self._car_list[i].progress + self._rate[i] * (t - self._ref_time[i])
+
+    def _advance_car(self, i, t):
+        """Move car i's reference point to time t."""
+        car = self._car_list[i]
+        car.progress = self._progress_at(i, t)
+        car.lap_time = t - self._lap_start[i]
+        self._ref_time[i] = t
+
+    def _reschedule(self, i):
+        """Recompute car i's pace and push its next event."""
+        car = self._car_list[i]
+        t = self._ref_time[i]
+
+        car.current_pace = car._calculate_current_pace()
+        effective = car.current_pace
+        if car.is_pitting:
+            effective *= self.settings.pit_speed_penalty
+        self._rate[i] = effective / self.track.track_length * config.FPS
+
+        # Next event: lap line, next DRS zone boundary, or pit exit (whichever is first)
+        kind = EVENT_LAP
+        target = 1.0
+        for boundary in self.zone_boundaries:
+            if boundary > car.progress:
+                if boundary < target:
+                    kind, target = EVENT_ZONE, boundary
+                break
+        event_time = t + (target - car.progress) / self._rate[i]
+
+        if car.is_pitting and t + car.pit_time_remaining < event_time:
+            kind, event_time = EVENT_PIT_EXIT, t + car.pit_time_remaining
+
+        self._version[i] += 1
+        heapq.heappush(self._queue, (event_time, next(self._seq), i, self._version[i], kind))
+
+    # =========================================================================
+    # EVENT HANDLING
+    # =========================================================================
+
+    def _process_until(self, t_end):
+        """Pop and handle all events up to time t_end (stops at the chequered flag)."""
+        queue = self._queue
+        while queue and queue[0][0] <= t_end and self.finish_time is None:
+            t, _, i, version, kind = heapq.heappop(queue)
+            if version != self._version[i]:
+                continue
+            self._handle_event(i, t, kind)
+
+    def _handle_event(self, i, t, kind):
+        """Apply one event to car i at time t and schedule its next one."""
+        car = self._car_list[i]
+        self.event_time = t
+        before = (car.lap, car.is_pitting, car.is_drs_active) if self.events else None
+
+        if car.is_pitting:
+            car.pit_time_remaining -= t - self._ref_time[i]
+        self._advance_car(i, t)
+
+        if kind == EVENT_LAP:
+            car.progress = 0.0
+            car.complete_lap(self.total_laps)
+            self._lap_start[i] = t
+            if car.lap > self.total_laps:
+                self.finish_time = t
+        elif kind == EVENT_ZONE:
+            # Land exactly on the boundary (avoid float drift re-triggering it)
+            for boundary in self.zone_boundaries:
+                if abs(boundary - car.progress) < 1e-9:
+                    car.progress = boundary
+                    break
+        elif kind == EVENT_PIT_EXIT:
+            car._complete_pit_stop()
+
+        # DRS: decided on entering a zone, cleared on leaving it
+        in_zone = self._zone_ahead(car.progress)
+        if in_zone and not self._in_zone[i]:
+            car.is_drs_available = self._drs_available(i, t)
+            car.is_drs_active = car.is_drs_available
+        elif not in_zone:
+            car.is_drs_active = False
+        self._in_zone[i] = in_zone
+
+        if before is not None:
+            if before != (car.lap, car.is_pitting, car.is_drs_active):
+                self._publish_car_events(car, t, *before)
+            if self.finish_time == t:
+                self._publish_finish(t, car)
+
+        self._reschedule(i)
+
+    def _drs_available(self, i, t):
+        """DRS detection: within config.DRS_DETECTION_TIME of the car ahead at time t."""
+        car = self._car_list[i]
+        if car.lap < config.DRS_ENABLED_FROM_LAP:
+            return False
+        total = car.lap - 1 + car.progress
+        closest = None
+        for j, other in enumerate(self._car_list):
+            if j == i:
+                continue
+            diff = (other.lap - 1 + self._progress_at(j, t)) - total
+            if diff > 0 and (closest is None or diff < closest):
+                closest = diff
+        if closest is None:
+            return False  # Leading the race
+        return closest / self._rate[i] <= config.DRS_DETECTION_TIME
+
+    # =========================================================================
+    # ENGINE API
+    # =========================================================================
+
+    def _sync_to(self, t):
+        """Place every car at time t and refresh order and gaps."""
+        for i, car in enumerate(self._car_list):
+            if car.is_pitting:
+                car.pit_time_remaining -= t - self._ref_time[i]
+            self._advance_car(i, t)
+        self.race_time = t
+        self._update_order_and_gaps()
+
+    def step(self):
+        """Advance the event queue by one timestep and place cars for rendering"""
+        t_end = self.race_time + self.timestep / config.FPS
+        self._process_until(t_end)
+        self._sync_to(self.finish_time if self.finish_time is not None else t_end)
+
+    def run_to_finish(self):
+        """Process events until the chequered flag (no per-frame stepping)"""
+        self._process_until(float("inf"))
+        self._sync_to(self.finish_time)
+
+    def capture_state(self):
+        """Car state plus the per-car timing the event queue is built from."""
+        return (super().capture_state(), self.finish_time, list(self._lap_start), list(self._in_zone))
+
+    def restore_state(self, state):
+        """
+        Restore state and rebuild the event queue from it.
+
+        Next events are rescheduled from the restored time rather than from
+        each car's last event, so a resumed race can differ from the
+        original in the last bits of its timing.
+        """
+        car_state, self.finish_time, lap_start, in_zone = state
+        super().restore_state(car_state)
+        self._lap_start = list(lap_start)
+        self._in_zone = list(in_zone)
+        self.event_time = self.race_time
+        self._ref_time = [self.race_time] * len(self._car_list)
+        self._queue = []
+        for i in range(len(self._car_list)):
+            self._reschedule(i)
+
+    def is_race_finished(self):
+        """Check if the race is finished"""
+        return self.finish_time is not None and self.race_time >= self.finish_time
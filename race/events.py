@@ -0,0 +1,214 @@
+"""
+Race Events - Publish/subscribe bus for things that happen in a race
+
+The engine publishes an event when something happens, so consumers don't
+have to poll the whole field every frame to find out what changed:
+
+- LAP_COMPLETED: a car crossed the line (lap_time, position)
+- OVERTAKE: a pass was held (see RaceEngine._confirm_overtakes)
+- PIT_IN / PIT_OUT: a car started / finished a pit stop (tire_compound)
+- DRS_ACTIVATED: a car opened DRS in a zone
+- FASTEST_LAP: a lap beat every earlier lap in the race (lap_time)
+- RACE_FINISHED: the leader took the chequered flag (winner, a driver number)
+
+Subscribers pick the kinds (and optionally the drivers) they want. A
+callback is called as the event is published; an EventQueue collects
+events so a consumer can drain them in a batch when it is ready (e.g. once
+per rendered frame). With no subscribers publishing costs nothing: engines
+check `if engine.events:` before looking for events at all, and
+`engine.events.wants(kind)` before work only one kind needs (such as the
+fastest-lap check).
+
+Events are published on the thread running the engine. The live race runs
+on the sim thread, so UI code subscribes to RaceView.events, which replays
+each snapshot's events on the render thread (see race/sim_thread.py).
+"""
+import collections
+
+# Event kinds
+LAP_COMPLETED = "lap_completed"
+OVERTAKE = "overtake"
+PIT_IN = "pit_in"
+PIT_OUT = "pit_out"
+DRS_ACTIVATED = "drs_activated"
+FASTEST_LAP = "fastest_lap"
+RACE_FINISHED = "race_finished"
+
+EVENT_KINDS = (LAP_COMPLETED, OVERTAKE, PIT_IN, PIT_OUT, DRS_ACTIVATED, FASTEST_LAP, RACE_FINISHED)
+
+
+class RaceEvent:
+    """One thing that happened in a race (never changed after publishing)"""
+
+    __slots__ = ("kind", "race_time", "driver_number", "lap", "data")
+
+    def __init__(self, kind, race_time, driver_number=None, lap=None, data=None):
+        """
+        Args:
+            kind: One of EVENT_KINDS
+            race_time: Race time it happened
+            driver_number: Car it happened to (None for race-wide events)
+            lap: Lap it happened on (for LAP_COMPLETED, the lap just completed)
+            data: Dict of kind-specific values (see the module docstring)
+        """
+        self.kind = kind
+        self.race_time = race_time
+        self.driver_number = driver_number
+        self.lap = lap
+        self.data = data if data is not None else {}
+
+    def __repr__(self):
+        return f"RaceEvent({self.kind}, t={self.race_time:.3f}, car={self.driver_number}, lap={self.lap})"
+
+
+class Subscription:
+    """A subscriber's callback and filter (returned by EventBus.subscribe)"""
+
+    __slots__ = ("bus", "callback", "kinds", "drivers")
+
+    def __init__(self, bus, callback, kinds, drivers):
+        self.bus = bus
+        self.callback = callback
+        self.kinds = kinds
+        self.drivers = drivers
+
+    def cancel(self):
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+
+class EventQueue:
+    """
+    Batching subscriber: collects events until drained.
+
+    Appending and draining are safe from different threads.
+    """
+
+    def __init__(self, maxlen=None):
+        """
+        Args:
+            maxlen: Keep only the latest maxlen events (None = keep all until drained)
+        """
+        self._events = collections.deque(maxlen=maxlen)
+        self.subscription = None
+
+    def __call__(self, event):
+        self._events.append(event)
+
+    def __len__(self):
+        return len(self._events)
+
+    def drain(self):
+        """
+        Take every event collected so far.
+
+        Returns:
+            list: Events in the order they were published
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.popleft())
+            except IndexError:
+                return events
+
+    def cancel(self):
+        """Stop collecting (events already collected can still be drained)."""
+        if self.subscription is not None:
+            self.subscription.cancel()
+            self.subscription = None
+
+
+class EventBus:
+    """Delivers published race events to matching subscribers"""
+
+    def __init__(self):
+        self._subscribers = {kind: [] for kind in EVENT_KINDS}
+        self._count = 0
+
+    def __bool__(self):
+        """True if anyone is subscribed (engines skip event detection otherwise)."""
+        return self._count > 0
+
+    def subscribe(self, callback, kinds=None, drivers=None):
+        """
+        Call callback(event) for every matching event.
+
+        Args:
+            callback: Function taking a RaceEvent
+            kinds: Event kinds to receive (default: all of EVENT_KINDS)
+            drivers: Driver numbers to receive events for (default: all;
+                     race-wide events are always delivered)
+
+        Returns:
+            Subscription: Handle for unsubscribe() / cancel()
+        """
+        kinds = EVENT_KINDS if kinds is None else tuple(kinds)
+        for kind in kinds:
+            if kind not in self._subscribers:
+                raise ValueError(f"Unknown race event kind: {kind}")
+        subscription = Subscription(self, callback, kinds,
+                                    frozenset(drivers) if drivers is not None else None)
+        for kind in kinds:
+            self._subscribers[kind].append(subscription)
+        self._count += 1
+        return subscription
+
+    def collect(self, kinds=None, drivers=None, maxlen=None):
+        """
+        Subscribe an EventQueue, for consumers that handle events in batches.
+
+        Args:
+            kinds: Event kinds to collect (default: all)
+            drivers: Driver numbers to collect events for (default: all)
+            maxlen: Keep only the latest maxlen undrained events (default: all)
+
+        Returns:
+            EventQueue: Drain it whenever convenient; cancel() to unsubscribe
+        """
+        queue = EventQueue(maxlen)
+        queue.subscription = self.subscribe(queue, kinds, drivers)
+        return queue
+
+    def unsubscribe(self, subscription):
+        """Remove a subscription (no-op if it was already removed)."""
+        removed = False
+        for kind in subscription.kinds:
+            subscribers = self._subscribers[kind]
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+                removed = True
+        if removed:
+            self._count -= 1
+
+    def wants(self, kind):
+        """True if anyone is subscribed to this kind of event."""
+        return bool(self._subscribers[kind])
+
+    def publish(self, kind, race_time, driver_number=None, lap=None, **data):
+        """
+        Deliver an event to its subscribers.
+
+        Args:
+            kind: One of EVENT_KINDS
+            race_time: Race time it happened
+            driver_number: Car it happened to (None for race-wide events)
+            lap: Lap it happened on
+            **data: Kind-specific values
+
+        Returns:
+            RaceEvent: The event, or None if nobody was subscribed to its kind
+        """
+        subscribers = self._subscribers[kind]
+        if not subscribers:
+            return None
+        event = RaceEvent(kind, race_time, driver_number, lap, data)
+        self.deliver(event)
+        return event
+
+    def deliver(self, event):
+        """Deliver an already built event (e.g. one forwarded from another bus)."""
+        for subscription in list(self._subscribers[event.kind]):
+            drivers = subscription.drivers
+            if drivers is None or event.driver_number is None or event.driver_number in drivers:
+                subscription.callback(event)
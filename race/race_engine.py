@@ -1,17 +1,24 @@
 """
 Race Engine - Manages the race simulation with all 20 cars
 """
-import random
+import time
+
 from race.track import Track
-from race.car import Car
+from race.car import CAR_STATE, Car
+from race.checkpoint import CheckpointStore
+from race.events import (EventBus, LAP_COMPLETED, OVERTAKE, PIT_IN, PIT_OUT, DRS_ACTIVATED,
+                         FASTEST_LAP, RACE_FINISHED)
+from race.rng import RaceRandom, state_hash
+from race.timing import TimingLoops
 from data.teams import TEAMS_DATA
 import config
-from settings.runtime_config import runtime_config
+from settings.race_settings import RaceSettings
 
 class RaceEngine:
     """Manages the entire race simulation"""
 
-    def __init__(self, waypoints=None, decorations=None, circuit_id=None):
+    def __init__(self, waypoints=None, decorations=None, circuit_id=None, field_size=None, seed=None,
+                 settings=None, tick_rate=None):
         """
         Initialize race engine with track.
 
@@ -19,21 +26,56 @@ class RaceEngine:
             waypoints: Custom waypoints (overrides circuit_id if both provided)
             decorations: Track decorations (kerbs, gravel)
             circuit_id: ID of real F1 circuit to load (e.g., "monaco", "silverstone")
+            field_size: Number of cars (default: one per driver in TEAMS_DATA).
+                        Larger fields repeat the grid with renumbered drivers.
+            seed: Race seed; the same seed reproduces the race exactly
+                  (default: drawn from the global random module)
+            settings: RaceSettings for this race (default: snapshot of
+                      runtime_config taken now; later edits don't affect it)
+            tick_rate: Simulation steps per second of race time
+                       (default: config.SIM_TIMESTEP, i.e. 60 Hz)
         """
+        self.settings = settings if settings is not None else RaceSettings.from_runtime_config()
+        self.random = RaceRandom(seed)
+        self.seed = self.random.seed
         self.track = Track(waypoints=waypoints, decorations=decorations, circuit_id=circuit_id)
         self.cars = []
         self.race_started = False
         self.race_time = 0.0
-        self.total_laps = runtime_config.race_laps  # Use runtime config
+        self.total_laps = self.settings.race_laps
 
         # Simulation speed control
-        self.simulation_speed = runtime_config.simulation_speed
+        self.simulation_speed = self.settings.simulation_speed
+
+        # Fixed-timestep accumulator (in frames of race time not yet simulated)
+        self.timestep = config.FPS / tick_rate if tick_rate else config.SIM_TIMESTEP
+        self.max_substeps = config.SIM_MAX_SUBSTEPS_PER_FRAME
+        self.frame_accumulator = 0.0
+
+        # Overtakes in race order (appended by _update_order once held for
+        # config.OVERTAKE_HOLD_TIME; pending ones are keyed by (car, passed car))
+        self.overtakes = []
+        self._pending_overtakes = {}
+
+        # Race events for subscribers (see race/events.py); engines only look
+        # for events while someone is subscribed
+        self.events = EventBus()
+
+        # Optional ReplayRecorder, fed after every step (see race/replay.py)
+        self.recorder = None
+
+        # Lap checkpoints for rewind (taken by update(), see race/checkpoint.py)
+        self.checkpoints = CheckpointStore()
 
         # Initialize cars
-        self._initialize_cars()
+        self._initialize_cars(field_size)
+        self._grid = list(self.cars)  # Fixed (grid) order used for packed state
 
-    def _initialize_cars(self):
-        """Create all 20 cars from team data with full performance stats."""
+        # Time gaps come from crossing times at the track's timing loops (see race/timing.py)
+        self.timing = TimingLoops(self.track.get_timing_loops(), self._grid)
+
+    def _initialize_cars(self, field_size=None):
+        """Create all cars from team data with full performance stats."""
         position = 1
 
         # Build entries with full team data
@@ -54,12 +96,17 @@ class RaceEngine:
                     "team": team_info,
                 })
 
+        # Extend (or trim) to the requested field size
+        if field_size is not None:
+            all_entries = _extend_entries(all_entries, field_size)
+
         # Shuffle for random grid
-        random.shuffle(all_entries)
+        self.random.stream("grid").shuffle(all_entries)
 
         # Create cars with full data - F1 Grid Formation
         for entry in all_entries:
-            car = Car(entry["driver"], entry["team"], position)
+            car = Car(entry["driver"], entry["team"], position,
+                      rng=self.random.car_stream(entry["driver"]["number"]), settings=self.settings)
             
             # F1 Grid Formation: 2-wide rows with proper spacing
             # Row number (0-9 for 20 cars, 2 cars per row)
@@ -90,38 +137,190 @@ class RaceEngine:
         next_idx = (current_idx + 1) % len(options)
         self.simulation_speed = options[next_idx]
 
-    def update(self):
-        """Update all cars and race state"""
-        # Apply simulation speed to delta time
-        dt = self.simulation_speed
-        
-        # Update each car with race context
+    def update(self, elapsed_frames=1.0):
+        """
+        Advance the race by elapsed real time, in fixed timesteps.
+
+        Elapsed time is scaled by the simulation speed and added to an
+        accumulator, which is drained in fixed steps of self.timestep. At
+        most self.max_substeps steps run per call; anything left over is
+        carried to the next call (see is_behind()). Because every step is
+        identical, a race run at 20x is bit-identical to the same race at 1x.
+
+        Args:
+            elapsed_frames: Real time since the last call, in 60 FPS frames
+
+        Returns:
+            int: Number of fixed steps simulated
+        """
+        self.frame_accumulator += elapsed_frames * self.simulation_speed
+
+        steps = 0
+        while self.frame_accumulator >= self.timestep and steps < self.max_substeps:
+            if self.is_race_finished():
+                self.frame_accumulator = 0.0
+                break
+            self._advance()
+            self.frame_accumulator -= self.timestep
+            steps += 1
+
+        # Drop time we can never catch up on (e.g. after a stall)
+        self.frame_accumulator = min(self.frame_accumulator, config.SIM_MAX_BACKLOG_FRAMES)
+        return steps
+
+    def is_behind(self):
+        """Check if simulated time is lagging real time (substep budget exhausted)"""
+        return self.frame_accumulator >= self.timestep and not self.is_race_finished()
+
+    def step(self):
+        """Advance all cars and race state by one fixed timestep"""
+        dt = self.timestep
+        # Each car races the one ahead of it in the order (already moved this step)
+        wheel_to_wheel = self.settings.wheel_to_wheel
+        ahead = None
+
+        if not self.events:
+            # Update each car with race context
+            for car in self.cars:
+                car.update(self.track, dt=dt, total_race_laps=self.total_laps, ahead=ahead)
+                if wheel_to_wheel:
+                    ahead = car
+            self.race_time += dt / config.FPS
+            self._update_order_and_gaps()
+            return
+
+        # Same step, noting what changed for each car for the event bus
+        finished = self.is_race_finished()
+        changed = []
         for car in self.cars:
-            car.update(self.track, dt=dt, total_race_laps=self.total_laps)
+            before = (car.lap, car.is_pitting, car.is_drs_active)
+            car.update(self.track, dt=dt, total_race_laps=self.total_laps, ahead=ahead)
+            if wheel_to_wheel:
+                ahead = car
+            if before != (car.lap, car.is_pitting, car.is_drs_active):
+                changed.append((car, before))
+        self.race_time += dt / config.FPS
+        self._update_order_and_gaps()
+
+        for car, (lap, was_pitting, had_drs) in changed:
+            self._publish_car_events(car, self.race_time, lap, was_pitting, had_drs)
+        if not finished and self.is_race_finished():
+            self._publish_finish(self.race_time, self.cars[0])
+
+    def _advance(self):
+        """One fixed step of a live race: checkpoint, step, record to the replay"""
+        self.checkpoints.update(self)
+        self.step()
+        if self.recorder is not None:
+            self.recorder.record(self)
+
+    def fast_forward(self, target_lap=None, time_budget=None):
+        """
+        Simulate without rendering until the leader starts target_lap.
+
+        Unlike run_to_finish(), checkpoints and the replay recording carry on
+        as in a live race, so the race continues normally from where
+        fast-forward stops. With a time_budget the call returns after about
+        that many seconds, so the UI can spread the work over its frames.
+
+        Args:
+            target_lap: Lap to stop at (None = the chequered flag)
+            time_budget: Wall-clock seconds to spend in this call (None = no limit)
+
+        Returns:
+            bool: True once the target lap (or the flag) has been reached
+        """
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        while not self.is_race_finished() and (target_lap is None or self.leader_lap() < target_lap):
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            self._advance()
+        self.frame_accumulator = 0.0  # Don't make up for the real time spent here
+        return True
+
+    def run_to_finish(self):
+        """Simulate (without rendering) until the chequered flag"""
+        while not self.is_race_finished():
+            self.step()
+
+    def _update_order(self):
+        """
+        Restore position order with an insertion pass over the nearly sorted field.
+
+        Between two steps only a few adjacent cars swap, so this is O(N) per
+        step instead of a full sort. Every swap is a pass; passes that are
+        held for config.OVERTAKE_HOLD_TIME are logged in self.overtakes (a
+        pass undone straight away, e.g. two cars trading DRS, is dropped).
+        Ties keep their current order (like a stable sort).
+        """
+        cars = self.cars
+        totals = [car.get_total_progress() for car in cars]
+
+        for i in range(1, len(cars)):
+            car = cars[i]
+            total = totals[i]
+            j = i
+            while j > 0 and totals[j - 1] < total:
+                self._record_overtake(car, cars[j - 1], j)
+                cars[j] = cars[j - 1]
+                totals[j] = totals[j - 1]
+                j -= 1
+            cars[j] = car
+            totals[j] = total
+
+        if self._pending_overtakes:
+            self._confirm_overtakes()
+
+    def _record_overtake(self, car, passed, position):
+        """
+        Record a pass (pending until held, see _confirm_overtakes).
+
+        Args:
+            car: Car that moved up
+            passed: Car that was passed
+            position: Position the overtaking car moved into
+        """
+        # Passing straight back cancels the pending pass instead
+        if self._pending_overtakes.pop((passed.driver_number, car.driver_number), None) is not None:
+            return
+        self._pending_overtakes[(car.driver_number, passed.driver_number)] = {
+            "race_time": self.race_time,
+            "lap": car.lap,
+            "progress": car.progress,  # Where on the lap it happened
+            "position": position,
+            "driver_number": car.driver_number,
+            "driver_short": car.driver_short,
+            "passed_number": passed.driver_number,
+            "passed_short": passed.driver_short,
+        }
 
-        # Sort cars by race position (total progress)
-        self.cars.sort(key=lambda c: c.get_total_progress(), reverse=True)
+    def _confirm_overtakes(self):
+        """Log pending passes that have been held for config.OVERTAKE_HOLD_TIME."""
+        pending = self._pending_overtakes
+        for key, overtake in list(pending.items()):
+            if self.race_time - overtake["race_time"] >= config.OVERTAKE_HOLD_TIME:
+                self.overtakes.append(overtake)
+                del pending[key]
+                if self.events:
+                    self.events.publish(OVERTAKE, overtake["race_time"], overtake["driver_number"],
+                                        overtake["lap"], passed_number=overtake["passed_number"],
+                                        position=overtake["position"], progress=overtake["progress"])
+
+    def _update_order_and_gaps(self):
+        """Reorder cars by race position and update positions, gaps and lateral offsets"""
+        self._update_order()
 
         # Update positions and gaps
         leader = self.cars[0]
         leader_progress = leader.get_total_progress()
 
-        # Calculate seconds_per_lap from ACTUAL lap data (not theoretical)
-        # This accounts for all speed modifiers (tier, skill, fuel, etc.)
-        if leader.last_lap_time and leader.last_lap_time > 0:
-            # Use leader's actual completed lap time
-            seconds_per_lap = leader.last_lap_time
-        elif leader.lap_time > 0 and leader.progress > 0.1:
-            # Estimate from current lap progress (at least 10% into lap)
-            seconds_per_lap = leader.lap_time / leader.progress
-        else:
-            # Fallback to theoretical only at very start of race
-            speed_prog_per_sec = (config.BASE_SPEED / self.track.track_length) * config.FPS
-            seconds_per_lap = 1.0 / speed_prog_per_sec if speed_prog_per_sec > 0 else 4.0
-
         for i, car in enumerate(self.cars):
-            # Update position
-            car.position = i + 1
+            # Update position (remembering the change for the timing tower arrows)
+            if car.position != i + 1:
+                car.position_change = car.position - (i + 1)
+                car.position_change_time = self.race_time
+                car.position = i + 1
+                car.is_passing = False  # Pass done (or lost the place); race the new car ahead
 
             # Calculate gaps (in progress units)
             car.gap_to_leader = leader_progress - car.get_total_progress()
@@ -132,10 +331,6 @@ class RaceEngine:
             else:
                 car.gap_to_ahead = 0.0
 
-            # Convert progress gaps to time gaps
-            car.gap_to_leader_time = car.gap_to_leader * seconds_per_lap
-            car.gap_to_ahead_time = car.gap_to_ahead * seconds_per_lap
-
             # Set lateral offset for cars close together
             if i > 0:
                 ahead = self.cars[i - 1]
@@ -149,8 +344,126 @@ class RaceEngine:
             else:
                 car.lateral_offset = 0
 
-        # Update race time (scaled by simulation speed)
-        self.race_time += self.simulation_speed / config.FPS
+        # Time gaps change only when a car crosses a timing loop
+        self.timing.update(self.race_time, self._grid, self.cars)
+
+    # =========================================================================
+    # EVENTS
+    # =========================================================================
+
+    def _publish_car_events(self, car, race_time, lap, was_pitting, had_drs):
+        """
+        Publish what happened to a car during a step (see race/events.py).
+
+        Args:
+            car: Car after the step
+            race_time: Race time to give the events
+            lap, was_pitting, had_drs: The car's lap, is_pitting and is_drs_active before the step
+        """
+        events = self.events
+        number = car.driver_number
+        if car.lap != lap:
+            events.publish(LAP_COMPLETED, race_time, number, lap,
+                           lap_time=car.last_lap_time, position=car.position)
+            if events.wants(FASTEST_LAP) and self._is_fastest_lap(car):
+                events.publish(FASTEST_LAP, race_time, number, lap, lap_time=car.last_lap_time)
+        if car.is_pitting and not was_pitting:
+            events.publish(PIT_IN, race_time, number, car.lap,
+                           tire_compound=car.tire_compound, pit_stops=car.pit_stops)
+        elif was_pitting and not car.is_pitting:
+            events.publish(PIT_OUT, race_time, number, car.lap, tire_compound=car.tire_compound)
+        if car.is_drs_active and not had_drs:
+            events.publish(DRS_ACTIVATED, race_time, number, car.lap, progress=car.progress)
+
+    def _is_fastest_lap(self, car):
+        """
+        Check if a car's just completed lap is the fastest of the race so far.
+
+        Worked out from lap times already on the cars (best_lap_time lags one
+        lap behind last_lap_time), so it holds after a rewind too.
+        """
+        lap_time = car.last_lap_time
+        if car.best_lap_time is not None and car.best_lap_time <= lap_time:
+            return False
+        for other in self._grid:
+            if other is car:
+                continue
+            for best in (other.best_lap_time, other.last_lap_time):
+                if best is not None and best <= lap_time:
+                    return False
+        return True
+
+    def _publish_finish(self, race_time, winner):
+        """Publish RACE_FINISHED for the car that took the flag."""
+        self.events.publish(RACE_FINISHED, race_time, lap=self.total_laps,
+                            winner=winner.driver_number)
+
+    # =========================================================================
+    # CHECKPOINTS
+    # =========================================================================
+
+    def leader_lap(self):
+        """Lap the leader is on"""
+        return self.cars[0].lap
+
+    def capture_state(self):
+        """
+        Pack the race state for a checkpoint (see restore_state).
+
+        Returns:
+            tuple: (race_time, overtake count, pending overtakes, packed cars, timing loop state)
+        """
+        return (self.race_time, len(self.overtakes), dict(self._pending_overtakes),
+                b"".join(car.pack_state() for car in self._grid), self.timing.capture_state())
+
+    def restore_state(self, state):
+        """Restore race state from capture_state() (later overtakes are dropped)."""
+        self.race_time, num_overtakes, pending, car_data, timing = state
+        view = memoryview(car_data)
+        for i, car in enumerate(self._grid):
+            car.restore_state(view[i * CAR_STATE.size:])
+        self.cars.sort(key=lambda c: c.position)
+        del self.overtakes[num_overtakes:]
+        self._pending_overtakes = dict(pending)
+        self.timing.restore_state(timing)
+
+    def rewind_to_lap(self, lap):
+        """
+        Rewind the race to the start of a lap and continue from there.
+
+        Checkpoints after it are discarded and the replay recording (if any)
+        is cut back to the same moment.
+
+        Args:
+            lap: Lap to rewind to (the latest checkpoint at or before it is used)
+
+        Returns:
+            int: Lap rewound to, or None if there is no checkpoint that early
+        """
+        laps = [l for l in self.checkpoints.laps() if l <= lap]
+        if not laps:
+            return None
+        checkpoint = self.checkpoints.get(laps[-1])
+        self.restore_state(checkpoint.state)
+        self.frame_accumulator = 0.0
+        self.checkpoints.discard_after(checkpoint.lap)
+        if self.recorder is not None and checkpoint.replay_frame is not None:
+            self.recorder.truncate(checkpoint.replay_frame)
+        return checkpoint.lap
+
+    def get_state_hash(self):
+        """
+        Hash of the whole field's state (see Car.get_state_hash).
+
+        Compare the hash from two runs with the same seed to check that they
+        are bit-identical; compare per-lap hashes (car.lap_hashes) to find
+        the first lap where they diverge.
+
+        Returns:
+            str: Hex digest
+        """
+        cars = sorted(self.cars, key=lambda c: c.driver_number)
+        return state_hash(self.race_time, *(car.get_state_hash() for car in cars))
 
     def get_cars_by_position(self):
         """Get cars sorted by current position"""
@@ -178,3 +491,49 @@ class RaceEngine:
     def start_race(self):
         """Start the race"""
         self.race_started = True
+
+
+def _extend_entries(entries, field_size):
+    """
+    Repeat grid entries until the field has field_size cars.
+
+    Copies get unique numbers and short names (e.g., VER -> VE2) so they can
+    be told apart on the timing screen.
+    """
+    extended = list(entries[:field_size])
+    copy_index = 1
+    while len(extended) < field_size:
+        copy_index += 1
+        for entry in entries:
+            if len(extended) >= field_size:
+                break
+            driver = dict(entry["driver"])
+            driver["number"] = driver["number"] + 100 * (copy_index - 1)
+            suffix = str(copy_index)
+            driver["short"] = driver["short"][:3 - len(suffix)] + suffix
+            extended.append({"driver": driver, "team": entry["team"]})
+    return extended
+
+
+def create_race_engine(backend=None, **kwargs):
+    """
+    Create a race engine for the given simulation backend.
+
+    Args:
+        backend: One of config.ENGINE_BACKENDS (default: config.ENGINE_BACKEND)
+        **kwargs: Passed to the engine constructor (waypoints, circuit_id, ...)
+
+    Returns:
+        RaceEngine: Engine instance (all backends share the RaceEngine API)
+    """
+    backend = backend or config.ENGINE_BACKEND
+    if backend == "python":
+        return RaceEngine(**kwargs)
+    if backend == "vector":
+        # Imported lazily: the vector backend needs numpy
+        from race.vector_engine import VectorRaceEngine
+        return VectorRaceEngine(**kwargs)
+    if backend == "event":
+        from race.event_engine import EventRaceEngine
+        return EventRaceEngine(**kwargs)
+    raise ValueError(f"Unknown engine backend: {backend}")
@@ -0,0 +1,595 @@
+"""
+Race Replay - Compact binary recording of a race and a player for it
+
+File layout (little-endian):
+    header   magic, format version, car count, frames per block,
+             metadata length, footer offset (0 while still recording)
+    metadata JSON: track, cars, race length, record interval (padded to 8 bytes)
+    blocks   fixed-size blocks of REPLAY_BLOCK_FRAMES frames, stored column by
+             column (all race times, then all progress values, ...)
+    footer   JSON: frame count, lap keyframes, final results
+
+Every block has the same size, so frame i is found with arithmetic alone and
+read straight out of a memory-mapped file. The lap keyframes give the first
+frame of each lap, so a reader can jump to any lap instantly.
+
+A 20-car frame takes 388 bytes, roughly 18 MB for a 20-lap race at 20 Hz.
+"""
+import array
+import json
+import math
+import mmap
+import os
+import struct
+import time
+
+import config
+from race.car import COMPOUNDS, Car
+from race.track import Track
+
+MAGIC = b"F1RPLY"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<6sHIIIQ")  # magic, version, num_cars, block_frames, meta_len, footer_offset
+
+# Per-car state flags
+FLAG_PITTING = 1
+FLAG_DRS_ACTIVE = 2
+FLAG_DRS_AVAILABLE = 4
+
+# Columns: (name, array typecode, one value per car?)
+# Ordered by item size so every column stays aligned within a block.
+COLUMNS = [
+    ("race_time", "d", False),
+    ("progress", "f", True),
+    ("gap_to_leader_time", "f", True),   # Timing-loop gaps, as the live tower showed them
+    ("gap_to_ahead_time", "f", True),
+    ("lap", "H", True),
+    ("lateral_offset", "b", True),
+    ("compound", "B", True),
+    ("flags", "B", True),
+    ("tire_age", "B", True),
+    ("pit_stops", "B", True),
+]
+
+
+def _column_layout(num_cars, block_frames):
+    """Byte offset of each column within a block, and the block size."""
+    offsets = {}
+    offset = 0
+    for name, code, per_car in COLUMNS:
+        offsets[name] = offset
+        count = block_frames * (num_cars if per_car else 1)
+        offset += count * array.array(code).itemsize
+    return offsets, offset
+
+
+def _pad8(length):
+    """Round length up to a multiple of 8."""
+    return (length + 7) // 8 * 8
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+def new_replay_path(directory, now=None):
+    """
+    Path for a new recording, named after the time it started.
+
+    Restarting within the same second adds a suffix instead of overwriting
+    the previous file.
+
+    Args:
+        directory: Replay directory (must exist)
+        now: Time to name it after (default: time.time())
+
+    Returns:
+        str: Path that doesn't exist yet
+    """
+    stamp = time.strftime("race_%Y%m%d_%H%M%S", time.localtime(now))
+    path = os.path.join(directory, f"{stamp}.f1r")
+    suffix = 1
+    while os.path.exists(path):
+        suffix += 1
+        path = os.path.join(directory, f"{stamp}_{suffix}.f1r")
+    return path
+
+
+def prune_replays(directory, max_files=None, keep=None):
+    """
+    Remove the oldest recordings beyond max_files.
+
+    Args:
+        directory: Replay directory
+        max_files: Recordings kept (default: config.REPLAY_MAX_FILES)
+        keep: Path never removed (e.g. the recording in progress)
+    """
+    max_files = max_files or config.REPLAY_MAX_FILES
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".f1r")]
+    if len(paths) <= max_files:
+        return
+    paths.sort(key=os.path.getmtime)
+    excess = len(paths) - max_files
+    for path in paths:
+        if excess == 0:
+            break
+        if keep is not None and os.path.abspath(path) == os.path.abspath(keep):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        excess -= 1
+
+
+class ReplayRecorder:
+    """Appends engine state to a replay file while a race runs"""
+
+    def __init__(self, filepath, engine, record_interval=None, block_frames=None):
+        """
+        Create the replay file and write its header and metadata.
+
+        Args:
+            filepath: Output path (overwritten)
+            engine: RaceEngine to record (attach with engine.recorder = recorder)
+            record_interval: Record every Nth simulation step (default: config.REPLAY_RECORD_INTERVAL)
+            block_frames: Frames per block (default: config.REPLAY_BLOCK_FRAMES)
+        """
+        self.filepath = filepath
+        self.record_interval = record_interval or config.REPLAY_RECORD_INTERVAL
+        self.block_frames = block_frames or config.REPLAY_BLOCK_FRAMES
+
+        # Column order is the starting grid (fixed for the whole file)
+        self._cars = sorted(engine.cars, key=lambda c: c.starting_position)
+        self.num_cars = len(self._cars)
+        self.frame_count = 0
+        self.keyframes = {}  # lap -> first frame on which the leader was on that lap
+        self._leader_lap = 0
+        self._steps = 0
+        self._buffers = {name: array.array(code) for name, code, _ in COLUMNS}
+
+        track = engine.track
+        meta = {
+            "version": FORMAT_VERSION,
+            "seed": getattr(engine, "seed", None),
+            "circuit_id": track.circuit_id,
+            "waypoints": None if track.circuit_data else [list(p) for p in track.waypoints],
+            "decorations": None if track.circuit_data else track.decorations,
+            "total_laps": engine.total_laps,
+            "record_interval": self.record_interval,
+            "timestep": engine.timestep,
+            "cars": [{
+                "driver_number": car.driver_number,
+                "driver_name": car.driver_name,
+                "driver_short": car.driver_short,
+                "team": car.team,
+                "team_tier": car.team_tier,
+                "starting_position": car.starting_position,
+            } for car in self._cars],
+        }
+        meta_bytes = json.dumps(meta).encode()
+        meta_bytes += b" " * (_pad8(len(meta_bytes)) - len(meta_bytes))
+
+        self._file = open(filepath, "w+b")  # Readable too, for truncate()
+        self._meta_len = len(meta_bytes)
+        self._data_offset = HEADER.size + self._meta_len
+        self._column_offsets, self._block_size = _column_layout(self.num_cars, self.block_frames)
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.num_cars, self.block_frames, self._meta_len, 0))
+        self._file.write(meta_bytes)
+
+    def record(self, engine):
+        """Called after every simulation step; keeps every record_interval-th one."""
+        if self._file is None:
+            return
+        self._steps += 1
+        if self._steps % self.record_interval == 0:
+            self.record_frame(engine)
+
+    def record_frame(self, engine):
+        """Append the engine's current state as one frame."""
+        engine.cars  # Lets array-backed engines refresh their Car objects
+        buffers = self._buffers
+        buffers["race_time"].append(engine.race_time)
+
+        leader_lap = 0
+        for car in self._cars:
+            buffers["progress"].append(car.progress)
+            buffers["gap_to_leader_time"].append(car.gap_to_leader_time)
+            buffers["gap_to_ahead_time"].append(car.gap_to_ahead_time)
+            buffers["lap"].append(min(car.lap, 0xFFFF))
+            buffers["lateral_offset"].append(max(-128, min(127, int(car.lateral_offset))))
+            buffers["compound"].append(COMPOUNDS.index(car.tire_compound))
+            flags = 0
+            if car.is_pitting:
+                flags |= FLAG_PITTING
+            if car.is_drs_active:
+                flags |= FLAG_DRS_ACTIVE
+            if car.is_drs_available:
+                flags |= FLAG_DRS_AVAILABLE
+            buffers["flags"].append(flags)
+            buffers["tire_age"].append(min(car.tire_age, 255))
+            buffers["pit_stops"].append(min(car.pit_stops, 255))
+            leader_lap = max(leader_lap, car.lap)
+
+        if leader_lap > self._leader_lap:
+            self._leader_lap = leader_lap
+            self.keyframes[leader_lap] = self.frame_count
+
+        self.frame_count += 1
+        if self.frame_count % self.block_frames == 0:
+            self._write_block()
+
+    def _write_block(self):
+        """Write buffered frames as one block (zero-padded to full size)."""
+        for name, code, per_car in COLUMNS:
+            buffer = self._buffers[name]
+            full = self.block_frames * (self.num_cars if per_car else 1)
+            if len(buffer) < full:
+                buffer.extend([0] * (full - len(buffer)))
+            self._file.write(buffer.tobytes())
+            self._buffers[name] = array.array(code)
+
+    def truncate(self, frame_count):
+        """
+        Drop every frame from frame_count on (used when the race is rewound).
+
+        Args:
+            frame_count: Number of frames to keep
+        """
+        if self._file is None or frame_count >= self.frame_count:
+            return
+        block, keep = divmod(frame_count, self.block_frames)
+        if block < self.frame_count // self.block_frames:
+            # The block is already on disk: read it back into the buffers
+            offset = self._data_offset + block * self._block_size
+            self._file.seek(offset)
+            data = self._file.read(self._block_size)
+            self._file.seek(offset)
+            self._file.truncate()
+            for name, code, per_car in COLUMNS:
+                column = array.array(code)
+                count = keep * (self.num_cars if per_car else 1)
+                start = self._column_offsets[name]
+                column.frombytes(data[start:start + count * column.itemsize])
+                self._buffers[name] = column
+        else:
+            for name, _, per_car in COLUMNS:
+                del self._buffers[name][keep * (self.num_cars if per_car else 1):]
+
+        self.frame_count = frame_count
+        self.keyframes = {lap: frame for lap, frame in self.keyframes.items() if frame < frame_count}
+        self._leader_lap = max(self.keyframes, default=0)
+
+    def close(self):
+        """Flush the last block, write the footer and finalise the header."""
+        if self._file is None:
+            return
+        if self.frame_count % self.block_frames:
+            self._write_block()
+
+        footer = {
+            "frame_count": self.frame_count,
+            "keyframes": {str(lap): frame for lap, frame in self.keyframes.items()},
+            "results": {str(car.driver_number): {
+                "best_lap_time": car.best_lap_time,
+                "last_lap_time": car.last_lap_time,
+            } for car in self._cars},
+        }
+        footer_offset = self._file.tell()
+        self._file.write(json.dumps(footer).encode())
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, self.num_cars, self.block_frames,
+                                     self._meta_len, footer_offset))
+        self._file.close()
+        self._file = None
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+class ReplayReader:
+    """Random access to a finished replay file through a memory map"""
+
+    def __init__(self, filepath):
+        """
+        Open a replay file.
+
+        Args:
+            filepath: Path of a replay written by ReplayRecorder
+
+        Raises:
+            ValueError: If the file is not a replay or was not closed properly
+        """
+        self.filepath = filepath
+        self._file = open(filepath, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty replay file: {filepath}")
+        self._view = memoryview(self._mmap)
+
+        magic, version, num_cars, block_frames, meta_len, footer_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a replay file: {filepath}")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported replay version {version}: {filepath}")
+        if footer_offset == 0:
+            self.close()
+            raise ValueError(f"Replay was not finished: {filepath}")
+
+        self.num_cars = num_cars
+        self.block_frames = block_frames
+        self.meta = json.loads(bytes(self._view[HEADER.size:HEADER.size + meta_len]))
+        self.footer = json.loads(bytes(self._view[footer_offset:]))
+        self.frame_count = self.footer["frame_count"]
+        self.keyframes = {int(lap): frame for lap, frame in self.footer["keyframes"].items()}
+
+        self._data_offset = HEADER.size + meta_len
+        self._column_offsets, self._block_size = _column_layout(num_cars, block_frames)
+        self._itemsize = {name: array.array(code).itemsize for name, code, _ in COLUMNS}
+        self._codes = {name: code for name, code, _ in COLUMNS}
+        self._per_car = {name: per_car for name, _, per_car in COLUMNS}
+
+    def read(self, name, frame):
+        """
+        Read one column of one frame.
+
+        Args:
+            name: Column name (see COLUMNS)
+            frame: Frame index (0 to frame_count - 1)
+
+        Returns:
+            Value for per-race columns, list of per-car values (grid order) otherwise
+        """
+        block, k = divmod(frame, self.block_frames)
+        count = self.num_cars if self._per_car[name] else 1
+        size = self._itemsize[name] * count
+        start = self._data_offset + block * self._block_size + self._column_offsets[name] + k * size
+        values = self._view[start:start + size].cast(self._codes[name]).tolist()
+        return values if self._per_car[name] else values[0]
+
+    def read_frame(self, frame):
+        """Read every column of a frame as a dict."""
+        if not 0 <= frame < self.frame_count:
+            raise IndexError(f"Frame {frame} out of range (0-{self.frame_count - 1})")
+        return {name: self.read(name, frame) for name, _, _ in COLUMNS}
+
+    def frame_for_lap(self, lap):
+        """First frame on which the leader was on the given lap (clamped to the race)."""
+        if not self.keyframes:
+            return 0
+        laps = sorted(self.keyframes)
+        lap = max(laps[0], min(lap, laps[-1]))
+        return self.keyframes[lap]
+
+    def close(self):
+        """Release the memory map and file."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+
+# =============================================================================
+# PLAYBACK
+# =============================================================================
+
+class ReplayCar:
+    """
+    Car as seen in a replay or the live race view (display and timing attributes only).
+
+    Its owner places it between two sim states each rendered frame (see
+    interpolate()), so motion is smooth whatever the tick and frame rates.
+    """
+
+    # Same timing helpers as a live car
+    get_total_progress = Car.get_total_progress
+    get_status = Car.get_status
+
+    def __init__(self, info, starting_position):
+        self.driver_number = info["driver_number"]
+        self.driver_name = info["driver_name"]
+        self.driver_short = info["driver_short"]
+        self.team = info["team"]
+        self.team_tier = info["team_tier"]
+        self.starting_position = starting_position
+        self.position = starting_position
+        self.position_change = 0
+        self.position_change_time = None
+        self.progress = 0.0
+        self.lap = 1
+        self.lateral_offset = 0
+        self.tire_compound = config.TIRE_SOFT
+        self.tire_age = 0
+        self.pit_stops = 0
+        self.is_pitting = False
+        self.is_drs_active = False
+        self.is_drs_available = False
+        self.gap_to_leader = 0.0
+        self.gap_to_ahead = 0.0
+        self.gap_to_leader_time = 0.0
+        self.gap_to_ahead_time = 0.0
+        self.best_lap_time = None
+        self.last_lap_time = None
+        self.display_progress = 0.0
+        self.display_offset = 0.0
+
+    def interpolate(self, total_from, offset_from, total_to, offset_to, alpha):
+        """
+        Place the car alpha (0-1) of the way between two sim states, for drawing.
+
+        Args:
+            total_from, total_to: Total progress (laps + fraction) of the two states
+            offset_from, offset_to: Lateral offsets of the two states
+            alpha: 0 = first state, 1 = second state
+        """
+        total = total_from + (total_to - total_from) * alpha
+        self.display_progress = total - math.floor(total)
+        self.display_offset = offset_from + (offset_to - offset_from) * alpha
+
+    def get_display_position(self, track):
+        """Get interpolated x, y coordinates for rendering."""
+        return track.get_offset_position(self.display_progress, self.display_offset)
+
+
+class ReplayPlayer:
+    """
+    Plays a replay through the RaceEngine API.
+
+    TrackRenderer, TimingScreen and ResultsScreen draw from a player exactly
+    as they do from a live engine.
+    """
+
+    def __init__(self, filepath):
+        """
+        Args:
+            filepath: Replay file to play
+        """
+        self.reader = ReplayReader(filepath)
+        meta = self.reader.meta
+        waypoints = [tuple(p) for p in meta["waypoints"]] if meta["waypoints"] else None
+        self.track = Track(waypoints=waypoints, decorations=meta["decorations"], circuit_id=meta["circuit_id"])
+        self.seed = meta["seed"]
+        self.total_laps = meta["total_laps"]
+        self.race_started = True
+        self.race_time = 0.0
+        self.simulation_speed = 1
+        self.frames_per_record = meta["record_interval"] * meta["timestep"]
+
+        self._car_list = [ReplayCar(info, info["starting_position"]) for info in meta["cars"]]
+        for car in self._car_list:
+            result = self.reader.footer["results"].get(str(car.driver_number), {})
+            car.best_lap_time = result.get("best_lap_time")
+            car.last_lap_time = result.get("last_lap_time")
+        self.cars = sorted(self._car_list, key=lambda c: c.starting_position)
+
+        self.playhead = 0.0  # Current frame (fractional while playing)
+        self.frame = None
+        self._next_frame = None  # (total progress, lateral offset) per car in the frame after self.frame
+        self.seek_frame(0)
+
+    # =========================================================================
+    # PLAYBACK CONTROL
+    # =========================================================================
+
+    def update(self, elapsed_frames=1.0):
+        """Advance playback by real elapsed time (in frames) x playback speed."""
+        last = self.reader.frame_count - 1
+        self.playhead = min(last, self.playhead + elapsed_frames * self.simulation_speed / self.frames_per_record)
+        if int(self.playhead) != self.frame:
+            self._load_frame(int(self.playhead))
+        if self.frame is not None:
+            self._place_cars(self.playhead - self.frame)
+
+    def seek_frame(self, frame):
+        """Jump to a frame (clears position-change arrows)."""
+        frame = max(0, min(frame, self.reader.frame_count - 1))
+        self.playhead = float(frame)
+        self._load_frame(frame, jump=True)
+        self._place_cars(0.0)
+
+    def _place_cars(self, alpha):
+        """Draw cars alpha of the way from the loaded frame to the next one."""
+        for i, car in enumerate(self._car_list):
+            total, offset = car.get_total_progress(), car.lateral_offset
+            if self._next_frame is not None:
+                next_total, next_offset = self._next_frame[i]
+                car.interpolate(total, offset, next_total, next_offset, alpha)
+            else:
+                car.interpolate(total, offset, total, offset, 0.0)
+
+    def seek_lap(self, lap):
+        """Jump to the start of the leader's lap."""
+        self.seek_frame(self.reader.frame_for_lap(lap))
+
+    def current_lap(self):
+        """Leader's lap at the playhead."""
+        return self.cars[0].lap if self.cars else 1
+
+    def _load_frame(self, frame, jump=False):
+        """Set every car from a recorded frame and rebuild order and gaps."""
+        if self.reader.frame_count == 0:
+            return
+        self.frame = frame
+        data = self.reader.read_frame(frame)
+        self.race_time = data["race_time"]
+        for i, car in enumerate(self._car_list):
+            car.progress = data["progress"][i]
+            car.gap_to_leader_time = data["gap_to_leader_time"][i]
+            car.gap_to_ahead_time = data["gap_to_ahead_time"][i]
+            car.lap = data["lap"][i]
+            car.lateral_offset = data["lateral_offset"][i]
+            car.tire_compound = COMPOUNDS[data["compound"][i]]
+            car.tire_age = data["tire_age"][i]
+            car.pit_stops = data["pit_stops"][i]
+            flags = data["flags"][i]
+            car.is_pitting = bool(flags & FLAG_PITTING)
+            car.is_drs_active = bool(flags & FLAG_DRS_ACTIVE)
+            car.is_drs_available = bool(flags & FLAG_DRS_AVAILABLE)
+
+        # Order and progress gaps (recomputed; time gaps are recorded)
+        self.cars.sort(key=lambda c: c.get_total_progress(), reverse=True)
+        leader_progress = self.cars[0].get_total_progress()
+        for i, car in enumerate(self.cars):
+            if jump:
+                car.position_change = 0
+                car.position_change_time = None
+            elif car.position != i + 1:
+                car.position_change = car.position - (i + 1)
+                car.position_change_time = self.race_time
+            car.position = i + 1
+            car.gap_to_leader = leader_progress - car.get_total_progress()
+            car.gap_to_ahead = self.cars[i - 1].get_total_progress() - car.get_total_progress() if i > 0 else 0.0
+
+        # Where each car is one recorded frame later (for interpolation)
+        self._next_frame = None
+        if frame + 1 < self.reader.frame_count:
+            progress = self.reader.read("progress", frame + 1)
+            laps = self.reader.read("lap", frame + 1)
+            offsets = self.reader.read("lateral_offset", frame + 1)
+            self._next_frame = [(lap - 1 + p, offset) for p, lap, offset in zip(progress, laps, offsets)]
+
+    # =========================================================================
+    # ENGINE API
+    # =========================================================================
+
+    def set_simulation_speed(self, speed):
+        """Set playback speed multiplier"""
+        if speed in config.SIMULATION_SPEED_OPTIONS:
+            self.simulation_speed = speed
+
+    def is_behind(self):
+        """Playback never falls behind (frames are read, not simulated)"""
+        return False
+
+    def start_race(self):
+        """Replays are always running"""
+
+    def get_cars_by_position(self):
+        """Get cars sorted by current position"""
+        return self.cars
+
+    def get_leader(self):
+        """Get the race leader"""
+        return self.cars[0] if self.cars else None
+
+    def is_race_finished(self):
+        """Check if playback reached the end of the recording"""
+        return self.frame is not None and self.frame >= self.reader.frame_count - 1
+
+    def get_race_status(self):
+        """Get current replay status string"""
+        if self.is_race_finished():
+            return "REPLAY - FINISHED"
+        return f"REPLAY - LAP {min(self.current_lap(), self.total_laps)}/{self.total_laps}"
+
+    def close(self):
+        """Close the replay file."""
+        self.reader.close()
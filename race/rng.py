@@ -0,0 +1,138 @@
+"""
+Race RNG - Seedable, independent random streams per car
+
+Every random draw in a race comes from a stream derived from the race seed,
+so a race is reproducible from its seed alone and races with different
+seeds (e.g. batch workers using seed + i) never share a stream.
+
+Streams are counter-based: the numbers a car uses on lap L depend only on
+(race seed, car, L), are pre-drawn in a batch when the lap starts, and do
+not depend on how many numbers were used on earlier laps. Any lap can be
+regenerated on its own (for checkpoints and replays).
+"""
+import hashlib
+import random
+import struct
+
+LAP_BATCH_SIZE = 8  # Numbers pre-drawn per lap (a lap normally uses 1-4)
+
+
+def derive_seed(*parts):
+    """
+    Derive a 64-bit seed from the given parts (stable across processes and runs).
+
+    Args:
+        *parts: Values identifying the stream (race seed, stream name, lap, ...)
+
+    Returns:
+        int: 64-bit seed
+    """
+    data = "/".join(str(part) for part in parts).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def state_hash(*values):
+    """
+    Hash simulation state values (floats hashed bit-exactly).
+
+    Returns:
+        str: 16-character hex digest
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for value in values:
+        if isinstance(value, float):
+            h.update(struct.pack("<d", value))
+        else:
+            h.update(str(value).encode())
+        h.update(b"|")
+    return h.hexdigest()
+
+
+class RandomStream:
+    """Per-lap random stream (random/choice/shuffle, like the random module)"""
+
+    __slots__ = ("race_seed", "key", "lap", "draws", "_generator", "_batch")
+
+    def __init__(self, race_seed, key, lap=1):
+        """
+        Args:
+            race_seed: Seed of the race
+            key: Stream identity, unique within the race (e.g. "car:44")
+            lap: Lap to start on
+        """
+        self.race_seed = race_seed
+        self.key = key
+        self.start_lap(lap)
+
+    @classmethod
+    def resume(cls, race_seed, key, lap, draws):
+        """Stream positioned at (lap, draws), e.g. from a checkpoint (nothing is drawn yet)."""
+        stream = cls.__new__(cls)
+        stream.race_seed = race_seed
+        stream.key = key
+        stream.restore(lap, draws)
+        return stream
+
+    def start_lap(self, lap):
+        """Switch to the numbers for a lap (pre-draws the lap's batch)."""
+        self.lap = lap
+        self.draws = 0  # Numbers used so far this lap
+        self._fill()
+
+    def restore(self, lap, draws):
+        """Return to a saved (lap, draws) position; the lap's numbers are regenerated on the next draw."""
+        self.lap = lap
+        self.draws = draws
+        self._generator = None
+        self._batch = None
+
+    def _fill(self):
+        """Regenerate the current lap's numbers up to (at least) the current draw."""
+        self._generator = random.Random(derive_seed(self.race_seed, self.key, self.lap))
+        self._batch = [self._generator.random() for _ in range(LAP_BATCH_SIZE)]
+        while len(self._batch) < self.draws:
+            self._batch.extend(self._generator.random() for _ in range(LAP_BATCH_SIZE))
+
+    def __reduce__(self):
+        """Pickle as (seed, key, lap, draws); the numbers are regenerated after loading."""
+        return RandomStream.resume, (self.race_seed, self.key, self.lap, self.draws)
+
+    def random(self):
+        """Next float in [0, 1)."""
+        if self._batch is None:
+            self._fill()
+        if self.draws >= len(self._batch):
+            self._batch.extend(self._generator.random() for _ in range(LAP_BATCH_SIZE))
+        value = self._batch[self.draws]
+        self.draws += 1
+        return value
+
+    def choice(self, seq):
+        """Pick a random element of a non-empty sequence."""
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, items):
+        """Shuffle a list in place (Fisher-Yates)."""
+        for i in range(len(items) - 1, 0, -1):
+            j = int(self.random() * (i + 1))
+            items[i], items[j] = items[j], items[i]
+
+
+class RaceRandom:
+    """Source of all random streams for one race"""
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Race seed (None = draw one from the global random module,
+                  so random.seed() still reproduces races)
+        """
+        self.seed = seed if seed is not None else random.getrandbits(63)
+
+    def stream(self, name):
+        """Stream for a race-level decision (e.g. "grid")."""
+        return RandomStream(self.seed, name)
+
+    def car_stream(self, driver_number):
+        """Independent stream for one car (keyed by driver number, not grid slot)."""
+        return RandomStream(self.seed, f"car:{driver_number}")
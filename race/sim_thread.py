@@ -0,0 +1,383 @@
+"""
+Simulation Thread - Runs a race engine on its own thread and clock
+
+The UI never touches the engine while the race runs. The sim thread advances
+it in real time (times the simulation speed) and publishes an immutable
+RaceSnapshot after every batch of steps into a SnapshotBuffer. The render
+path reads the latest snapshot through a RaceView, which has the engine API
+that TrackRenderer and TimingScreen draw from (like ReplayPlayer does for
+replays).
+
+Controls (start, pause, speed, rewind, fast-forward) are messages to the sim
+thread, so a slow render frame no longer slows the simulation and a burst of
+simulation no longer drops rendered frames.
+
+Race events (race/events.py) are collected on the sim thread and delivered
+again on the render thread through RaceView.events, once the snapshot they
+happened by is on screen. The engine's bus is only subscribed to the kinds
+RaceView.events has subscribers for, so a race nobody listens to skips event
+detection altogether.
+"""
+import queue
+import threading
+import time
+
+import config
+from race.events import EVENT_KINDS, EventBus, EventQueue
+from race.replay import ReplayCar
+
+# Per-car values in a snapshot, in this order (everything the race view draws)
+SNAPSHOT_CAR_FIELDS = (
+    "position", "position_change", "position_change_time",
+    "progress", "lap", "lateral_offset",
+    "tire_compound", "tire_age", "pit_stops", "is_pitting",
+    "is_drs_active", "is_drs_available",
+    "gap_to_leader", "gap_to_ahead", "gap_to_leader_time", "gap_to_ahead_time",
+    "best_lap_time", "last_lap_time",
+)
+
+
+class RaceSnapshot:
+    """
+    Race state at one moment, as published by the sim thread.
+
+    Built once and never changed: per-car values are tuples in grid order
+    (see SNAPSHOT_CAR_FIELDS), so the render thread can keep reading a
+    snapshot after a newer one has been published.
+    """
+
+    __slots__ = ("sequence", "published_at", "race_time", "race_started", "finished", "status",
+                 "simulation_speed", "jumps", "cars")
+
+    def __init__(self, sequence, engine, grid, jumps):
+        """
+        Args:
+            sequence: Publication number (increases by one per snapshot)
+            engine: Engine to copy from (on the sim thread)
+            grid: Engine's cars in grid order
+            jumps: Number of rewinds / fast-forwards so far (the view snaps cars on a change)
+        """
+        engine.cars  # Lets array-backed engines refresh their Car objects
+        self.sequence = sequence
+        self.published_at = time.perf_counter()
+        self.race_time = engine.race_time
+        self.race_started = engine.race_started
+        self.finished = bool(engine.is_race_finished())
+        self.status = engine.get_race_status()
+        self.simulation_speed = engine.simulation_speed
+        self.jumps = jumps
+        self.cars = tuple(
+            tuple(getattr(car, name) for name in SNAPSHOT_CAR_FIELDS) for car in grid
+        )
+
+
+class SnapshotBuffer:
+    """
+    Double buffer between the sim thread (writer) and the render thread (reader).
+
+    The writer fills the back slot and swaps it to the front; the reader
+    always gets the front slot. Snapshots are immutable, so a swap is all
+    the synchronisation needed.
+    """
+
+    def __init__(self):
+        self._slots = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot):
+        """Make snapshot the latest one (sim thread)."""
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        with self._lock:
+            self._front = back
+
+    def latest(self):
+        """Most recently published snapshot, or None (render thread)."""
+        with self._lock:
+            return self._slots[self._front]
+
+
+class RaceView:
+    """
+    Engine API over the latest snapshot, for the render path.
+
+    Cars are ReplayCar objects. Each frame they are drawn part of the way
+    from the previous snapshot to the latest one, by how much real time has
+    passed since it was published, so the sim can tick well below the
+    display rate (config.SIM_TICK_RATE) and still move smoothly.
+    """
+
+    def __init__(self, engine, buffer, events=None, watch_events=None):
+        """
+        Args:
+            engine: Engine being simulated (only static data is read: track, cars, laps)
+            buffer: SnapshotBuffer the sim thread publishes to
+            events: EventQueue of the engine's events (SimulationThread.events),
+                    re-delivered to subscribers of self.events on this thread
+            watch_events: Called with the event kinds self.events has subscribers for
+                          whenever they change (SimulationThread.watch_events)
+        """
+        self.track = engine.track
+        self.total_laps = engine.total_laps
+        self.buffer = buffer
+        self.snapshot = None
+        self.events = EventBus()
+        self._event_source = events
+        self._watch_events = watch_events
+        self._watching = ()      # Event kinds the engine is subscribed to
+        self._pending_events = []  # Collected but not yet on screen
+        self._from = []           # (total progress, lateral offset) per car in the previous snapshot
+        self._from_time = 0.0     # Race time of the previous snapshot
+
+        grid = sorted(engine.cars, key=lambda c: c.starting_position)
+        self._car_list = [ReplayCar({
+            "driver_number": car.driver_number,
+            "driver_name": car.driver_name,
+            "driver_short": car.driver_short,
+            "team": car.team,
+            "team_tier": car.team_tier,
+        }, car.starting_position) for car in grid]
+        self.cars = list(self._car_list)
+
+    def refresh(self):
+        """
+        Take the latest snapshot and place the cars for this frame.
+
+        Called once per rendered frame (cheap when nothing new was published).
+
+        Returns:
+            bool: True if a new snapshot was applied
+        """
+        snapshot = self.buffer.latest()
+        applied = snapshot is not None and snapshot is not self.snapshot
+        if self._watch_events is not None:
+            kinds = tuple(kind for kind in EVENT_KINDS if self.events.wants(kind))
+            if kinds != self._watching:
+                self._watching = kinds
+                self._watch_events(kinds)
+        if self._event_source is not None:
+            self._pending_events.extend(self._event_source.drain())
+        if applied:
+            self._apply(snapshot)
+        if self.snapshot is not None:
+            self._place_cars(time.perf_counter())
+            if self._pending_events:
+                self._deliver_events()
+        return applied
+
+    def _deliver_events(self):
+        """Deliver collected events up to the snapshot's race time (later ones wait)."""
+        race_time = self.snapshot.race_time
+        pending = self._pending_events
+        ready = 0
+        while ready < len(pending) and pending[ready].race_time <= race_time:
+            ready += 1
+        self._pending_events = pending[ready:]
+        for event in pending[:ready]:
+            self.events.deliver(event)
+
+    def _apply(self, snapshot):
+        """Copy a new snapshot into the cars, remembering where they were."""
+        previous = self.snapshot
+        self._from = [(car.get_total_progress(), car.lateral_offset) for car in self._car_list]
+        self._from_time = previous.race_time if previous is not None else snapshot.race_time
+        self.snapshot = snapshot
+
+        for car, values in zip(self._car_list, snapshot.cars):
+            for name, value in zip(SNAPSHOT_CAR_FIELDS, values):
+                setattr(car, name, value)
+        self.cars.sort(key=lambda c: c.position)
+
+        if previous is None or snapshot.jumps != previous.jumps:
+            # Rewind / fast-forward: jump to the new positions instead of gliding
+            self._from = [(car.get_total_progress(), car.lateral_offset) for car in self._car_list]
+            if previous is not None and snapshot.race_time < previous.race_time:
+                # Rewound: events after this point will happen again
+                self._pending_events = [event for event in self._pending_events
+                                        if event.race_time <= snapshot.race_time]
+
+    def _place_cars(self, now):
+        """Interpolate from the previous snapshot to the latest by real time elapsed."""
+        snapshot = self.snapshot
+        interval = (snapshot.race_time - self._from_time) / max(snapshot.simulation_speed, 1e-9)
+        alpha = 1.0 if interval <= 0 else min(1.0, (now - snapshot.published_at) / interval)
+        for car, (total, offset) in zip(self._car_list, self._from):
+            car.interpolate(total, offset, car.get_total_progress(), car.lateral_offset, alpha)
+
+    @property
+    def race_time(self):
+        return self.snapshot.race_time if self.snapshot else 0.0
+
+    @property
+    def race_started(self):
+        return self.snapshot.race_started if self.snapshot else False
+
+    @property
+    def simulation_speed(self):
+        return self.snapshot.simulation_speed if self.snapshot else config.SIMULATION_SPEED_DEFAULT
+
+    def get_cars_by_position(self):
+        """Get cars sorted by current position"""
+        return self.cars
+
+    def get_leader(self):
+        """Get the race leader"""
+        return self.cars[0] if self.cars else None
+
+    def leader_lap(self):
+        """Lap the leader is on"""
+        return self.cars[0].lap if self.cars else 1
+
+    def is_race_finished(self):
+        """Check if the race is finished (as of the latest snapshot)"""
+        return self.snapshot is not None and self.snapshot.finished
+
+    def is_behind(self):
+        """The view never falls behind (the sim thread keeps its own time)"""
+        return False
+
+    def get_race_status(self):
+        """Get current race status string"""
+        return self.snapshot.status if self.snapshot else "READY"
+
+
+class SimulationThread(threading.Thread):
+    """Advances a race engine in real time on its own thread"""
+
+    def __init__(self, engine):
+        """
+        Args:
+            engine: Engine to run (not touched by other threads until stop() returns)
+        """
+        super().__init__(name="race-simulation", daemon=True)
+        self.engine = engine
+        self.buffer = SnapshotBuffer()
+        self.events = EventQueue()  # Drained by RaceView; subscribed while the view has subscribers
+        self.fast_forwarding = False  # Set when fast_forward() is sent, cleared by the sim thread
+        self._grid = sorted(engine.cars, key=lambda c: c.starting_position)
+        self._commands = queue.Queue()
+        self._paused = False
+        self._fast_forward = False  # Sim thread's own flag (fast_forwarding is for the UI)
+        self._fast_forward_target = None
+        self._sequence = 0
+        self._jumps = 0
+        self._running = True
+        self._publish()
+
+    # =========================================================================
+    # MESSAGES (called from the UI thread)
+    # =========================================================================
+
+    def start_race(self):
+        """Start the race"""
+        self._commands.put(("start_race", ()))
+
+    def set_simulation_speed(self, speed):
+        """Set simulation speed multiplier"""
+        self._commands.put(("set_simulation_speed", (speed,)))
+
+    def set_paused(self, paused):
+        """Pause or resume the simulation"""
+        self._commands.put(("_set_paused", (paused,)))
+
+    def rewind_to_lap(self, lap):
+        """Rewind to the start of a lap (see RaceEngine.rewind_to_lap)"""
+        self._commands.put(("_rewind", (lap,)))
+
+    def fast_forward(self, target_lap=None):
+        """Simulate flat out until the leader starts target_lap (None = the flag)"""
+        self.fast_forwarding = True
+        self._commands.put(("_start_fast_forward", (target_lap,)))
+
+    def cancel_fast_forward(self):
+        """Stop fast-forwarding where the race is now"""
+        self._commands.put(("_stop_fast_forward", ()))
+
+    def watch_events(self, kinds):
+        """Collect the engine's events of these kinds into self.events (none: stop collecting)"""
+        self._commands.put(("_watch_events", (tuple(kinds),)))
+
+    def stop(self):
+        """Stop the thread and wait for it (the engine is safe to use afterwards)."""
+        self._commands.put(("_stop", ()))
+        if self.is_alive():
+            self.join()
+        self.events.cancel()
+
+    # =========================================================================
+    # SIM THREAD
+    # =========================================================================
+
+    def run(self):
+        """Sim loop: apply messages, advance by elapsed real time, publish."""
+        engine = self.engine
+        last = time.perf_counter()
+        while self._running:
+            changed = self._apply_commands()
+            now = time.perf_counter()
+            elapsed_frames = (now - last) * config.FPS
+            last = now
+
+            running = False
+            if self._fast_forward:
+                budget = config.FAST_FORWARD_FRAME_BUDGET_MS / 1000.0
+                if engine.fast_forward(self._fast_forward_target, budget):
+                    self._stop_fast_forward()
+                changed = True
+            elif engine.race_started and not self._paused and not engine.is_race_finished():
+                running = True
+                changed = engine.update(elapsed_frames) > 0 or changed
+
+            if changed:
+                self._publish()
+            # Keep going only while catching up; paused, waiting or finished races
+            # idle even if a backlog is left in the engine's accumulator
+            if not self._fast_forward and not (running and engine.is_behind()):
+                time.sleep(config.SIM_THREAD_IDLE_SLEEP)
+
+    def _apply_commands(self):
+        """Run queued messages; returns True if any arrived."""
+        changed = False
+        while True:
+            try:
+                name, args = self._commands.get_nowait()
+            except queue.Empty:
+                return changed
+            target = self if name.startswith("_") else self.engine
+            getattr(target, name)(*args)
+            changed = True
+
+    def _publish(self):
+        """Publish the engine's current state."""
+        self._sequence += 1
+        self.buffer.publish(RaceSnapshot(self._sequence, self.engine, self._grid, self._jumps))
+
+    def _set_paused(self, paused):
+        self._paused = paused
+
+    def _watch_events(self, kinds):
+        self.events.cancel()
+        if kinds:
+            self.events.subscription = self.engine.events.subscribe(self.events, kinds)
+
+    def _rewind(self, lap):
+        if self.engine.rewind_to_lap(lap) is not None:
+            self._jumps += 1
+
+    def _start_fast_forward(self, target_lap):
+        if not self.engine.race_started:
+            self.engine.start_race()
+        self._paused = False
+        self._fast_forward = True
+        self._fast_forward_target = target_lap
+
+    def _stop_fast_forward(self):
+        if self._fast_forward:
+            self._jumps += 1
+        self._fast_forward = False
+        self._fast_forward_target = None
+        self.fast_forwarding = False
+
+    def _stop(self):
+        self._running = False
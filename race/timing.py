@@ -0,0 +1,122 @@
+"""
+Timing Loops - Gaps from crossing times, the way real timing works
+
+A lap has a fixed set of timing loops: the sector lines, each split into
+config.MINI_SECTORS_PER_SECTOR mini-sectors (see Track.get_timing_loops).
+Every time a car crosses a loop its crossing time, interpolated within the
+step, goes into a small per-car ring buffer. Its interval to the car ahead
+and its gap to the leader are then one subtraction each: the time since
+they crossed the same loop.
+
+Time gaps only change at crossings, like a real timing screen, so a race
+with lap times that vary doesn't skew them the way progress x lap time did.
+"""
+import array
+import bisect
+import math
+
+import config
+
+
+class TimingLoops:
+    """Crossing times of every car at every timing loop (recent laps only)"""
+
+    def __init__(self, loops, cars, ring_laps=None):
+        """
+        Args:
+            loops: Progress of each loop within a lap (sorted, first is 0.0 = the line)
+            cars: Cars in grid order (their index is used for the ring buffers)
+            ring_laps: Laps of crossings kept per car (default: config.TIMING_RING_LAPS)
+        """
+        self.loops = list(loops)
+        self.per_lap = len(self.loops)
+        self.size = self.per_lap * (ring_laps or config.TIMING_RING_LAPS)
+        self.index = {car.driver_number: i for i, car in enumerate(cars)}
+
+        # Ring buffer of crossing times: car i's slot for loop k is i * size + k % size
+        self.times = array.array("d", bytes(8 * self.size * len(cars)))
+        self.last_time = 0.0
+        self.last_total = [car.get_total_progress() for car in cars]
+        # Next loop to cross, as a race-wide index (lap * loops per lap + loop)
+        self.next_loop = [max(0, self.loop_after(total)) for total in self.last_total]
+        self.next_total = [self.loop_total(k) for k in self.next_loop]
+
+    def loop_total(self, k):
+        """Total progress (laps + fraction) of race-wide loop k."""
+        lap, loop = divmod(k, self.per_lap)
+        return lap + self.loops[loop]
+
+    def loop_after(self, total):
+        """Race-wide index of the first loop after total progress."""
+        lap = math.floor(total)
+        return lap * self.per_lap + bisect.bisect_right(self.loops, total - lap)
+
+    def crossing_time(self, i, k):
+        """
+        Time car i crossed race-wide loop k, or None if it hasn't (or it's no longer buffered).
+
+        Args:
+            i: Car's grid index
+            k: Race-wide loop index
+        """
+        if k >= self.next_loop[i] or self.next_loop[i] - k > self.size:
+            return None
+        return self.times[i * self.size + k % self.size]
+
+    def update(self, race_time, grid, order):
+        """
+        Record loop crossings since the last update and update gaps at them.
+
+        Args:
+            race_time: Current race time
+            grid: Cars in grid order (same as at construction)
+            order: Cars in race order (positions already updated)
+        """
+        crossings = []
+        for i, car in enumerate(grid):
+            total = car.get_total_progress()
+            if total >= self.next_total[i]:
+                self._cross(i, total, race_time, crossings)
+            self.last_total[i] = total
+        self.last_time = race_time
+
+        # Gaps after all crossings are in (the car ahead may have crossed in the same step)
+        for i, k, t in crossings:
+            car = grid[i]
+            if car.position == 1:
+                car.gap_to_leader_time = 0.0
+                car.gap_to_ahead_time = 0.0
+                continue
+            ahead = self.crossing_time(self.index[order[car.position - 2].driver_number], k)
+            if ahead is not None:
+                car.gap_to_ahead_time = t - ahead
+            leader = self.crossing_time(self.index[order[0].driver_number], k)
+            if leader is not None:
+                car.gap_to_leader_time = t - leader
+
+    def _cross(self, i, total, race_time, crossings):
+        """Record the loops car i crossed during the last step (appends (i, loop, time))."""
+        last_total = self.last_total[i]
+        moved = total - last_total
+        while total >= self.next_total[i]:
+            k = self.next_loop[i]
+            # Interpolate the crossing within the step
+            fraction = (self.next_total[i] - last_total) / moved if moved > 0 else 1.0
+            t = self.last_time + fraction * (race_time - self.last_time)
+            self.times[i * self.size + k % self.size] = t
+            self.next_loop[i] = k + 1
+            self.next_total[i] = self.loop_total(k + 1)
+            crossings.append((i, k, t))
+
+    def capture_state(self):
+        """Copy of the timing state (for checkpoints)."""
+        return (self.times.tobytes(), self.last_time, array.array("d", self.last_total).tobytes(),
+                tuple(self.next_loop))
+
+    def restore_state(self, state):
+        """Restore from capture_state()."""
+        times, self.last_time, last_total, next_loop = state
+        self.times = array.array("d", times)
+        self.last_total = array.array("d", last_total).tolist()
+        self.next_loop = list(next_loop)
+        self.next_total = [self.loop_total(k) for k in self.next_loop]
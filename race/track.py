@@ -4,6 +4,8 @@ F1 Track - Circuit layout and waypoint generation
 import math
 import config
 from data import circuits
+from race.track_geometry import TrackGeometry, resample_waypoints
+from race.track_zones import TrackZoneIndex, ZONE_DRS
 
 
 def normalize_angle(angle):
@@ -55,13 +57,40 @@ class Track:
             self.waypoints = self.circuit_data["waypoints"]
         else:
             self.waypoints = self._generate_waypoints()
-        self.track_length = len(self.waypoints)
 
         # Decorations (kerbs and gravel traps)
         # Format: {'kerbs': [{'boundary': 'left'|'right', 'start': int, 'end': int}, ...],
         #          'gravel': [{'boundary': 'left'|'right', 'start': int, 'end': int}, ...]}
         self.decorations = decorations or {'kerbs': [], 'gravel': []}
 
+        # Precomputed headings, normals, arc length and boundaries
+        self.geometry = TrackGeometry(self.waypoints)
+
+        # DRS zones are authored as fractions of the waypoint count; convert them
+        # to arc-length progress (before any resampling changes the waypoints)
+        self._drs_zones = self._convert_drs_zones()
+
+        # Optional uniform resampling (decorations reference waypoint indices, so
+        # only undecorated tracks are resampled)
+        if config.TRACK_RESAMPLE_SPACING and not self.has_explicit_decorations():
+            self.waypoints = resample_waypoints(self.waypoints, config.TRACK_RESAMPLE_SPACING)
+            self.geometry = TrackGeometry(self.waypoints)
+
+        # Lap distance in speed units: real length for real circuits, drawn length otherwise
+        if self.circuit_data and self.circuit_data.get("length_km"):
+            self.track_length = self.circuit_data["length_km"] * config.TRACK_UNITS_PER_KM
+        else:
+            self.track_length = self.geometry.total_length / config.TRACK_UNIT_PIXELS
+
+        # Zone index: DRS, sectors, kerbs/gravel/grass and corners per progress interval
+        sector_lines = None
+        if self.circuit_data:
+            sector_lines = self.circuit_data.get("sector_lines")
+        if not sector_lines:
+            sector_lines = [i / config.NUM_SECTORS for i in range(config.NUM_SECTORS)]
+        self.zones = TrackZoneIndex(self.geometry, self._drs_zones, self.decorations,
+                                    self.get_corner_indices(), sector_lines)
+
     def _generate_waypoints(self):
         """
         Generate waypoints for an F1-style circuit
@@ -89,88 +118,35 @@ class Track:
     def get_position(self, progress):
         """
         Get x, y coordinates for a given progress (0.0 to 1.0) around the track.
-        Uses linear interpolation between waypoints for smooth movement.
+        Progress is a fraction of the lap distance (arc length), so cars move at
+        the same speed however densely the waypoints are spaced.
         
-        Note: Handles negative progress values (used for grid formation) correctly
-        by using math.floor() instead of int() for proper floor division.
+        Note: Handles negative progress values (used for grid formation) correctly.
         """
-        # Calculate exact position with interpolation
-        exact_index = progress * self.track_length
-        
-        # Use math.floor() for correct handling of negative values
-        # int() rounds toward zero: int(-0.975) = 0
-        # math.floor() always rounds down: math.floor(-0.975) = -1
-        floored_index = math.floor(exact_index)
-        index = floored_index % self.track_length
-        next_index = (index + 1) % self.track_length
-        
-        # Interpolation factor (0.0 to 1.0 between waypoints)
-        # With math.floor(), t is always positive: -0.975 - (-1) = 0.025
-        t = exact_index - floored_index
-        
-        x1, y1 = self.waypoints[index]
-        x2, y2 = self.waypoints[next_index]
-        
-        # Linear interpolation
-        x = x1 + (x2 - x1) * t
-        y = y1 + (y2 - y1) * t
-        
-        return x, y
+        return self.geometry.position(progress)
 
     def get_angle(self, progress):
         """
         Get the angle (in radians) of the track at a given progress.
         Uses interpolation between segment angles for smooth rotation.
-        
-        Note: Handles negative progress values (used for grid formation) correctly
-        by using math.floor() instead of int() for proper floor division.
         """
-        # Calculate exact position
-        exact_index = progress * self.track_length
-        
-        # Use math.floor() for correct handling of negative values
-        floored_index = math.floor(exact_index)
-        index = floored_index % self.track_length
-        next_index = (index + 1) % self.track_length
-        next_next_index = (index + 2) % self.track_length
-        
-        # Interpolation factor (always 0.0 to 1.0 with math.floor())
-        t = exact_index - floored_index
-
-        # Get current segment angle
-        x1, y1 = self.waypoints[index]
-        x2, y2 = self.waypoints[next_index]
-        angle1 = math.atan2(y2 - y1, x2 - x1)
-        
-        # Get next segment angle
-        x3, y3 = self.waypoints[next_next_index]
-        angle2 = math.atan2(y3 - y2, x3 - x2)
-        
-        # Handle angle wrapping (e.g., from 179° to -179°)
-        angle_diff = angle2 - angle1
-        if angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        elif angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # Interpolate angle
-        return angle1 + angle_diff * t
+        return self.geometry.angle(progress)
 
     def get_offset_position(self, progress, offset):
         """
         Get position offset from racing line (for multiple cars side by side)
         offset: perpendicular distance from racing line (positive = right, negative = left)
         """
-        x, y = self.get_position(progress)
-        angle = self.get_angle(progress)
-
-        # Perpendicular angle (90 degrees offset)
-        perp_angle = angle + math.pi / 2
+        return self.geometry.offset_position(progress, offset)
 
-        offset_x = x + offset * math.cos(perp_angle)
-        offset_y = y + offset * math.sin(perp_angle)
+    def get_offset_positions(self, progresses, offsets=None):
+        """
+        Batch get_offset_position() for arrays of progress/offset values (requires numpy).
 
-        return offset_x, offset_y
+        Returns:
+            tuple: (x, y) NumPy arrays
+        """
+        return self.geometry.positions(progresses, offsets)
 
     def get_corner_indices(self, curvature_threshold=15):
         """
@@ -179,27 +155,12 @@ class Track:
         """
         corners = []
         threshold_rad = math.radians(curvature_threshold)
+        heading_delta = self.geometry.heading_delta
+        n = len(self.waypoints)
 
-        for i in range(len(self.waypoints)):
-            prev_i = (i - 1) % len(self.waypoints)
-            next_i = (i + 1) % len(self.waypoints)
-
-            # Get angles
-            x1, y1 = self.waypoints[prev_i]
-            x2, y2 = self.waypoints[i]
-            x3, y3 = self.waypoints[next_i]
-
-            # Calculate angles
-            angle1 = math.atan2(y2 - y1, x2 - x1)
-            angle2 = math.atan2(y3 - y2, x3 - x2)
-
-            # Calculate angle change
-            angle_diff = abs(angle2 - angle1)
-            # Normalize to 0-pi range
-            if angle_diff > math.pi:
-                angle_diff = 2 * math.pi - angle_diff
-
-            if angle_diff > threshold_rad:
+        for i in range(n):
+            # Heading change from the incoming to the outgoing segment
+            if abs(heading_delta[(i - 1) % n]) > threshold_rad:
                 corners.append(i)
 
         return corners
@@ -215,55 +176,11 @@ class Track:
         Uses a simple bevel-style join (averaged perpendiculars) which avoids
         the complexity and edge cases of miter joins at sharp corners.
         
+        Boundaries are computed once per width and shared: do not modify them.
+
         Returns tuple of (left_boundary, right_boundary)
         """
-        if len(self.waypoints) < 3:
-            return [], []
-        
-        left_boundary = []
-        right_boundary = []
-        
-        for i in range(len(self.waypoints)):
-            prev_i = (i - 1) % len(self.waypoints)
-            next_i = (i + 1) % len(self.waypoints)
-            
-            p_prev = self.waypoints[prev_i]
-            p_curr = self.waypoints[i]
-            p_next = self.waypoints[next_i]
-            
-            # Direction vectors
-            dx1 = p_curr[0] - p_prev[0]
-            dy1 = p_curr[1] - p_prev[1]
-            dx2 = p_next[0] - p_curr[0]
-            dy2 = p_next[1] - p_curr[1]
-            
-            # Normalize
-            len1 = math.sqrt(dx1*dx1 + dy1*dy1)
-            len2 = math.sqrt(dx2*dx2 + dy2*dy2)
-            if len1 > 0:
-                dx1, dy1 = dx1/len1, dy1/len1
-            if len2 > 0:
-                dx2, dy2 = dx2/len2, dy2/len2
-            
-            # Perpendiculars (pointing LEFT)
-            perp1_x, perp1_y = -dy1, dx1
-            perp2_x, perp2_y = -dy2, dx2
-            
-            # Average perpendicular (bevel join)
-            avg_x = perp1_x + perp2_x
-            avg_y = perp1_y + perp2_y
-            avg_len = math.sqrt(avg_x*avg_x + avg_y*avg_y)
-            
-            if avg_len > 0.001:
-                avg_x, avg_y = avg_x/avg_len, avg_y/avg_len
-            else:
-                avg_x, avg_y = perp1_x, perp1_y
-            
-            # Offset points
-            left_boundary.append((p_curr[0] + avg_x * track_width, p_curr[1] + avg_y * track_width))
-            right_boundary.append((p_curr[0] - avg_x * track_width, p_curr[1] - avg_y * track_width))
-        
-        return left_boundary, right_boundary
+        return self.geometry.boundaries(track_width)
 
     def get_boundary_points_for_range(self, boundary, start, end, track_width=35):
         """
@@ -412,6 +329,29 @@ class Track:
             return self.circuit_data["characteristics"].get("tire_degradation", config.DEFAULT_TIRE_DEG_MULTIPLIER)
         return config.DEFAULT_TIRE_DEG_MULTIPLIER
 
+    def get_overtaking_multiplier(self):
+        """
+        Get how easily passes stick at this circuit (see config.OVERTAKING_DIFFICULTY).
+
+        Returns:
+            float: Pass chance multiplier (1.0 for custom tracks and unknown difficulties)
+        """
+        difficulty = self.get_track_characteristics().get("overtaking_difficulty", "medium")
+        return config.OVERTAKING_DIFFICULTY.get(difficulty, 1.0)
+
+    def _convert_drs_zones(self):
+        """Convert circuit DRS zones from waypoint fractions to arc-length progress."""
+        if not self.circuit_data:
+            return []
+        n = len(self.waypoints)
+        zones = []
+        for zone in self.circuit_data.get("drs_zones", []):
+            converted = dict(zone)
+            converted["start"] = self.geometry.waypoint_progress(zone["start"] * n)
+            converted["end"] = self.geometry.waypoint_progress(zone["end"] * n)
+            zones.append(converted)
+        return zones
+
     def get_drs_zones(self):
         """
         Get DRS zones for this circuit.
@@ -420,9 +360,7 @@ class Track:
         Returns:
             list: List of dicts with 'start' and 'end' keys, or empty list if none
         """
-        if self.circuit_data:
-            return self.circuit_data.get("drs_zones", [])
-        return []
+        return self._drs_zones
 
     def is_in_drs_zone(self, progress):
         """
@@ -434,21 +372,42 @@ class Track:
         Returns:
             bool: True if in a DRS zone, False otherwise
         """
-        drs_zones = self.get_drs_zones()
-        for zone in drs_zones:
-            # Handle progress wrapping (DRS zone may cross start/finish)
-            start = zone["start"]
-            end = zone["end"]
-
-            if start <= end:
-                # Normal case: zone doesn't cross start/finish
-                if start <= progress <= end:
-                    return True
-            else:
-                # Zone crosses start/finish line
-                if progress >= start or progress <= end:
-                    return True
-        return False
+        return bool(self.zones.flags_at(progress) & ZONE_DRS)
+
+    def get_zone_flags(self, progress):
+        """
+        Get the zones (DRS, corner, kerbs, gravel, grass) at a progress value.
+
+        Returns:
+            int: Bitfield of race.track_zones ZONE_* flags
+        """
+        return self.zones.flags_at(progress)
+
+    def get_sector(self, progress):
+        """
+        Get the timing sector at a progress value.
+
+        Returns:
+            int: Sector number (0-based, config.NUM_SECTORS per lap by default)
+        """
+        return self.zones.sector_at(progress)
+
+    def get_timing_loops(self):
+        """
+        Get the timing loops around a lap (see race/timing.py).
+
+        Every sector is split into config.MINI_SECTORS_PER_SECTOR equal
+        mini-sectors; the first loop is the start/finish line.
+
+        Returns:
+            list: Progress of each loop, ascending from 0.0
+        """
+        lines = sorted(set([0.0] + list(self.zones.sector_lines))) + [1.0]
+        loops = []
+        for start, end in zip(lines, lines[1:]):
+            for m in range(config.MINI_SECTORS_PER_SECTOR):
+                loops.append(start + (end - start) * m / config.MINI_SECTORS_PER_SECTOR)
+        return loops
 
     def get_track_characteristics(self):
         """
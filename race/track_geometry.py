@@ -0,0 +1,330 @@
+"""
+Track Geometry - Precomputed lookup tables for a closed waypoint loop
+
+Built once per Track. Segment headings, unit normals, cumulative arc length
+and track boundaries are computed up front, so per-car position and offset
+queries are a table lookup plus a lerp (no atan2/cos/sin per car per frame).
+
+Progress is arc-length uniform: progress 0.5 is halfway round the lap by
+distance, however densely each part of the track was digitised. A
+uniform-bin lookup table maps progress to a segment in O(1).
+"""
+import math
+
+
+def resample_waypoints(points, spacing=20):
+    """
+    Resample a closed loop of points to (near) uniform spacing.
+
+    Spacing is adjusted slightly so the points divide the loop exactly.
+
+    Args:
+        points: List of (x, y) points (closed loop, last connects to first)
+        spacing: Target distance between points
+
+    Returns:
+        list: Resampled (x, y) points (unchanged if the loop is too short)
+    """
+    if not points:
+        return points
+
+    # Segment lengths, including the closing segment (last point -> first)
+    n_points = len(points)
+    segments = []
+    total_length = 0
+    for i in range(n_points):
+        p1 = points[i]
+        p2 = points[(i + 1) % n_points]
+        dist = math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+        segments.append(dist)
+        total_length += dist
+
+    num_new_points = int(total_length / spacing)
+    if num_new_points < 3:
+        return points  # Too short
+
+    real_spacing = total_length / num_new_points  # Adjust slightly to fit exactly
+
+    new_points = []
+    current_dist = 0
+    segment_idx = 0
+    for i in range(num_new_points):
+        target = i * real_spacing
+
+        # Find which segment contains 'target'
+        while current_dist + segments[segment_idx] < target:
+            current_dist += segments[segment_idx]
+            segment_idx = (segment_idx + 1) % n_points
+
+        # Interpolate in current segment
+        segment_len = segments[segment_idx]
+        remaining = target - current_dist
+        t = remaining / segment_len if segment_len > 0 else 0
+
+        p1 = points[segment_idx]
+        p2 = points[(segment_idx + 1) % n_points]
+        new_points.append((p1[0] + (p2[0] - p1[0]) * t, p1[1] + (p2[1] - p1[1]) * t))
+
+    return new_points
+
+
+class TrackGeometry:
+    """Per-segment tables for a closed loop of waypoints"""
+
+    def __init__(self, waypoints):
+        """
+        Compile geometry tables for a track.
+
+        Args:
+            waypoints: List of (x, y) points forming a closed loop.
+                       Segment i runs from waypoint i to waypoint i + 1 (wrapping).
+        """
+        self.waypoints = list(waypoints)
+        n = len(self.waypoints)
+        self.num_waypoints = n
+
+        self.xs = [float(p[0]) for p in self.waypoints]
+        self.ys = [float(p[1]) for p in self.waypoints]
+
+        # Segment vectors, lengths and unit directions
+        self.seg_dx = []
+        self.seg_dy = []
+        self.seg_length = []
+        self.dir_x = []  # Unit direction (0, 0 for zero-length segments)
+        self.dir_y = []
+        for i in range(n):
+            j = (i + 1) % n
+            dx = self.xs[j] - self.xs[i]
+            dy = self.ys[j] - self.ys[i]
+            length = math.sqrt(dx * dx + dy * dy)
+            self.seg_dx.append(dx)
+            self.seg_dy.append(dy)
+            self.seg_length.append(length)
+            if length > 0:
+                self.dir_x.append(dx / length)
+                self.dir_y.append(dy / length)
+            else:
+                self.dir_x.append(0.0)
+                self.dir_y.append(0.0)
+
+        # Cumulative arc length: cum_length[i] = distance from waypoint 0 to waypoint i
+        self.cum_length = [0.0]
+        for length in self.seg_length:
+            self.cum_length.append(self.cum_length[-1] + length)
+        self.total_length = self.cum_length[-1]
+
+        # Headings, heading change to the next segment, and unit normals
+        # (normal = heading + 90 degrees, the direction of a positive offset)
+        self.heading = [math.atan2(self.seg_dy[i], self.seg_dx[i]) for i in range(n)]
+        self.heading_delta = []
+        self.normal_x = []
+        self.normal_y = []
+        for i in range(n):
+            diff = self.heading[(i + 1) % n] - self.heading[i]
+            if diff > math.pi:
+                diff -= 2 * math.pi
+            elif diff < -math.pi:
+                diff += 2 * math.pi
+            self.heading_delta.append(diff)
+            self.normal_x.append(-math.sin(self.heading[i]))
+            self.normal_y.append(math.cos(self.heading[i]))
+        self.hairpin = [abs(diff) > math.pi / 2 for diff in self.heading_delta]
+
+        # Progress -> segment lookup: bin k covers arc lengths [k, k + 1) * bin_length
+        # and stores the segment containing its start (a few bins per segment,
+        # so the forward scan in _locate is almost always 0-1 steps)
+        self.num_bins = max(1, n * 4)
+        self.bin_length = self.total_length / self.num_bins
+        self.bin_segment = []
+        segment = 0
+        for k in range(self.num_bins):
+            start = k * self.bin_length
+            while segment < n - 1 and self.cum_length[segment + 1] <= start:
+                segment += 1
+            self.bin_segment.append(segment)
+
+        self._boundaries = {}  # track_width -> (left, right)
+        self._arrays = None    # NumPy copies of the tables (built on first batch query)
+
+    def _locate(self, progress):
+        """
+        Map progress to (segment index, fraction along segment).
+
+        Uses math.floor() so negative progress (grid formation) wraps correctly.
+        """
+        if self.total_length <= 0:
+            return 0, 0.0
+        distance = (progress - math.floor(progress)) * self.total_length
+        k = int(distance / self.bin_length)
+        i = self.bin_segment[k if k < self.num_bins else self.num_bins - 1]
+        cum_length = self.cum_length
+        last = self.num_waypoints - 1
+        while i < last and cum_length[i + 1] <= distance:
+            i += 1
+        length = self.seg_length[i]
+        return i, (distance - cum_length[i]) / length if length > 0 else 0.0
+
+    def waypoint_progress(self, index):
+        """
+        Convert a (fractional) waypoint index to arc-length progress.
+
+        Args:
+            index: Waypoint index, e.g. 12.5 = halfway from waypoint 12 to 13
+
+        Returns:
+            float: Progress (0.0 to 1.0)
+        """
+        if self.total_length <= 0:
+            return 0.0
+        floored_index = math.floor(index)
+        i = floored_index % self.num_waypoints
+        distance = self.cum_length[i] + (index - floored_index) * self.seg_length[i]
+        return distance / self.total_length
+
+    # =========================================================================
+    # SINGLE QUERIES
+    # =========================================================================
+
+    def position(self, progress):
+        """Get (x, y) on the racing line at a progress value."""
+        i, t = self._locate(progress)
+        return self.xs[i] + self.seg_dx[i] * t, self.ys[i] + self.seg_dy[i] * t
+
+    def angle(self, progress):
+        """Get the heading (radians), interpolated towards the next segment's heading."""
+        i, t = self._locate(progress)
+        return self.heading[i] + self.heading_delta[i] * t
+
+    def offset_position(self, progress, offset):
+        """
+        Get (x, y) offset perpendicular to the racing line.
+
+        The normal is interpolated between this segment's and the next
+        segment's normals (and renormalised), so cars turn smoothly through
+        corners without any trig per query. Hairpin joins (heading change
+        over 90 degrees) rotate the normal by angle instead, where a lerp
+        would collapse.
+
+        Args:
+            progress: Progress around the track
+            offset: Perpendicular distance (positive = right, negative = left)
+        """
+        i, t = self._locate(progress)
+        x = self.xs[i] + self.seg_dx[i] * t
+        y = self.ys[i] + self.seg_dy[i] * t
+        if not offset:
+            return x, y
+
+        if self.hairpin[i]:
+            angle = self.heading[i] + self.heading_delta[i] * t
+            return x - offset * math.sin(angle), y + offset * math.cos(angle)
+
+        j = (i + 1) % self.num_waypoints
+        nx = self.normal_x[i] + (self.normal_x[j] - self.normal_x[i]) * t
+        ny = self.normal_y[i] + (self.normal_y[j] - self.normal_y[i]) * t
+        length = math.sqrt(nx * nx + ny * ny)
+        return x + offset * nx / length, y + offset * ny / length
+
+    def boundaries(self, track_width=35):
+        """
+        Get left and right track boundaries (bevel joins), cached per width.
+
+        The returned lists are shared between callers and must not be modified.
+
+        Returns:
+            tuple: (left_boundary, right_boundary), lists of (x, y)
+        """
+        cached = self._boundaries.get(track_width)
+        if cached is not None:
+            return cached
+
+        n = self.num_waypoints
+        left_boundary = []
+        right_boundary = []
+        if n >= 3:
+            for i in range(n):
+                prev_i = (i - 1) % n
+
+                # Perpendiculars (pointing LEFT) of the incoming and outgoing segments
+                perp1_x, perp1_y = -self.dir_y[prev_i], self.dir_x[prev_i]
+                perp2_x, perp2_y = -self.dir_y[i], self.dir_x[i]
+
+                # Average perpendicular (bevel join)
+                avg_x = perp1_x + perp2_x
+                avg_y = perp1_y + perp2_y
+                avg_len = math.sqrt(avg_x * avg_x + avg_y * avg_y)
+                if avg_len > 0.001:
+                    avg_x, avg_y = avg_x / avg_len, avg_y / avg_len
+                else:
+                    avg_x, avg_y = perp1_x, perp1_y
+
+                x, y = self.xs[i], self.ys[i]
+                left_boundary.append((x + avg_x * track_width, y + avg_y * track_width))
+                right_boundary.append((x - avg_x * track_width, y - avg_y * track_width))
+
+        self._boundaries[track_width] = (left_boundary, right_boundary)
+        return left_boundary, right_boundary
+
+    # =========================================================================
+    # BATCH QUERIES (NumPy)
+    # =========================================================================
+
+    def _get_arrays(self):
+        """NumPy copies of the tables (numpy is only needed for batch queries)."""
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = {
+                "np": np,
+                "xs": np.array(self.xs),
+                "ys": np.array(self.ys),
+                "cum_length": np.array(self.cum_length),
+                "seg_length": np.array(self.seg_length),
+                "seg_dx": np.array(self.seg_dx),
+                "seg_dy": np.array(self.seg_dy),
+                "normal_x": np.array(self.normal_x),
+                "normal_y": np.array(self.normal_y),
+                "heading": np.array(self.heading),
+                "heading_delta": np.array(self.heading_delta),
+                "hairpin": np.array(self.hairpin, dtype=bool),
+            }
+        return self._arrays
+
+    def positions(self, progresses, offsets=None):
+        """
+        Batch version of offset_position() for an array of progress values.
+
+        Args:
+            progresses: Array-like of progress values
+            offsets: Optional array-like (or scalar) of perpendicular offsets
+
+        Returns:
+            tuple: (x, y) NumPy arrays
+        """
+        a = self._get_arrays()
+        np = a["np"]
+        progresses = np.asarray(progresses, dtype=np.float64)
+        distance = (progresses - np.floor(progresses)) * self.total_length
+        i = np.searchsorted(a["cum_length"], distance, side="right") - 1
+        i = np.clip(i, 0, self.num_waypoints - 1)
+        seg_length = a["seg_length"][i]
+        t = np.where(seg_length > 0, (distance - a["cum_length"][i]) / np.where(seg_length > 0, seg_length, 1.0), 0.0)
+
+        x = a["xs"][i] + a["seg_dx"][i] * t
+        y = a["ys"][i] + a["seg_dy"][i] * t
+        if offsets is None:
+            return x, y
+
+        j = (i + 1) % self.num_waypoints
+        nx = a["normal_x"][i] + (a["normal_x"][j] - a["normal_x"][i]) * t
+        ny = a["normal_y"][i] + (a["normal_y"][j] - a["normal_y"][i]) * t
+        length = np.sqrt(nx * nx + ny * ny)
+        hairpin = a["hairpin"][i]
+        if hairpin.any():
+            angle = a["heading"][i] + a["heading_delta"][i] * t
+            length = np.where(hairpin, 1.0, length)
+            nx = np.where(hairpin, -np.sin(angle), nx)
+            ny = np.where(hairpin, np.cos(angle), ny)
+        nx = nx / length
+        ny = ny / length
+        offsets = np.asarray(offsets, dtype=np.float64)
+        return x + offsets * nx, y + offsets * ny
@@ -0,0 +1,161 @@
+"""
+Track Zones - Compiled interval index for DRS zones, sectors, decorations and corners
+
+Built once per Track. Every zone boundary becomes a breakpoint in progress
+space; the lap is split into intervals, each holding a bitfield of the
+zones it lies in and its sector number. A uniform-bin table maps progress
+to its interval, so each query is O(1) however many zones a track has.
+"""
+import math
+
+# Zone flags (bitfield)
+ZONE_DRS = 1
+ZONE_CORNER = 2
+ZONE_KERB_LEFT = 4
+ZONE_KERB_RIGHT = 8
+ZONE_GRAVEL_LEFT = 16
+ZONE_GRAVEL_RIGHT = 32
+ZONE_GRASS_LEFT = 64
+ZONE_GRASS_RIGHT = 128
+
+ZONE_KERB = ZONE_KERB_LEFT | ZONE_KERB_RIGHT
+ZONE_GRAVEL = ZONE_GRAVEL_LEFT | ZONE_GRAVEL_RIGHT
+ZONE_GRASS = ZONE_GRASS_LEFT | ZONE_GRASS_RIGHT
+
+# Decoration type -> (left flag, right flag)
+DECORATION_FLAGS = {
+    "kerbs": (ZONE_KERB_LEFT, ZONE_KERB_RIGHT),
+    "gravel": (ZONE_GRAVEL_LEFT, ZONE_GRAVEL_RIGHT),
+    "grass": (ZONE_GRASS_LEFT, ZONE_GRASS_RIGHT),
+}
+
+
+class TrackZoneIndex:
+    """Progress -> (zone flags, sector) lookup for one track"""
+
+    def __init__(self, geometry, drs_zones=(), decorations=None, corner_indices=(), sector_lines=(0.0, 1 / 3, 2 / 3)):
+        """
+        Compile the zone index.
+
+        Args:
+            geometry: TrackGeometry (converts waypoint indices to progress)
+            drs_zones: DRS zones as dicts with 'start'/'end' progress (may wrap)
+            decorations: Dict of 'kerbs'/'gravel'/'grass' lists with 'boundary',
+                         'start' and 'end' waypoint indices (may wrap)
+            corner_indices: Waypoint indices of corners (from Track.get_corner_indices)
+            sector_lines: Progress at which each sector starts (first should be 0.0)
+        """
+        n = geometry.num_waypoints
+
+        # Raw (flag, start, end) ranges in progress, half-open [start, end)
+        ranges = []
+        for zone in drs_zones:
+            ranges.append((ZONE_DRS, zone["start"], zone["end"]))
+        for kind, (left_flag, right_flag) in DECORATION_FLAGS.items():
+            for deco in (decorations or {}).get(kind, []):
+                flag = left_flag if deco.get("boundary") == "left" else right_flag
+                ranges.append((flag, geometry.waypoint_progress(deco["start"]),
+                               geometry.waypoint_progress(deco["end"])))
+        for i in corner_indices:
+            # A corner spans from halfway along the incoming segment to halfway along the outgoing one
+            ranges.append((ZONE_CORNER, geometry.waypoint_progress((i - 0.5) % n),
+                           geometry.waypoint_progress(i + 0.5)))
+
+        # Split wrapping ranges at the line
+        intervals = []
+        for flag, start, end in ranges:
+            if start < end:
+                intervals.append((flag, start, end))
+            elif start > end:
+                intervals.append((flag, start, 1.0))
+                intervals.append((flag, 0.0, end))
+
+        self.sector_lines = sorted(sector_lines) if sector_lines else [0.0]
+        self.num_sectors = len(self.sector_lines)
+
+        # Breakpoints: bounds[j] <= progress < bounds[j + 1] is interval j
+        points = {0.0, 1.0}
+        for _, start, end in intervals:
+            points.add(start)
+            points.add(end)
+        points.update(p for p in self.sector_lines if 0.0 < p < 1.0)
+        self.bounds = sorted(points)
+
+        self.flags = []
+        self.sectors = []
+        for j in range(len(self.bounds) - 1):
+            mid = (self.bounds[j] + self.bounds[j + 1]) / 2
+            flags = 0
+            for flag, start, end in intervals:
+                if start <= mid < end:
+                    flags |= flag
+            self.flags.append(flags)
+            sector = 0
+            for s, line in enumerate(self.sector_lines):
+                if line <= mid:
+                    sector = s
+            self.sectors.append(sector)
+
+        # Uniform bins: bin k stores the interval containing progress k / num_bins
+        self.num_bins = max(64, 4 * len(self.flags))
+        self.bin_interval = []
+        j = 0
+        for k in range(self.num_bins):
+            p = k / self.num_bins
+            while self.bounds[j + 1] <= p:
+                j += 1
+            self.bin_interval.append(j)
+
+        # Flags of bins that lie entirely inside one interval (None where a
+        # boundary falls inside the bin), so most lookups are a single index
+        self.bin_flags = []
+        for k in range(self.num_bins):
+            j = self.bin_interval[k]
+            inside = self.bounds[j + 1] >= (k + 1) / self.num_bins
+            self.bin_flags.append(self.flags[j] if inside else None)
+
+        self._arrays = None
+
+    def _interval(self, progress):
+        """Index of the interval containing progress (wraps like Track positions)."""
+        p = progress - math.floor(progress)
+        k = int(p * self.num_bins)
+        j = self.bin_interval[k if k < self.num_bins else self.num_bins - 1]
+        bounds = self.bounds
+        last = len(self.flags) - 1
+        while j < last and bounds[j + 1] <= p:
+            j += 1
+        return j
+
+    def flags_at(self, progress):
+        """Zone bitfield at a progress value (see ZONE_* flags)."""
+        if 0.0 <= progress < 1.0:
+            flags = self.bin_flags[int(progress * self.num_bins)]
+            if flags is not None:
+                return flags
+        return self.flags[self._interval(progress)]
+
+    def sector_at(self, progress):
+        """Sector number (0-based) at a progress value."""
+        return self.sectors[self._interval(progress)]
+
+    def in_zone(self, progress, flag):
+        """Check if progress is in any zone of the given flag(s)."""
+        return bool(self.flags_at(progress) & flag)
+
+    def flags_for(self, progresses):
+        """
+        Batch flags_at() for an array of progress values (requires numpy).
+
+        Returns:
+            tuple: (flags, sectors) NumPy int arrays
+        """
+        import numpy as np
+        if self._arrays is None:
+            self._arrays = (np.array(self.bounds), np.array(self.flags, dtype=np.int32),
+                            np.array(self.sectors, dtype=np.int32))
+        bounds, flags, sectors = self._arrays
+        progresses = np.asarray(progresses, dtype=np.float64)
+        p = progresses - np.floor(progresses)
+        j = np.clip(np.searchsorted(bounds, p, side="right") - 1, 0, len(flags) - 1)
+        return flags[j], sectors[j]
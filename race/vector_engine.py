@@ -0,0 +1,553 @@
+"""
+Vector Race Engine - Struct-of-arrays simulation backend (NumPy)
+
+Stores the whole field's race state in NumPy arrays and advances every car
+in a handful of vectorized operations per frame. The public RaceEngine API
+(cars, get_cars_by_position, is_race_finished, ...) is unchanged, so the
+renderer and timing screen work with either backend.
+
+Car objects are still created for display; their attributes are refreshed
+from the arrays lazily, only when the field is read.
+
+Race events (race/events.py) are found by comparing arrays, except
+OVERTAKE: individual passes aren't tracked here.
+
+Random numbers are counter-based per car, as in race/rng.py: a car's n-th
+number on lap L depends only on (race seed, car, L, n), so how many numbers
+other cars use (pit calls, blocked passes) never shifts its own. The
+numbers differ from the Python backend's, so the two backends give
+different (equally reproducible) races for the same seed.
+"""
+import numpy as np
+
+import config
+from race.car import COMPOUNDS
+from race.events import LAP_COMPLETED, PIT_IN, PIT_OUT, DRS_ACTIVATED, FASTEST_LAP
+from race.race_engine import RaceEngine
+from race.rng import derive_seed, state_hash
+from race.track_zones import ZONE_DRS
+
+# Compound codes used in the compound array (indices into COMPOUNDS)
+SOFT, MEDIUM, HARD = 0, 1, 2
+
+# SplitMix64 constants (mixes a car's stream key and counter into a random number)
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+MIX_2 = np.uint64(0x94D049BB133111EB)
+
+# Pit strategy: the two compounds each compound can switch to (same as Car._complete_pit_stop)
+NEXT_COMPOUND = np.array([
+    [MEDIUM, HARD],   # Soft -> Medium or Hard
+    [HARD, SOFT],     # Medium -> Hard or Soft
+    [MEDIUM, SOFT],   # Hard -> Medium or Soft
+], dtype=np.int8)
+
+
+class VectorRaceEngine(RaceEngine):
+    """RaceEngine backend that simulates the field as NumPy arrays"""
+
+    def __init__(self, waypoints=None, decorations=None, circuit_id=None, field_size=None, seed=None,
+                 settings=None, tick_rate=None):
+        """
+        Initialize the vector engine.
+
+        Args:
+            waypoints: Custom waypoints (overrides circuit_id if both provided)
+            decorations: Track decorations (kerbs, gravel)
+            circuit_id: ID of real F1 circuit to load
+            field_size: Number of cars (default: one per driver in TEAMS_DATA)
+            seed: Race seed (default: drawn from the global random module)
+            settings: RaceSettings for this race (default: snapshot of runtime_config)
+            tick_rate: Simulation steps per second of race time (default: 60 Hz)
+        """
+        self._cars_dirty = False
+        super().__init__(waypoints=waypoints, decorations=decorations,
+                         circuit_id=circuit_id, field_size=field_size, seed=seed, settings=settings,
+                         tick_rate=tick_rate)
+        self._build_arrays()
+
+    # =========================================================================
+    # ARRAY STATE
+    # =========================================================================
+
+    def _build_arrays(self):
+        """Copy initial car state into arrays (index i = self._car_list[i])."""
+        cars = list(self._cars)
+        self._car_list = cars
+        n = len(cars)
+
+        self.progress = np.array([c.progress for c in cars], dtype=np.float64)
+        self.lap = np.ones(n, dtype=np.int32)
+        self.laps_completed = np.zeros(n, dtype=np.int32)
+        self.fuel = np.ones(n, dtype=np.float64)
+        self.tire_age = np.zeros(n, dtype=np.int32)
+        self.compound = np.array([COMPOUNDS.index(c.tire_compound) for c in cars], dtype=np.int8)
+        self.is_pitting = np.zeros(n, dtype=bool)
+        self.pit_time_remaining = np.zeros(n, dtype=np.float64)
+        self.pit_stops = np.zeros(n, dtype=np.int32)
+        self.lap_variance = np.ones(n, dtype=np.float64)
+        self.is_drs_active = np.zeros(n, dtype=bool)
+        self.is_drs_available = np.zeros(n, dtype=bool)
+        self.is_passing = np.zeros(n, dtype=bool)
+        self.current_pace = np.full(n, config.BASE_SPEED, dtype=np.float64)
+        self.lateral_offset = np.array([c.lateral_offset for c in cars], dtype=np.float64)
+
+        # Random streams: one key per car (by driver number), numbers drawn on the current lap
+        self.stream_keys = np.array([derive_seed(self.seed, f"car:{c.driver_number}", "vector") for c in cars],
+                                    dtype=np.uint64)
+        self.draws = np.zeros(n, dtype=np.uint64)
+
+        # Timing
+        self.lap_time = np.zeros(n, dtype=np.float64)
+        self.last_lap_time = np.full(n, np.nan)
+        self.best_lap_time = np.full(n, np.nan)
+        self.gap_to_leader = np.zeros(n, dtype=np.float64)
+        self.gap_to_ahead = np.zeros(n, dtype=np.float64)
+        self.gap_to_leader_time = np.zeros(n, dtype=np.float64)
+        self.gap_to_ahead_time = np.zeros(n, dtype=np.float64)
+
+        # Timing loops (same layout as race/timing.TimingLoops): ring of crossing times per car
+        self.loop_progress = np.array(self.timing.loops)
+        self.loop_ring = self.timing.size
+        self.loop_times = np.zeros((n, self.loop_ring), dtype=np.float64)
+        self.next_loop = np.array(self.timing.next_loop, dtype=np.int64)
+        self.last_total = self.lap - 1 + self.progress
+        self.last_loop_time = self.race_time
+
+        # Order: order[k] = index of car in position k + 1
+        self.order = np.arange(n)
+        self.position = np.arange(1, n + 1, dtype=np.int32)
+        self.position_change = np.zeros(n, dtype=np.int32)
+        self.position_change_time = np.full(n, np.nan)
+
+        # Static pace factors: BASE x TIER x SKILL x SYNERGY (fixed for the race)
+        skill_range = config.SKILL_MAX - config.SKILL_MIN
+        self.static_pace = np.array([
+            config.BASE_SPEED
+            * self.settings.tier_modifier(c.team_tier)
+            * (config.SKILL_MIN_FACTOR + (c.driver_skill - config.SKILL_MIN) * (config.SKILL_FACTOR_RANGE / skill_range))
+            * self.settings.synergy_modifier(c.synergy_level)
+            for c in cars
+        ])
+        self.variance_factor = np.array([
+            self.settings.lap_variance_base * (6 - c.driver_consistency) / 5 for c in cars
+        ])
+
+        # Wheel-to-wheel inputs (see Car._race_car_ahead)
+        self.racecraft = np.array([c.driver_racecraft for c in cars], dtype=np.float64)
+        self.dirty_air_factor = np.array([
+            1.0 - config.DIRTY_AIR_CORNERING_FACTOR * c.car_cornering for c in cars
+        ])
+        self.overtaking_multiplier = self.track.get_overtaking_multiplier()
+
+        # Per-compound lookup tables
+        self.deg_rates = np.array([self.settings.tire_deg_rates[c] for c in COMPOUNDS])
+        self.cliff_laps = np.array([self.settings.tire_cliff_laps[c] for c in COMPOUNDS])
+
+        # Track constants
+        self.tire_deg_multiplier = self.track.get_tire_degradation_multiplier()
+
+    def _in_drs_zone(self, progress):
+        """Vectorized Track.is_in_drs_zone over an array of progress values."""
+        flags, _ = self.track.zones.flags_for(progress)
+        return (flags & ZONE_DRS) != 0
+
+    # =========================================================================
+    # SIMULATION
+    # =========================================================================
+
+    def step(self):
+        """Advance every car by one fixed timestep using vectorized operations"""
+        dt = self.timestep
+        rc = self.settings
+        events = self.events
+        if events:
+            finished = self.is_race_finished()
+            had_drs = self.is_drs_active
+
+        # DRS: available within detection gap of car ahead (previous frame), active in zone
+        self.is_drs_available = (
+            (self.position > 1)
+            & (self.lap >= config.DRS_ENABLED_FROM_LAP)
+            & (self.gap_to_ahead_time <= config.DRS_DETECTION_TIME)
+        )
+        self.is_drs_active = self.is_drs_available & self._in_drs_zone(self.progress)
+
+        # Pit stop countdown and completion
+        pitting = self.is_pitting
+        self.pit_time_remaining[pitting] -= dt / config.FPS
+        done = np.flatnonzero(pitting & (self.pit_time_remaining <= 0))
+        if len(done):
+            choice = (self._random(done) < 0.5).astype(np.int8)
+            self.compound[done] = NEXT_COMPOUND[self.compound[done], choice]
+            self.tire_age[done] = 0
+            self.is_pitting[done] = False
+            self.pit_time_remaining[done] = 0.0
+
+        # Pace: static x fuel x tires x variance x DRS
+        tire_penalty = self.tire_age * self.deg_rates[self.compound] * self.tire_deg_multiplier
+        tire_penalty = tire_penalty + (self.tire_age >= self.cliff_laps[self.compound]) * rc.tire_cliff_penalty
+        pace = (
+            self.static_pace
+            * (1.0 - self.fuel * rc.fuel_start_penalty)
+            * (1.0 - np.minimum(tire_penalty, rc.max_tire_penalty))
+            * self.lap_variance
+        )
+        pace = np.where(self.is_drs_active, pace * (1.0 + config.DRS_SPEED_BOOST), pace)
+        if rc.wheel_to_wheel:
+            pace = self._race_car_ahead(pace, dt)
+        self.current_pace = pace
+        effective = np.where(self.is_pitting, pace * rc.pit_speed_penalty, pace)
+
+        # Move
+        speed = effective / self.track.track_length
+        self.progress += speed * dt
+        self.lap_time += dt / config.FPS
+
+        # Lap completion, timed to the crossing within the step (as in Car.update)
+        crossed = np.flatnonzero(self.progress >= 1.0)
+        pit_in = crossed[:0]
+        if len(crossed):
+            overshoot = (self.progress[crossed] - 1.0) / (speed[crossed] * config.FPS)
+            self.lap_time[crossed] -= overshoot
+            pit_in = self._complete_laps(crossed)
+            self.lap_time[crossed] = overshoot
+
+        self.race_time += dt / config.FPS
+
+        # Order and gaps
+        self._update_order_and_gaps()
+        self._cars_dirty = True
+
+        if events:
+            self._publish_events(crossed, pit_in, done, had_drs, finished)
+
+    def _race_car_ahead(self, pace, dt):
+        """
+        Vectorized Car._race_car_ahead: every car against the car ahead in the order.
+
+        Unlike the Python engine, the car ahead's pace is from the previous
+        step (all cars move at once), so a queue slows down one step at a time.
+
+        Args:
+            pace: Pace of every car before the interaction
+            dt: Delta time in frames
+
+        Returns:
+            ndarray: Pace after dirty air and blocking
+        """
+        order = self.order
+        ahead = np.empty_like(order)
+        ahead[order[1:]] = order[:-1]
+        ahead[order[0]] = order[0]  # Leader: zero gap, so never racing
+
+        total = self.lap - 1 + self.progress
+        gap = (total[ahead] - total) * self.track.track_length / (pace * config.FPS)
+        racing = ~(self.is_pitting | self.is_pitting[ahead])
+        near = racing & (gap > 0) & (gap < config.DIRTY_AIR_GAP)
+        self.is_passing[racing & ~near] = False
+
+        loss = config.DIRTY_AIR_PACE_LOSS * (1.0 - gap / config.DIRTY_AIR_GAP) * self.dirty_air_factor
+        pace = np.where(near, pace * (1.0 - loss), pace)
+
+        self.is_passing[near & (gap >= config.FOLLOW_GAP)] = False
+        ahead_pace = self.current_pace[ahead]
+        blocked = np.flatnonzero(near & (gap < config.FOLLOW_GAP) & ~self.is_passing & (pace > ahead_pace))
+        if len(blocked):
+            racecraft = 1.0 + config.OVERTAKE_RACECRAFT_FACTOR * (self.racecraft[blocked] - self.racecraft[ahead[blocked]])
+            chance = config.OVERTAKE_CHANCE_PER_SECOND * self.overtaking_multiplier * np.maximum(0.1, racecraft)
+            chance = np.where(self.is_drs_active[blocked], chance * config.OVERTAKE_DRS_FACTOR, chance)
+            passed = self._random(blocked) < chance * dt / config.FPS
+            self.is_passing[blocked[passed]] = True
+            held = blocked[~passed]
+            pace[held] = ahead_pace[held]
+        return pace
+
+    def _complete_laps(self, idx):
+        """Apply lap-crossing bookkeeping to the cars at indices idx."""
+        rc = self.settings
+        self.progress[idx] -= 1.0
+        self.lap[idx] += 1
+        self.laps_completed[idx] += 1
+        self.tire_age[idx] += 1
+        self.fuel[idx] = np.maximum(0.0, self.fuel[idx] - 1.0 / self.total_laps)
+
+        # New lap variance (first number of the new lap's streams)
+        self.draws[idx] = 0
+        self.lap_variance[idx] = 1.0 + (self._random(idx) * 2 - 1) * self.variance_factor[idx]
+
+        # Lap times (best lap is taken from the previous completed lap, as in Car.update)
+        last = self.last_lap_time[idx]
+        best = self.best_lap_time[idx]
+        improve = ~np.isnan(last) & (np.isnan(best) | (last < best))
+        self.best_lap_time[idx[improve]] = last[improve]
+        self.last_lap_time[idx] = self.lap_time[idx]
+        for i in idx:
+            self._car_list[i].lap_times.append(float(self.lap_time[i]))
+        self.lap_time[idx] = 0.0
+
+        # Pit decision (same rules as Car.should_pit)
+        cliff = self.cliff_laps[self.compound[idx]]
+        age = self.tire_age[idx]
+        lap = self.lap[idx]
+        eligible = ~self.is_pitting[idx] & (lap > 1) & (lap < self.total_laps - rc.last_laps_no_pit)
+        chance = np.where(
+            age >= cliff, rc.pit_chance_after_cliff,
+            np.where(age >= cliff - rc.pit_window_laps, rc.pit_chance_near_cliff, 0.0)
+        )
+        pit = idx[eligible & (self._random(idx) < chance)]
+        if len(pit):
+            self.is_pitting[pit] = True
+            variance = (self._random(pit) * 2 - 1) * rc.pit_stop_variance
+            self.pit_time_remaining[pit] = rc.pit_stop_base_time + variance
+            self.pit_stops[pit] += 1
+
+        for i in idx:
+            self._car_list[i].lap_hashes.append(self._car_state_hash(i))
+        return pit
+
+    def _random(self, idx):
+        """
+        Next random number in [0, 1) from each car's own stream.
+
+        Args:
+            idx: Indices of the cars drawing a number
+
+        Returns:
+            ndarray: One number per car in idx
+        """
+        counter = (self.lap[idx].astype(np.uint64) << np.uint64(32)) | self.draws[idx]
+        self.draws[idx] += np.uint64(1)
+        x = self.stream_keys[idx] + counter * GOLDEN
+        x = (x ^ (x >> np.uint64(30))) * MIX_1
+        x = (x ^ (x >> np.uint64(27))) * MIX_2
+        x ^= x >> np.uint64(31)
+        return (x >> np.uint64(11)) * (1.0 / (1 << 53))
+
+    def _publish_events(self, lapped, pit_in, pit_out, had_drs, finished):
+        """
+        Publish this step's events from the arrays (as RaceEngine._publish_car_events).
+
+        Args:
+            lapped: Indices of cars that crossed the line
+            pit_in: Indices of cars that started a pit stop
+            pit_out: Indices of cars that finished one
+            had_drs: is_drs_active before the step
+            finished: Whether the race was finished before the step
+        """
+        events = self.events
+        t = self.race_time
+        cars = self._car_list
+        fastest_lap = events.wants(FASTEST_LAP)
+        for i in lapped:
+            lap, lap_time = int(self.lap[i]) - 1, float(self.last_lap_time[i])
+            events.publish(LAP_COMPLETED, t, cars[i].driver_number, lap,
+                           lap_time=lap_time, position=int(self.position[i]))
+            if not fastest_lap:
+                continue
+            # Fastest of every earlier lap (best_lap_time lags one lap behind last_lap_time)
+            earlier = np.fmin(self.best_lap_time, self.last_lap_time)
+            earlier[i] = self.best_lap_time[i]
+            fastest = np.fmin.reduce(earlier)
+            if np.isnan(fastest) or lap_time < fastest:
+                events.publish(FASTEST_LAP, t, cars[i].driver_number, lap, lap_time=lap_time)
+        for i in pit_in:
+            events.publish(PIT_IN, t, cars[i].driver_number, int(self.lap[i]),
+                           tire_compound=COMPOUNDS[self.compound[i]], pit_stops=int(self.pit_stops[i]))
+        for i in pit_out:
+            events.publish(PIT_OUT, t, cars[i].driver_number, int(self.lap[i]),
+                           tire_compound=COMPOUNDS[self.compound[i]])
+        if events.wants(DRS_ACTIVATED):
+            for i in np.flatnonzero(self.is_drs_active & ~had_drs):
+                events.publish(DRS_ACTIVATED, t, cars[i].driver_number, int(self.lap[i]),
+                               progress=float(self.progress[i]))
+        if not finished and self.is_race_finished():
+            self._publish_finish(t, cars[self.order[0]])
+
+    def _update_order_and_gaps(self):
+        """
+        Sort by total progress and compute gaps for the whole field.
+
+        A vectorized argsort beats an insertion pass here, so individual
+        overtakes are not logged; position changes are still recorded.
+        """
+        total = self.lap - 1 + self.progress
+        order = np.argsort(-total, kind="stable")
+        self.order = order
+        position = np.empty_like(self.position)
+        position[order] = np.arange(1, len(order) + 1)
+        changed = position != self.position
+        self.position_change[changed] = self.position[changed] - position[changed]
+        self.position_change_time[changed] = self.race_time
+        self.is_passing[changed] = False
+        self.position = position
+
+        sorted_total = total[order]
+        gap_leader = sorted_total[0] - sorted_total
+        gap_ahead = np.empty_like(sorted_total)
+        gap_ahead[0] = 0.0
+        gap_ahead[1:] = sorted_total[:-1] - sorted_total[1:]
+
+        self.gap_to_leader[order] = gap_leader
+        self.gap_to_ahead[order] = gap_ahead
+
+        # Time gaps change only when a car crosses a timing loop
+        crossed = np.flatnonzero(total >= self._loop_total(self.next_loop))
+        if len(crossed):
+            self._cross_loops(crossed, total)
+        self.last_total = total
+        self.last_loop_time = self.race_time
+
+        # Visual lateral offset for cars close together on the same lap
+        sorted_lap = self.lap[order]
+        sorted_progress = self.progress[order]
+        offsets = np.zeros(len(order))
+        close = (sorted_lap[1:] == sorted_lap[:-1]) & (np.abs(sorted_progress[:-1] - sorted_progress[1:]) < 0.05)
+        rank = np.arange(1, len(order))
+        offsets[1:] = np.where(close, np.where(rank % 2 == 0, 15, -15), 0)
+        self.lateral_offset[order] = offsets
+
+    def _loop_total(self, k):
+        """Total progress of race-wide timing loops k (array)."""
+        per_lap = len(self.loop_progress)
+        return k // per_lap + self.loop_progress[k % per_lap]
+
+    def _cross_loops(self, idx, total):
+        """Record loop crossings for cars idx and update their time gaps (as TimingLoops.update)."""
+        start_time = self.last_loop_time
+        step_time = self.race_time - start_time
+        moved = total - self.last_total
+        crossings = []
+        while len(idx):
+            k = self.next_loop[idx]
+            fraction = np.where(moved[idx] > 0, (self._loop_total(k) - self.last_total[idx]) / np.where(moved[idx] > 0, moved[idx], 1.0), 1.0)
+            t = start_time + fraction * step_time
+            self.loop_times[idx, k % self.loop_ring] = t
+            self.next_loop[idx] = k + 1
+            crossings.append((idx, k, t))
+            idx = idx[total[idx] >= self._loop_total(self.next_loop[idx])]
+
+        for idx, k, t in crossings:
+            position = self.position[idx]
+            leading = position == 1
+            self.gap_to_leader_time[idx[leading]] = 0.0
+            self.gap_to_ahead_time[idx[leading]] = 0.0
+            idx, k, t, position = idx[~leading], k[~leading], t[~leading], position[~leading]
+            for other, gaps in ((self.order[position - 2], self.gap_to_ahead_time),
+                                (np.full(len(idx), self.order[0]), self.gap_to_leader_time)):
+                # Only if the other car's crossing of loop k is still in its ring
+                seen = (self.next_loop[other] > k) & (self.next_loop[other] - k <= self.loop_ring)
+                gaps[idx[seen]] = t[seen] - self.loop_times[other[seen], k[seen] % self.loop_ring]
+
+    # =========================================================================
+    # PUBLIC API (same as RaceEngine)
+    # =========================================================================
+
+    @property
+    def cars(self):
+        """Cars sorted by position, with attributes refreshed from the arrays"""
+        if self._cars_dirty:
+            self._sync_cars()
+        return self._cars
+
+    @cars.setter
+    def cars(self, value):
+        self._cars = value
+
+    def _sync_cars(self):
+        """Write array state back into the Car objects (only when the field is read)."""
+        self._cars_dirty = False
+        for i, car in enumerate(self._car_list):
+            car.position = int(self.position[i])
+            car.position_change = int(self.position_change[i])
+            car.position_change_time = None if np.isnan(self.position_change_time[i]) else float(self.position_change_time[i])
+            car.progress = float(self.progress[i])
+            car.lap = int(self.lap[i])
+            car.total_laps = int(self.laps_completed[i])
+            car.fuel_load = float(self.fuel[i])
+            car.tire_compound = COMPOUNDS[self.compound[i]]
+            car.tire_age = int(self.tire_age[i])
+            car.pit_stops = int(self.pit_stops[i])
+            car.is_pitting = bool(self.is_pitting[i])
+            car.pit_time_remaining = float(self.pit_time_remaining[i])
+            car.current_lap_variance = float(self.lap_variance[i])
+            car.current_pace = float(self.current_pace[i])
+            car.is_drs_available = bool(self.is_drs_available[i])
+            car.is_drs_active = bool(self.is_drs_active[i])
+            car.is_passing = bool(self.is_passing[i])
+            car.lateral_offset = float(self.lateral_offset[i])
+            car.lap_time = float(self.lap_time[i])
+            car.last_lap_time = None if np.isnan(self.last_lap_time[i]) else float(self.last_lap_time[i])
+            car.best_lap_time = None if np.isnan(self.best_lap_time[i]) else float(self.best_lap_time[i])
+            car.gap_to_leader = float(self.gap_to_leader[i])
+            car.gap_to_ahead = float(self.gap_to_ahead[i])
+            car.gap_to_leader_time = float(self.gap_to_leader_time[i])
+            car.gap_to_ahead_time = float(self.gap_to_ahead_time[i])
+        self._cars = [self._car_list[i] for i in self.order]
+
+    # Arrays that change during a race (saved in checkpoints)
+    STATE_ARRAYS = (
+        "progress", "lap", "laps_completed", "fuel", "tire_age", "compound", "is_pitting",
+        "pit_time_remaining", "pit_stops", "lap_variance", "is_drs_active", "is_drs_available", "is_passing",
+        "current_pace", "lateral_offset", "lap_time", "last_lap_time", "best_lap_time",
+        "gap_to_leader", "gap_to_ahead", "gap_to_leader_time", "gap_to_ahead_time",
+        "order", "position", "position_change", "position_change_time",
+        "loop_times", "next_loop", "last_total", "draws",
+    )
+
+    def leader_lap(self):
+        """Lap the leader is on (without syncing Car objects)"""
+        return int(self.lap[self.order[0]])
+
+    def capture_state(self):
+        """
+        Copy the state arrays (including each car's stream position) for a checkpoint.
+
+        Returns:
+            tuple: (race_time, {name: array})
+        """
+        arrays = {name: getattr(self, name).copy() for name in self.STATE_ARRAYS}
+        return (self.race_time, arrays)
+
+    def restore_state(self, state):
+        """Restore state from capture_state() (Car objects are refreshed on next read)."""
+        self.race_time, arrays = state
+        for name, array in arrays.items():
+            setattr(self, name, array.copy())
+        self.last_loop_time = self.race_time
+        for i, car in enumerate(self._car_list):
+            del car.lap_times[int(self.laps_completed[i]):]
+            del car.lap_hashes[int(self.laps_completed[i]):]
+        self._cars_dirty = True
+
+    def _car_state_hash(self, i):
+        """
+        Hash of one car's state from the arrays (the fields Car.get_state_hash covers).
+
+        The car's RandomStream is never drawn from here, so its position in
+        its vector stream (lap, self.draws) is hashed instead.
+
+        Returns:
+            str: Hex digest
+        """
+        last_lap_time = None if np.isnan(self.last_lap_time[i]) else float(self.last_lap_time[i])
+        return state_hash(
+            self._car_list[i].driver_number, int(self.lap[i]), float(self.progress[i]), float(self.lap_time[i]),
+            last_lap_time, float(self.fuel[i]), COMPOUNDS[self.compound[i]], int(self.tire_age[i]),
+            float(self.lap_variance[i]), bool(self.is_pitting[i]), float(self.pit_time_remaining[i]),
+            int(self.pit_stops[i]), bool(self.is_passing[i]), int(self.lap[i]), int(self.draws[i]),
+        )
+
+    def get_state_hash(self):
+        """
+        Hash of the whole field's state, including each car's stream position.
+
+        Returns:
+            str: Hex digest
+        """
+        order = sorted(range(len(self._car_list)), key=lambda i: self._car_list[i].driver_number)
+        return state_hash(self.race_time, *(self._car_state_hash(i) for i in order))
+
+    def is_race_finished(self):
+        """Check if the race is finished (without syncing Car objects)"""
+        return bool(self.lap[self.order[0]] > self.total_laps)
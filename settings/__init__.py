@@ -2,7 +2,8 @@
 Settings Package - Runtime configuration and persistence
 """
 from settings.runtime_config import RuntimeConfig, runtime_config
+from settings.race_settings import RaceSettings
 from settings.presets import PresetManager
 from settings.persistence import SettingsPersistence
 
-__all__ = ['RuntimeConfig', 'runtime_config', 'PresetManager', 'SettingsPersistence']
+__all__ = ['RuntimeConfig', 'runtime_config', 'RaceSettings', 'PresetManager', 'SettingsPersistence']
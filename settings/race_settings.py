@@ -0,0 +1,141 @@
+"""
+RaceSettings - Frozen snapshot of the race parameters for one engine
+
+RuntimeConfig is the process-wide, editable settings layer. A race takes a
+RaceSettings snapshot of it when the engine is created, so:
+- two races with different parameters can run in one process,
+- workers receive their settings as an argument instead of mutating globals,
+- the hot path reads plain attributes (per-compound tables are complete,
+  so no .get() defaults are needed per frame).
+
+Use replace() to derive a variant for parameter sweeps.
+"""
+from types import MappingProxyType
+
+import config
+
+COMPOUNDS = (config.TIRE_SOFT, config.TIRE_MEDIUM, config.TIRE_HARD)
+
+# Fallbacks used by the engine before snapshots existed (unknown compound/tier/synergy)
+DEFAULT_DEG_RATE = 0.002
+DEFAULT_CLIFF_LAP = 20
+DEFAULT_MODIFIER = 1.0
+
+# Scalar settings copied from RuntimeConfig.to_dict() (wheel_to_wheel is config.py only)
+SCALAR_FIELDS = (
+    "race_laps", "simulation_speed",
+    "tire_cliff_penalty", "max_tire_penalty",
+    "fuel_start_penalty", "fuel_burn_per_lap",
+    "pit_stop_base_time", "pit_stop_variance", "pit_speed_penalty", "pit_window_laps",
+    "pit_chance_after_cliff", "pit_chance_near_cliff", "last_laps_no_pit",
+    "lap_variance_base", "wheel_to_wheel",
+)
+
+# Dict settings (stored as read-only mappings)
+MAPPING_FIELDS = ("tire_deg_rates", "tire_cliff_laps", "tier_modifiers", "synergy_modifiers")
+
+
+class RaceSettings:
+    """Read-only race parameters (see module docstring)"""
+
+    __slots__ = SCALAR_FIELDS + MAPPING_FIELDS
+
+    def __init__(self, **values):
+        """
+        Args:
+            **values: Every name in SCALAR_FIELDS and MAPPING_FIELDS
+                      (use from_dict() to fill in defaults)
+        """
+        for name in SCALAR_FIELDS:
+            object.__setattr__(self, name, values[name])
+        for name in MAPPING_FIELDS:
+            object.__setattr__(self, name, MappingProxyType(dict(values[name])))
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Resolve a settings dict (e.g. RuntimeConfig.to_dict()) into a snapshot.
+
+        Missing values fall back to the config.py defaults, and the
+        per-compound tables are completed for every compound.
+
+        Args:
+            data: Dict of settings (extra keys such as display settings are ignored)
+
+        Returns:
+            RaceSettings: Snapshot
+        """
+        defaults = {
+            "race_laps": 20,
+            "simulation_speed": config.SIMULATION_SPEED_DEFAULT,
+            "tire_cliff_penalty": config.TIRE_CLIFF_PENALTY,
+            "max_tire_penalty": config.MAX_TIRE_PENALTY,
+            "fuel_start_penalty": config.FUEL_START_PENALTY,
+            "fuel_burn_per_lap": config.FUEL_BURN_PER_LAP,
+            "pit_stop_base_time": config.PIT_STOP_BASE_TIME,
+            "pit_stop_variance": config.PIT_STOP_VARIANCE,
+            "pit_speed_penalty": config.PIT_SPEED_PENALTY,
+            "pit_window_laps": config.PIT_WINDOW_LAPS,
+            "pit_chance_after_cliff": config.PIT_CHANCE_AFTER_CLIFF,
+            "pit_chance_near_cliff": config.PIT_CHANCE_NEAR_CLIFF,
+            "last_laps_no_pit": config.LAST_LAPS_NO_PIT,
+            "lap_variance_base": config.LAP_VARIANCE_BASE,
+            "wheel_to_wheel": config.WHEEL_TO_WHEEL,
+        }
+        values = {name: data.get(name, defaults[name]) for name in SCALAR_FIELDS}
+
+        deg_rates = data.get("tire_deg_rates", config.TIRE_DEG_RATES)
+        cliff_laps = data.get("tire_cliff_laps", config.TIRE_CLIFF_LAPS)
+        values["tire_deg_rates"] = {c: deg_rates.get(c, DEFAULT_DEG_RATE) for c in COMPOUNDS}
+        values["tire_cliff_laps"] = {c: cliff_laps.get(c, DEFAULT_CLIFF_LAP) for c in COMPOUNDS}
+        values["tier_modifiers"] = data.get("tier_modifiers", config.TIER_MODIFIERS)
+        values["synergy_modifiers"] = data.get("synergy_modifiers", config.SYNERGY_MODIFIERS)
+        return cls(**values)
+
+    @classmethod
+    def from_runtime_config(cls, rc=None):
+        """Snapshot the current RuntimeConfig (default: the global runtime_config)."""
+        if rc is None:
+            from settings.runtime_config import runtime_config as rc
+        return cls.from_dict(rc.to_dict())
+
+    def replace(self, **changes):
+        """
+        Copy with some values changed, e.g. settings.replace(race_laps=5).
+
+        Returns:
+            RaceSettings: New snapshot (this one is unchanged)
+        """
+        data = self.to_dict()
+        for name, value in changes.items():
+            if name not in data:
+                raise AttributeError(f"Unknown race setting: {name}")
+            data[name] = value
+        return RaceSettings.from_dict(data)
+
+    def to_dict(self):
+        """Plain dict of every setting (RuntimeConfig.to_dict() keys, minus display settings)."""
+        data = {name: getattr(self, name) for name in SCALAR_FIELDS}
+        data.update({name: dict(getattr(self, name)) for name in MAPPING_FIELDS})
+        return data
+
+    def tier_modifier(self, tier):
+        """Pace multiplier for a team tier."""
+        return self.tier_modifiers.get(tier, DEFAULT_MODIFIER)
+
+    def synergy_modifier(self, synergy_level):
+        """Pace multiplier for a driver-car synergy level."""
+        return self.synergy_modifiers.get(synergy_level, DEFAULT_MODIFIER)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("RaceSettings is read-only (use replace())")
+
+    def __delattr__(self, name):
+        raise AttributeError("RaceSettings is read-only")
+
+    def __reduce__(self):
+        """Pickle as a plain dict (read-only mappings can't be pickled directly)."""
+        return RaceSettings.from_dict, (self.to_dict(),)
+
+    def __eq__(self, other):
+        return isinstance(other, RaceSettings) and self.to_dict() == other.to_dict()
@@ -89,8 +89,8 @@ class RuntimeConfig:
             "fullscreen": self.fullscreen,
             "race_laps": self.race_laps,
             "simulation_speed": self.simulation_speed,
-            "tire_deg_rates": self.tire_deg_rates,
-            "tire_cliff_laps": self.tire_cliff_laps,
+            "tire_deg_rates": dict(self.tire_deg_rates),
+            "tire_cliff_laps": dict(self.tire_cliff_laps),
             "tire_cliff_penalty": self.tire_cliff_penalty,
             "max_tire_penalty": self.max_tire_penalty,
             "fuel_start_penalty": self.fuel_start_penalty,
@@ -102,8 +102,8 @@ class RuntimeConfig:
             "pit_chance_after_cliff": self.pit_chance_after_cliff,
             "pit_chance_near_cliff": self.pit_chance_near_cliff,
             "last_laps_no_pit": self.last_laps_no_pit,
-            "tier_modifiers": self.tier_modifiers,
-            "synergy_modifiers": self.synergy_modifiers,
+            "tier_modifiers": dict(self.tier_modifiers),
+            "synergy_modifiers": dict(self.synergy_modifiers),
             "lap_variance_base": self.lap_variance_base,
         }
     
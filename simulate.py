@@ -0,0 +1,118 @@
+"""
+F1 Manager - Headless Batch Simulator
+
+Runs many full races without opening a pygame window and exports the results.
+
+Usage:
+    python simulate.py --circuit monaco --runs 10000 --workers 8
+    python simulate.py --circuit spa --runs 500 --output spa.npz
+    python simulate.py --track tools/tracks/default_circuit.json --runs 100
+    python simulate.py --circuit monza --runs 1000 --backend vector --field-size 200
+    python simulate.py --circuit monaco --runs 100000 --backend event
+
+Results are written as CSV (one row per car per race) or as a NumPy .npz
+archive, chosen by the output file extension.
+"""
+import os
+import sys
+import time
+import argparse
+
+from race.batch import run_batch, write_csv, write_npz
+from race.track_loader import load_track_with_decorations
+from data.circuits import CIRCUITS
+import config
+from settings.runtime_config import runtime_config
+from settings.race_settings import RaceSettings
+from settings.persistence import SettingsPersistence
+
+
+def main():
+    """Entry point"""
+    parser = argparse.ArgumentParser(
+        description='Run headless F1 Manager races in batch',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+Examples:
+  python simulate.py --circuit monaco --runs 10000 --workers 8
+      Simulate 10,000 Monaco races on 8 worker processes (writes CSV)
+
+  python simulate.py --circuit monza --runs 200 --laps 53 --output monza.npz
+      Simulate 200 full-length Monza races and save a NumPy archive
+'''
+    )
+    parser.add_argument('--circuit', '-c', choices=sorted(CIRCUITS.keys()),
+                        help='Real F1 circuit ID (default: built-in default circuit)')
+    parser.add_argument('--track', '-t', metavar='PATH',
+                        help='Custom track JSON file (overrides --circuit)')
+    parser.add_argument('--runs', '-n', type=int, default=100,
+                        help='Number of races to simulate (default: 100)')
+    parser.add_argument('--workers', '-w', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--seed', '-s', type=int,
+                        help='Base random seed; race i uses seed + i (default: random)')
+    parser.add_argument('--laps', '-l', type=int,
+                        help='Race distance in laps (default: saved settings)')
+    parser.add_argument('--backend', '-b', choices=config.ENGINE_BACKENDS, default=config.ENGINE_BACKEND,
+                        help=f'Simulation backend (default: {config.ENGINE_BACKEND})')
+    parser.add_argument('--field-size', type=int,
+                        help='Number of cars (default: full grid)')
+    parser.add_argument('--output', '-o', metavar='PATH',
+                        help='Output file, .csv or .npz (default: results_<track>.csv)')
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    # Use the same gameplay settings as the game
+    SettingsPersistence.load(runtime_config)
+    settings = RaceSettings.from_runtime_config()
+    if args.laps:
+        settings = settings.replace(race_laps=args.laps)
+
+    waypoints, decorations = None, None
+    track_name = args.circuit or "default"
+    if args.track:
+        waypoints, decorations = load_track_with_decorations(args.track)
+        if waypoints is None:
+            print(f"Error: Could not load track from {args.track}")
+            sys.exit(1)
+        track_name = os.path.splitext(os.path.basename(args.track))[0]
+
+    output = args.output or f"results_{track_name}.csv"
+    if not output.endswith(('.csv', '.npz')):
+        parser.error("--output must end in .csv or .npz")
+
+    print(f"Simulating {args.runs} race(s) on {track_name} "
+          f"({settings.race_laps} laps, {args.workers} worker(s))...")
+
+    def report(done, total):
+        # Print roughly 20 progress updates over the whole batch
+        if done == total or done % max(1, total // 20) == 0:
+            print(f"  [{done}/{total}]")
+
+    start = time.perf_counter()
+    results = run_batch(
+        circuit_id=None if args.track else args.circuit,
+        runs=args.runs,
+        workers=args.workers,
+        seed=args.seed,
+        waypoints=waypoints,
+        decorations=decorations,
+        backend=args.backend,
+        field_size=args.field_size,
+        settings=settings,
+        progress_callback=report,
+    )
+    elapsed = time.perf_counter() - start
+
+    if output.endswith('.npz'):
+        write_npz(results, output)
+    else:
+        write_csv(results, output)
+
+    print(f"Done in {elapsed:.1f}s ({args.runs / elapsed:.2f} races/s). Results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ Usage:
     python tests/test_game.py persistence
     python tests/test_game.py race
     python tests/test_game.py integration
+    python tests/test_game.py batch
     python tests/test_game.py pygame
 
 Exit codes:
@@ -398,7 +399,59 @@ def test_race(result):
         max_pace = config.BASE_SPEED * 1.5
         assert min_pace < pace < max_pace, f"Pace {pace} outside reasonable bounds [{min_pace}, {max_pace}]"
     run_test(result, "Car calculates valid pace", test_car_pace_calculation)
-    
+
+    # Test: Cached pace follows changes to the car's state
+    def test_pace_cache_car_state():
+        reset_runtime_config()
+        from race.race_engine import RaceEngine
+        engine = RaceEngine()
+        car = engine.cars[0]
+
+        fresh = car._calculate_current_pace()
+        car.tire_age = 15
+        worn = car._calculate_current_pace()
+        assert worn < fresh, f"Worn tires should be slower ({worn} vs {fresh})"
+        car.tire_age = 0
+        assert car._calculate_current_pace() == fresh, "Pace should return to the fresh-tire value"
+    run_test(result, "Pace cache invalidates on car state changes", test_pace_cache_car_state)
+
+    # Test: A running race keeps its settings snapshot when runtime_config is edited
+    def test_engine_settings_snapshot():
+        rc = reset_runtime_config()
+        import pickle
+        from race.race_engine import RaceEngine
+        from settings.race_settings import RaceSettings
+        engine = RaceEngine()
+        car = engine.cars[0]
+
+        # Edits to the global settings apply to the next race, not this one
+        before = car._calculate_current_pace()
+        rc.tier_modifiers[car.team_tier] *= 1.1
+        assert car._calculate_current_pace() == before, "Running race picked up a settings edit"
+        same = next(c for c in RaceEngine().cars if c.driver_number == car.driver_number)
+        after = same._calculate_current_pace()
+        assert abs(after / before - 1.1) < 1e-9, f"Tier change not applied ({before} -> {after})"
+        rc.race_laps = 7
+        assert engine.total_laps != 7, "Running race picked up a new lap count"
+        assert RaceEngine().total_laps == 7, "New race should use the edited lap count"
+
+        # Two races with different settings side by side
+        no_fuel = engine.settings.replace(fuel_start_penalty=0.0)
+        other = RaceEngine(settings=no_fuel)
+        same = next(c for c in other.cars if c.driver_number == car.driver_number)
+        assert same._calculate_current_pace() > before, "Fuel penalty change not applied"
+        assert car._calculate_current_pace() == before, "Other race's settings leaked"
+
+        # Read-only and picklable (sent to batch workers)
+        try:
+            engine.settings.race_laps = 3
+            assert False, "RaceSettings should be read-only"
+        except AttributeError:
+            pass
+        assert pickle.loads(pickle.dumps(no_fuel)) == no_fuel, "Settings should survive pickling"
+        assert no_fuel == RaceSettings.from_dict(no_fuel.to_dict())
+    run_test(result, "Each engine uses a frozen settings snapshot", test_engine_settings_snapshot)
+
     # Test: RaceEngine update() doesn't crash
     def test_race_engine_update():
         reset_runtime_config()
@@ -438,6 +491,602 @@ def test_race(result):
         engine.cars[0].lap = engine.total_laps + 1
         assert engine.is_race_finished(), "Race should be finished when leader completes all laps"
     run_test(result, "Race finished detection", test_race_finished)
+    
+    # Test: field_size builds a larger grid with unique drivers
+    def test_field_size():
+        reset_runtime_config()
+        from race.race_engine import RaceEngine
+        engine = RaceEngine(field_size=50)
+        assert len(engine.cars) == 50, f"Expected 50 cars, got {len(engine.cars)}"
+        numbers = set(car.driver_number for car in engine.cars)
+        assert len(numbers) == 50, "Every car should have a unique driver number"
+    run_test(result, "field_size builds a larger grid", test_field_size)
+
+    # Test: Incremental ordering keeps the field sorted and logs overtakes
+    def test_incremental_order_overtakes():
+        import random
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        random.seed(7)
+        from race.race_engine import RaceEngine
+        engine = RaceEngine()
+        engine.start_race()
+        while not engine.is_race_finished():
+            engine.step()
+            totals = [car.get_total_progress() for car in engine.cars]
+            assert totals == sorted(totals, reverse=True), "Field out of order"
+        assert engine.overtakes, "A 3-lap race should have at least one overtake"
+        for overtake in engine.overtakes:
+            assert overtake["driver_number"] != overtake["passed_number"]
+            assert 1 <= overtake["position"] < len(engine.cars)
+        moved = [car for car in engine.cars if car.position_change_time is not None]
+        assert moved and all(car.position_change != 0 for car in moved)
+    run_test(result, "Incremental ordering logs overtakes", test_incremental_order_overtakes)
+
+    # Test: 20x speed is bit-identical to 1x (fixed timestep)
+    def test_fixed_timestep_speed_identical():
+        import random
+        rc = reset_runtime_config()
+        rc.race_laps = 1
+        from race.race_engine import RaceEngine
+        
+        def run(speed):
+            random.seed(1234)
+            engine = RaceEngine(circuit_id="monza")
+            engine.set_simulation_speed(speed)
+            engine.start_race()
+            while not engine.is_race_finished():
+                engine.update()
+            return [(c.driver_short, c.progress, c.lap, c.tire_compound) for c in engine.cars], engine.race_time
+        
+        assert run(1) == run(20), "Race at 20x should be identical to 1x"
+    run_test(result, "20x speed is bit-identical to 1x", test_fixed_timestep_speed_identical)
+    
+    # Test: Substep budget limits work per frame and carries the backlog
+    def test_substep_budget():
+        reset_runtime_config()
+        from race.race_engine import RaceEngine
+        engine = RaceEngine()
+        engine.set_simulation_speed(50)
+        engine.start_race()
+        steps = engine.update()
+        assert steps == engine.max_substeps, f"Expected {engine.max_substeps} substeps, got {steps}"
+        assert engine.is_behind(), "Engine should report a backlog at turbo speed"
+        engine.update(elapsed_frames=0)
+        engine.update(elapsed_frames=0)
+        assert not engine.is_behind(), "Backlog should drain with extra updates"
+    run_test(result, "Substep budget carries the backlog", test_substep_budget)
+    
+    # Test: Vector backend keeps the RaceEngine API
+    def test_vector_engine_api():
+        rc = reset_runtime_config()
+        rc.race_laps = 1
+        from race.race_engine import create_race_engine
+        engine = create_race_engine("vector", field_size=200)
+        engine.start_race()
+        while not engine.is_race_finished():
+            engine.update()
+        cars = engine.get_cars_by_position()
+        assert len(cars) == 200, f"Expected 200 cars, got {len(cars)}"
+        assert [car.position for car in cars] == list(range(1, 201)), "Cars should be ordered by position"
+        assert cars[0].lap == 2 and cars[0].total_laps == 1, "Leader should have completed the race"
+        assert cars[0] is engine.get_leader(), "get_leader() should return P1"
+        assert cars[1].gap_to_leader_time > 0, "P2 should have a positive gap"
+    run_test(result, "Vector backend keeps the RaceEngine API", test_vector_engine_api)
+    
+    # Test: Event backend runs a race to the flag
+    def test_event_engine_run_to_finish():
+        rc = reset_runtime_config()
+        rc.race_laps = 5
+        from race.race_engine import create_race_engine
+        engine = create_race_engine("event", circuit_id="silverstone")
+        engine.start_race()
+        engine.run_to_finish()
+        assert engine.is_race_finished(), "Race should be finished"
+        leader = engine.get_leader()
+        assert leader.total_laps == 5, f"Leader should complete 5 laps, got {leader.total_laps}"
+        assert len(leader.lap_times) == 5, "Leader should have 5 lap times"
+        assert all(car.total_laps >= 3 for car in engine.cars), "Whole field should be near the finish"
+    run_test(result, "Event backend runs a race to the flag", test_event_engine_run_to_finish)
+    
+    # Test: Event backend can be stepped frame by frame for rendering
+    def test_event_engine_step():
+        reset_runtime_config()
+        from race.race_engine import create_race_engine
+        engine = create_race_engine("event")
+        engine.start_race()
+        for _ in range(600):
+            engine.update()
+        assert abs(engine.race_time - 10.0) < 1e-6, f"Expected 10s of race time, got {engine.race_time}"
+        positions = [car.position for car in engine.cars]
+        assert positions == list(range(1, 21)), "Cars should be ordered by position"
+        assert engine.cars[0].progress > 0, "Leader should have moved"
+    run_test(result, "Event backend can be stepped for rendering", test_event_engine_step)
+
+    # Test: Compiled track geometry matches the waypoints and is cached
+    def test_track_geometry():
+        import math
+        from race.track import Track
+        track = Track(circuit_id="monaco")
+        geometry = track.geometry
+        assert track.get_position(0.0) == tuple(map(float, track.waypoints[0]))
+        assert track.get_track_boundaries()[0] is track.get_track_boundaries()[0], "Boundaries should be cached"
+        # A zero offset is on the racing line, a 10px offset is 10px away from it
+        for progress in (0.1, 0.37, 0.8):
+            x, y = track.get_position(progress)
+            ox, oy = track.get_offset_position(progress, 10)
+            assert abs(math.dist((x, y), (ox, oy)) - 10) < 1e-9
+        assert abs(geometry.total_length - geometry.cum_length[-1]) < 1e-9
+        assert geometry.total_length > 0
+    run_test(result, "Track geometry tables are compiled once", test_track_geometry)
+
+    # Test: Batch position query matches single queries
+    def test_track_geometry_batch():
+        from race.track import Track
+        track = Track(circuit_id="spa")
+        progresses = [i / 97 for i in range(-5, 100)]
+        xs, ys = track.get_offset_positions(progresses, 15)
+        for k, progress in enumerate(progresses):
+            x, y = track.get_offset_position(progress, 15)
+            assert abs(xs[k] - x) < 1e-9 and abs(ys[k] - y) < 1e-9, f"Mismatch at {progress}"
+    run_test(result, "Track geometry batch query matches single queries", test_track_geometry_batch)
+
+    # Test: Progress is uniform in distance, not in waypoint count
+    def test_arc_length_progress():
+        import math
+        from race.track import Track
+        # 400x400 square, one side digitised with 8 extra points
+        dense_side = [(100 + 50 * i, 100) for i in range(8)]
+        waypoints = dense_side + [(500, 100), (500, 500), (100, 500)]
+        track = Track(waypoints=waypoints)
+        assert track.get_position(0.25) == (500.0, 100.0), "Quarter distance is the first corner"
+        assert track.get_position(0.5) == (500.0, 500.0)
+        # Equal progress steps cover equal distances
+        step = 1 / 64
+        for k in range(63):
+            d = math.dist(track.get_position(k * step), track.get_position((k + 1) * step))
+            assert abs(d - 1600 * step) < 1e-6 or d < 1600 * step, f"Uneven step at {k}: {d}"
+        assert abs(track.track_length - 1600 / 60.0) < 1e-9
+    run_test(result, "Progress is arc-length uniform", test_arc_length_progress)
+
+    # Test: Real circuits use real length; DRS zones still cover the same waypoints
+    def test_arc_length_circuits():
+        import config
+        from race.track import Track
+        from data.circuits import get_circuit_by_id
+        track = Track(circuit_id="monza")
+        circuit = get_circuit_by_id("monza")
+        assert track.track_length == circuit["length_km"] * config.TRACK_UNITS_PER_KM
+        n = len(track.waypoints)
+        for zone, authored in zip(track.get_drs_zones(), circuit["drs_zones"]):
+            for key in ("start", "end"):
+                index = authored[key] * n
+                i, t = int(index) % n, index - int(index)
+                (x1, y1), (x2, y2) = track.waypoints[i], track.waypoints[(i + 1) % n]
+                x, y = track.get_position(zone[key])
+                assert abs(x - (x1 + (x2 - x1) * t)) < 1e-6 and abs(y - (y1 + (y2 - y1) * t)) < 1e-6, f"DRS {key} moved"
+    run_test(result, "Circuits use real length and converted DRS zones", test_arc_length_circuits)
+
+    # Test: Zone index agrees with the zone definitions
+    def test_zone_index():
+        from race.track import Track
+        from race.track_zones import ZONE_DRS, ZONE_KERB_LEFT, ZONE_GRAVEL_RIGHT
+        waypoints = [(100 + 40 * i, 100) for i in range(10)] + [(500, 400), (100, 400)]
+        decorations = {
+            'kerbs': [{'boundary': 'left', 'start': 2, 'end': 4}],
+            'gravel': [{'boundary': 'right', 'start': 11, 'end': 1}],  # Wraps the line
+        }
+        track = Track(waypoints=waypoints, decorations=decorations, circuit_id=None)
+        geometry = track.geometry
+        assert track.get_zone_flags(geometry.waypoint_progress(3)) & ZONE_KERB_LEFT
+        assert not track.get_zone_flags(geometry.waypoint_progress(5)) & ZONE_KERB_LEFT
+        assert track.get_zone_flags(0.0) & ZONE_GRAVEL_RIGHT, "Wrapping range should cover the line"
+        assert track.get_zone_flags(geometry.waypoint_progress(11.5)) & ZONE_GRAVEL_RIGHT
+        assert not track.get_zone_flags(0.5) & ZONE_DRS
+
+        monza = Track(circuit_id="monza")
+        for k in range(1000):
+            progress = k / 1000
+            expected = any(zone["start"] <= progress < zone["end"] for zone in monza.get_drs_zones())
+            assert monza.is_in_drs_zone(progress) == expected, f"DRS mismatch at {progress}"
+        flags, sectors = monza.zones.flags_for([k / 1000 for k in range(1000)])
+        for k in range(1000):
+            assert bool(flags[k] & ZONE_DRS) == monza.is_in_drs_zone(k / 1000)
+        assert [monza.get_sector(p) for p in (0.0, 0.34, 0.99)] == [0, 1, 2]
+    run_test(result, "Zone index matches DRS zones, decorations and sectors", test_zone_index)
+
+    # Test: Replay file round-trips engine state and seeks by lap
+    def test_replay_round_trip():
+        import os
+        import tempfile
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        from race.race_engine import RaceEngine
+        from race.replay import ReplayRecorder, ReplayReader, ReplayPlayer
+
+        engine = RaceEngine(circuit_id="monza", seed=11)
+        fd, path = tempfile.mkstemp(suffix=".f1r")
+        os.close(fd)
+        try:
+            recorder = ReplayRecorder(path, engine, record_interval=2, block_frames=64)
+            engine.recorder = recorder
+            engine.start_race()
+            engine.set_simulation_speed(50)
+            while engine.cars[0].lap < 3:
+                engine.update(1.0)
+            recorder.close()
+
+            reader = ReplayReader(path)
+            assert reader.frame_count == recorder.frame_count > 64, "Should span several blocks"
+            assert sorted(reader.keyframes) == [1, 2, 3]
+            last = reader.read_frame(reader.frame_count - 1)
+            assert last["race_time"] == engine.race_time
+            grid = sorted(engine.cars, key=lambda c: c.starting_position)
+            assert last["lap"] == [car.lap for car in grid]
+            assert all(abs(p - car.progress) < 1e-5 for p, car in zip(last["progress"], grid))
+            reader.close()
+
+            player = ReplayPlayer(path)
+            player.seek_lap(2)
+            assert player.current_lap() == 2
+            assert [car.position for car in player.cars] == list(range(1, len(player.cars) + 1))
+            player.seek_frame(player.reader.frame_count - 1)
+            assert player.is_race_finished()
+            order = [car.driver_number for car in player.get_cars_by_position()]
+            assert order == [car.driver_number for car in engine.get_cars_by_position()]
+            # Time gaps are the timing-loop gaps the live tower showed
+            for shown, live in zip(player.get_cars_by_position(), engine.get_cars_by_position()):
+                assert abs(shown.gap_to_leader_time - live.gap_to_leader_time) < 1e-3
+                assert abs(shown.gap_to_ahead_time - live.gap_to_ahead_time) < 1e-3
+            player.close()
+        finally:
+            os.remove(path)
+    run_test(result, "Replay file round-trips state and seeks by lap", test_replay_round_trip)
+
+    # Test: Replay names stay unique and old recordings are pruned
+    def test_replay_directory():
+        import os
+        import tempfile
+        from race.replay import new_replay_path, prune_replays
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for i in range(4):
+                path = new_replay_path(directory, now=1_700_000_000)
+                assert path not in paths, "Restarts within a second must not overwrite a recording"
+                open(path, "wb").close()
+                os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+                paths.append(path)
+            prune_replays(directory, max_files=2, keep=paths[0])
+            assert sorted(os.listdir(directory)) == sorted(os.path.basename(p) for p in (paths[0], paths[3])), \
+                "Oldest recordings should go first, except the one kept"
+    run_test(result, "Replay directory keeps unique names and is pruned", test_replay_directory)
+
+    # Test: Rewinding to a lap checkpoint and resuming reproduces the race
+    def test_checkpoint_rewind():
+        rc = reset_runtime_config()
+        rc.race_laps = 5
+        from race.race_engine import RaceEngine
+
+        def run(rewind_at=None):
+            engine = RaceEngine(circuit_id="monza", seed=21)
+            engine.start_race()
+            engine.set_simulation_speed(50)
+            rewound = None
+            while not engine.is_race_finished():
+                engine.update(1.0)
+                if rewind_at and rewound is None and engine.leader_lap() >= rewind_at:
+                    rewound = engine.rewind_to_lap(2)
+            return engine, rewound
+
+        original, _ = run()
+        resumed, rewound = run(rewind_at=4)
+        assert rewound == 2
+        assert resumed.get_state_hash() == original.get_state_hash(), "Resumed race should match the original"
+        assert len(resumed.overtakes) == len(original.overtakes)
+        assert original.checkpoints.laps() == [1, 2, 3, 4, 5]
+        per_lap = original.checkpoints.get(3).nbytes
+        # Car records (~3 KB) plus a lap of timing loop crossings (~4 KB)
+        assert per_lap < 8000, f"Checkpoint should be a few KB, got {per_lap} bytes"
+    run_test(result, "Lap checkpoints rewind and resume exactly", test_checkpoint_rewind)
+
+    # Test: Fast-forward stops at the target lap and matches a normal run
+    def test_fast_forward():
+        rc = reset_runtime_config()
+        rc.race_laps = 4
+        from race.race_engine import RaceEngine
+
+        normal = RaceEngine(circuit_id="monza", seed=8)
+        normal.start_race()
+        while not normal.is_race_finished():
+            normal.update(1.0)
+
+        engine = RaceEngine(circuit_id="monza", seed=8)
+        engine.start_race()
+        assert engine.fast_forward(time_budget=0) is False, "Zero budget should return straight away"
+        assert engine.race_time == 0
+        assert engine.fast_forward(target_lap=3) is True
+        assert engine.leader_lap() == 3 and not engine.is_race_finished()
+        while not engine.fast_forward(time_budget=0.01):
+            pass
+        assert engine.is_race_finished()
+        assert engine.get_state_hash() == normal.get_state_hash(), "Fast-forward should match a rendered race"
+    run_test(result, "Fast-forward stops at the target lap", test_fast_forward)
+
+    # Test: The sim thread publishes snapshots and matches a direct run
+    def test_simulation_thread():
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        import time
+        from race.race_engine import RaceEngine
+        from race.sim_thread import RaceView, SimulationThread
+
+        direct = RaceEngine(circuit_id="monza", seed=4)
+        direct.start_race()
+        direct.run_to_finish()
+
+        engine = RaceEngine(circuit_id="monza", seed=4)
+        sim = SimulationThread(engine)
+        view = RaceView(engine, sim.buffer, sim.events, sim.watch_events)
+        finishes = view.events.collect(kinds=["race_finished"])
+        sim.start()
+        try:
+            view.refresh()
+            assert not view.race_started and view.get_race_status() == "READY"
+            first = view.snapshot
+            sim.set_simulation_speed(50)
+            sim.start_race()
+            sim.fast_forward(target_lap=2)
+            deadline = time.time() + 60
+            while sim.fast_forwarding and time.time() < deadline:
+                time.sleep(0.01)
+            view.refresh()
+            assert view.leader_lap() == 2, f"Fast-forward should stop on lap 2, got {view.leader_lap()}"
+            assert first.race_time == 0.0, "Published snapshots must not change"
+            while not view.is_race_finished() and time.time() < deadline:
+                time.sleep(0.01)
+                view.refresh()
+            assert view.is_race_finished(), "Race should finish on the sim thread"
+            assert view.simulation_speed == 50
+            assert len(finishes.drain()) == 1, "RACE_FINISHED should reach the view's subscribers"
+        finally:
+            sim.stop()
+        assert engine.get_state_hash() == direct.get_state_hash(), "Threaded race should match a direct run"
+        order = [car.driver_number for car in view.get_cars_by_position()]
+        assert order == [car.driver_number for car in engine.get_cars_by_position()]
+    run_test(result, "Sim thread publishes snapshots of the race", test_simulation_thread)
+
+    # Test: The engine only detects events while the view has subscribers
+    def test_sim_thread_event_subscription():
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        import time
+        from race.race_engine import RaceEngine
+        from race.sim_thread import RaceView, SimulationThread
+
+        def wait_for(condition):
+            deadline = time.time() + 10
+            while not condition() and time.time() < deadline:
+                time.sleep(0.01)
+                view.refresh()
+            return condition()
+
+        engine = RaceEngine(circuit_id="monza", seed=4)
+        sim = SimulationThread(engine)
+        view = RaceView(engine, sim.buffer, sim.events, sim.watch_events)
+        sim.start()
+        try:
+            sim.set_simulation_speed(50)
+            sim.start_race()
+            assert wait_for(lambda: view.race_time > 10.0), "Race should run on the sim thread"
+            assert not engine.events, "A race with no view subscribers should not detect events"
+
+            laps = view.events.collect(kinds=["lap_completed"])
+            assert wait_for(lambda: len(laps) > 0), "Subscribing on the view should subscribe the engine"
+            assert engine.events.wants("lap_completed") and not engine.events.wants("overtake"), \
+                "The engine should only be subscribed to the kinds the view wants"
+            laps.cancel()
+            assert wait_for(lambda: not engine.events), "The last view unsubscribe should unsubscribe the engine"
+        finally:
+            sim.stop()
+    run_test(result, "Sim thread only collects events the view listens to", test_sim_thread_event_subscription)
+
+    # Test: A paused sim thread idles even with a backlog left to simulate
+    def test_sim_thread_idles_when_paused():
+        reset_runtime_config()
+        import time
+        import config
+        from race.race_engine import RaceEngine
+        from race.sim_thread import SimulationThread
+
+        engine = RaceEngine(circuit_id="monza", seed=4)
+        engine.start_race()
+        sim = SimulationThread(engine)
+        sim._paused = True
+        engine.frame_accumulator = 100 * engine.timestep
+        assert engine.is_behind()
+        loops = []
+        apply_commands = sim._apply_commands
+        sim._apply_commands = lambda: loops.append(1) or apply_commands()
+        sim.start()
+        try:
+            time.sleep(0.2)
+        finally:
+            sim.stop()
+        limit = 2 * 0.2 / config.SIM_THREAD_IDLE_SLEEP
+        assert len(loops) < limit, f"Paused sim thread should sleep, ran {len(loops)} loops in 0.2 s"
+    run_test(result, "Paused sim thread idles with a backlog", test_sim_thread_idles_when_paused)
+
+    # Test: A low tick rate keeps lap times exact; views interpolate between ticks
+    def test_low_tick_rate():
+        rc = reset_runtime_config()
+        rc.race_laps = 2
+        from race.race_engine import RaceEngine
+        from race.replay import ReplayCar
+
+        from settings.race_settings import RaceSettings
+        # Cars racing each other are held up step by step, so compare them driving alone
+        alone = RaceSettings.from_runtime_config().replace(wheel_to_wheel=False)
+        fine = RaceEngine(circuit_id="monza", seed=3, settings=alone)
+        coarse = RaceEngine(circuit_id="monza", seed=3, tick_rate=20, settings=alone)
+        assert coarse.timestep == 3 * fine.timestep
+        for engine in (fine, coarse):
+            engine.start_race()
+            engine.run_to_finish()
+        for a, b in zip(sorted(fine.cars, key=lambda c: c.driver_number),
+                        sorted(coarse.cars, key=lambda c: c.driver_number)):
+            # Lap 1 runs the same pace at either rate, so only the crossing timing could differ
+            assert abs(a.lap_times[0] - b.lap_times[0]) < 1e-6, \
+                f"{a.driver_short}: {a.lap_times[0]} vs {b.lap_times[0]} at 20 Hz"
+
+        car = ReplayCar({"driver_number": 1, "driver_name": "A", "driver_short": "AAA",
+                         "team": "Ferrari", "team_tier": "A"}, 1)
+        car.interpolate(0.9, 0, 1.3, 4, 0.5)  # Crossing the line between two ticks
+        assert abs(car.display_progress - 0.1) < 1e-9 and car.display_offset == 2
+    run_test(result, "Low tick rate keeps lap times exact", test_low_tick_rate)
+
+    # Test: Time gaps are differences of timing-loop crossing times
+    def test_timing_loop_gaps():
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        import config
+        from race.race_engine import RaceEngine, create_race_engine
+        engine = RaceEngine(circuit_id="monza", seed=5)
+        timing = engine.timing
+        assert timing.per_lap == 3 * config.MINI_SECTORS_PER_SECTOR and timing.loops[0] == 0.0
+        engine.start_race()
+        while engine.leader_lap() < 3:
+            engine.step()
+        cars = engine.get_cars_by_position()
+        leader = timing.index[cars[0].driver_number]
+        for car in cars[1:]:
+            i = timing.index[car.driver_number]
+            k = timing.next_loop[i] - 1  # Loop this car crossed last
+            t = timing.crossing_time(i, k)
+            expected = t - timing.crossing_time(leader, k)
+            assert abs(car.gap_to_leader_time - expected) < 1e-9, \
+                f"{car.driver_short}: {car.gap_to_leader_time} vs {expected}"
+
+        vector = create_race_engine("vector", circuit_id="monza", seed=5)
+        vector.start_race()
+        while vector.leader_lap() < 3:
+            vector.step()
+        gaps = [car.gap_to_leader_time for car in vector.get_cars_by_position()]
+        assert gaps[0] == 0.0 and all(0.0 <= gap < 60.0 for gap in gaps[1:]), gaps
+    run_test(result, "Time gaps come from timing-loop crossings", test_timing_loop_gaps)
+
+    # Test: Engines publish race events to subscribers
+    def test_race_events():
+        rc = reset_runtime_config()
+        rc.race_laps = 4
+        from race.race_engine import RaceEngine, create_race_engine
+        from race import events as ev
+
+        quiet = RaceEngine(circuit_id="monza", seed=6)
+        engine = RaceEngine(circuit_id="monza", seed=6)
+        everything = engine.events.collect()
+        watched = engine.cars[0]
+        one_driver = engine.events.collect(kinds=[ev.LAP_COMPLETED], drivers=[watched.driver_number])
+        for race in (quiet, engine):
+            race.start_race()
+            race.run_to_finish()
+        assert quiet.get_state_hash() == engine.get_state_hash(), "Subscribing changed the race"
+
+        events = everything.drain()
+        kinds = [event.kind for event in events]
+        laps = sum(len(car.lap_times) for car in engine.cars)
+        assert kinds.count(ev.LAP_COMPLETED) == laps, f"{kinds.count(ev.LAP_COMPLETED)} laps vs {laps}"
+        assert kinds.count(ev.OVERTAKE) == len(engine.overtakes)
+        assert kinds.count(ev.PIT_IN) == sum(car.pit_stops for car in engine.cars)
+        assert kinds.count(ev.RACE_FINISHED) == 1
+        assert events[kinds.index(ev.RACE_FINISHED)].data["winner"] == engine.get_leader().driver_number
+        fastest = [event.data["lap_time"] for event in events if event.kind == ev.FASTEST_LAP]
+        assert fastest == sorted(fastest, reverse=True)
+        assert fastest[-1] == min(t for car in engine.cars for t in car.lap_times)
+        assert len(one_driver.drain()) == len(watched.lap_times) and len(everything) == 0
+
+        vector = create_race_engine("vector", circuit_id="monza", seed=6)
+        laps_done = vector.events.collect(kinds=[ev.LAP_COMPLETED, ev.RACE_FINISHED])
+        vector.start_race()
+        vector.run_to_finish()
+        kinds = [event.kind for event in laps_done.drain()]
+        assert kinds.count(ev.LAP_COMPLETED) == sum(len(car.lap_times) for car in vector.cars)
+        assert kinds.count(ev.RACE_FINISHED) == 1
+    run_test(result, "Engines publish race events to subscribers", test_race_events)
+
+    # Test: Cars lose pace in dirty air and are held up until a pass sticks
+    def test_wheel_to_wheel():
+        rc = reset_runtime_config()
+        import config
+        from race.race_engine import RaceEngine
+        engine = RaceEngine(circuit_id="monaco", seed=7)
+        track = engine.track
+        assert track.get_overtaking_multiplier() == config.OVERTAKING_DIFFICULTY["very_high"]
+        ahead, car = engine.cars[0], engine.cars[1]
+        ahead.current_pace = 2.0
+        pace = 2.2
+        seconds = track.track_length / (pace * config.FPS)  # Progress covered per second
+
+        def place(gap):
+            ahead.progress = 0.5
+            car.progress = 0.5 - gap / seconds
+
+        place(config.DIRTY_AIR_GAP + 0.1)
+        assert car._race_car_ahead(ahead, pace, track, 1.0) == pace, "No dirty air out of range"
+        place(1.0)
+        assert car._race_car_ahead(ahead, pace, track, 1.0) < pace, "Dirty air should cost pace"
+        place(config.FOLLOW_GAP / 2)
+        draws = car.rng.draws
+        held = sum(car._race_car_ahead(ahead, pace, track, 1.0) == ahead.current_pace for _ in range(30))
+        assert held >= 29 and car.rng.draws > draws, "A faster car should be held up while it tries to pass"
+        car.is_passing = True
+        assert car._race_car_ahead(ahead, pace, track, 1.0) > ahead.current_pace, "A pass that stuck goes through"
+        place(config.DIRTY_AIR_GAP + 0.1)
+        car._race_car_ahead(ahead, pace, track, 1.0)
+        assert not car.is_passing, "Dropping back ends the pass"
+
+        # Passes stick sooner on an easy track and with better racecraft
+        def steps_to_pass(circuit, racecraft):
+            engine = RaceEngine(circuit_id=circuit, seed=7)
+            ahead, car = engine.cars[0], engine.cars[1]
+            ahead.driver_racecraft, car.driver_racecraft = 3, racecraft
+            ahead.current_pace, ahead.progress = 2.0, 0.5
+            car.progress = 0.5 - (config.FOLLOW_GAP / 2) / (engine.track.track_length / (pace * config.FPS))
+            total = 0
+            for _ in range(50):
+                steps = 0
+                car.is_passing = False
+                while not car.is_passing:
+                    car._race_car_ahead(ahead, pace, engine.track, 1.0)
+                    steps += 1
+                total += steps
+            return total
+        assert steps_to_pass("monza", 3) < steps_to_pass("monaco", 3), "Monaco should be harder to pass at"
+        assert steps_to_pass("monza", 5) < steps_to_pass("monza", 1), "Racecraft should help passes stick"
+    run_test(result, "Cars race the car ahead wheel to wheel", test_wheel_to_wheel)
+
+    # Test: Slotted cars round-trip through to_bytes/from_bytes and pickle
+    def test_car_bytes_round_trip():
+        import pickle
+        rc = reset_runtime_config()
+        rc.race_laps = 5
+        from race.race_engine import RaceEngine
+        from race.car import Car
+        engine = RaceEngine(circuit_id="monza", seed=4)
+        engine.start_race()
+        while engine.leader_lap() < 3:
+            engine.step()
+        car = engine.cars[5]
+        assert not hasattr(car, "__dict__"), "Car should use __slots__"
+        for copy in (Car.from_bytes(car.to_bytes()), pickle.loads(pickle.dumps(car))):
+            assert all(hasattr(copy, name) for name in Car.__slots__)
+            assert copy.get_state_hash() == car.get_state_hash()
+            assert copy.lap_times == car.lap_times and copy.lap_hashes == car.lap_hashes
+            assert copy._calculate_current_pace() == car._calculate_current_pace()
+        copy = Car.from_bytes(car.to_bytes())
+        assert [copy.rng.random() for _ in range(10)] == [car.rng.random() for _ in range(10)]
+        assert len(car.to_bytes()) < 300
+    run_test(result, "Car state round-trips through bytes and pickle", test_car_bytes_round_trip)
 
 
 # =============================================================================
@@ -539,6 +1188,122 @@ def test_integration(result):
     run_test(result, "Changing runtime_config affects new RaceEngine", test_config_change_affects_new_engine)
 
 
+# =============================================================================
+# TEST SUITE: Batch Simulation
+# =============================================================================
+
+def test_batch(result):
+    """Test headless batch race simulation."""
+    print("\n--- Batch Simulation Tests ---")
+    
+    # Test: simulate_race() runs a race to the flag
+    def test_simulate_race_finishes():
+        rc = reset_runtime_config()
+        rc.race_laps = 2
+        from race.batch import simulate_race
+        summary = simulate_race(seed=1)
+        assert len(summary["cars"]) == 20, f"Expected 20 cars, got {len(summary['cars'])}"
+        winner = summary["cars"][0]
+        assert winner["laps_completed"] == 2, f"Winner should complete 2 laps, got {winner['laps_completed']}"
+        assert len(winner["lap_times"]) == 2, "Winner should have 2 recorded lap times"
+    run_test(result, "simulate_race() runs a race to the flag", test_simulate_race_finishes)
+    
+    # Test: Same seed gives the same race
+    def test_simulate_race_seeded():
+        rc = reset_runtime_config()
+        rc.race_laps = 2
+        from race.batch import simulate_race
+        first = simulate_race(seed=42)
+        second = simulate_race(seed=42)
+        assert first["finishing_order"] == second["finishing_order"], "Same seed should give same finishing order"
+        assert first["race_time"] == second["race_time"], "Same seed should give same race time"
+    run_test(result, "Same seed gives the same race", test_simulate_race_seeded)
+
+    # Test: Per-lap state hashes are bit-identical for a seed and differ between seeds
+    def test_seed_state_hash():
+        import random
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        from race.race_engine import RaceEngine
+
+        from race.vector_engine import VectorRaceEngine
+
+        for engine_class in (RaceEngine, VectorRaceEngine):
+            def run(seed):
+                random.seed()  # Global random state must not matter
+                engine = engine_class(circuit_id="monza", seed=seed)
+                engine.start_race()
+                engine.run_to_finish()
+                return engine
+
+            a, b, c = run(2024), run(2024), run(2025)
+            name = engine_class.__name__
+            assert a.get_state_hash() == b.get_state_hash(), f"{name}: same seed should give identical state"
+            for car_a, car_b in zip(a.cars, b.cars):
+                assert car_a.lap_hashes, f"{name}: {car_a.driver_short} has no lap hashes"
+                assert len(car_a.lap_hashes) == len(car_a.lap_times)
+                assert car_a.lap_hashes == car_b.lap_hashes, f"{name}: {car_a.driver_short} diverged"
+            assert a.get_state_hash() != c.get_state_hash(), f"{name}: different seeds should differ"
+    run_test(result, "Seeded races have identical per-lap hashes", test_seed_state_hash)
+
+    # Test: Car streams depend on (seed, car, lap), not on draw history or grid slot
+    def test_rng_streams():
+        from race.rng import RaceRandom
+        race = RaceRandom(7)
+        first = race.car_stream(44)
+        second = race.car_stream(44)
+        for _ in range(20):  # Use more numbers on lap 1 than the pre-drawn batch
+            first.random()
+        first.start_lap(5)
+        second.start_lap(5)
+        assert [first.random() for _ in range(3)] == [second.random() for _ in range(3)]
+        other = race.car_stream(1)
+        other.start_lap(5)
+        assert other.random() != race.car_stream(44).random()
+
+        # Vector backend: a car's numbers don't depend on how many other cars draw
+        import numpy as np
+        from race.vector_engine import VectorRaceEngine
+        a, b = VectorRaceEngine(circuit_id="monza", seed=7), VectorRaceEngine(circuit_id="monza", seed=7)
+        a._random(np.arange(len(a.lap)))
+        a._random(np.array([3, 5]))
+        b._random(np.array([3]))
+        b._random(np.array([3]))
+        assert a._random(np.array([3]))[0] == b._random(np.array([3]))[0]
+        a.lap[3] = b.lap[3] = 4
+        a.draws[3] = b.draws[3] = 0
+        b._random(np.array([5, 6]))
+        assert a._random(np.array([3]))[0] == b._random(np.array([3]))[0]
+    run_test(result, "Per-car random streams are counter-based", test_rng_streams)
+
+    # Test: Worker pool matches in-process results
+    def test_run_batch_workers():
+        rc = reset_runtime_config()
+        rc.race_laps = 1
+        from race.batch import run_batch
+        serial = run_batch(runs=2, workers=1, seed=7)
+        pooled = run_batch(runs=2, workers=2, seed=7)
+        assert [r["run"] for r in pooled] == [0, 1], "Results should be ordered by run index"
+        for a, b in zip(serial, pooled):
+            assert a["finishing_order"] == b["finishing_order"], "Pool results should match serial results"
+    run_test(result, "Worker pool matches in-process results", test_run_batch_workers)
+    
+    # Test: CSV export writes one row per car per race
+    def test_write_csv():
+        rc = reset_runtime_config()
+        rc.race_laps = 1
+        from race.batch import run_batch, write_csv
+        import csv
+        results = run_batch(runs=2, workers=1, seed=3)
+        path = os.path.join(tempfile.mkdtemp(), "results.csv")
+        write_csv(results, path)
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 40, f"Expected 40 rows (2 races x 20 cars), got {len(rows)}"
+        assert rows[0]["position"] == "1", "First row should be the race winner"
+    run_test(result, "CSV export writes one row per car per race", test_write_csv)
+
+
 # =============================================================================
 # TEST SUITE: Pygame Headless
 # =============================================================================
@@ -597,6 +1362,215 @@ def test_pygame(result):
         finally:
             pygame.quit()
     run_test(result, "Can use fonts", test_pygame_font)
+
+    # Test: Car sprite atlas draws each car with one blit
+    def test_car_sprite_atlas():
+        import pygame
+        import config
+        from assets.colors import get_team_color
+        from race.race_engine import RaceEngine
+        from ui.car_sprites import CarSpriteAtlas, SHADOW_COLOR
+        reset_runtime_config()
+        pygame.init()
+        try:
+            engine = RaceEngine(circuit_id="monza", seed=1)
+            cars = engine.cars
+            atlas = CarSpriteAtlas.for_cars(cars)
+            assert atlas.covers(cars) and atlas.positions == len(cars)
+            assert len(atlas.teams) == len({car.team for car in cars})
+
+            car = cars[0]
+            area = atlas.area(car.team, car.position)
+            sprite = atlas.surface.subsurface(area)
+            r = atlas.car_size
+            body = sprite.get_at((atlas.center - r + 4, atlas.center))[:3]
+            assert body == tuple(get_team_color(car.team)), f"Body should be team colour, got {body}"
+            shadow = sprite.get_at((atlas.center + r, atlas.center + 4))[:3]
+            assert shadow == SHADOW_COLOR, f"Shadow should be baked in, got {shadow}"
+
+            target = pygame.Surface((config.TRACK_VIEW_WIDTH, config.SCREEN_HEIGHT))
+            atlas.draw(target, [car], engine.track)
+            x, y = car.get_display_position(engine.track)
+            assert target.get_at((int(x) - r + 4, int(y)))[:3] == body, "Car should be drawn at its position"
+
+            saved = config.CAR_SIZE
+            config.CAR_SIZE = saved * 2
+            try:
+                assert not atlas.covers(cars), "A resize should rebuild the atlas"
+            finally:
+                config.CAR_SIZE = saved
+        finally:
+            pygame.quit()
+    run_test(result, "Car sprite atlas draws each car with one blit", test_car_sprite_atlas)
+
+    def test_text_cache():
+        import pygame
+        from ui.text_cache import TextCache
+        pygame.init()
+        try:
+            cache = TextCache(max_entries=2)
+            font = cache.font(24)
+            assert cache.font(24) is font, "Fonts should be shared"
+            first = cache.render(font, "LEADER", True, (255, 255, 255))
+            assert cache.render(font, "LEADER", True, [255, 255, 255]) is first, "Same text should hit"
+            cache.render(font, "PIT", True, (255, 255, 255))
+            cache.render(font, "DNF", True, (255, 255, 255))
+            stats = cache.stats()
+            assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 3, 1), stats
+            assert cache.render(font, "LEADER", True, (255, 255, 255)) is not first, "LRU entry should be evicted"
+
+            target = pygame.Surface((200, 40))
+            rect = cache.blit(target, font, "+1.234", (255, 255, 255), (10, 5))
+            assert rect.topleft == (10, 5) and rect.height == font.get_height()
+            assert abs(rect.width - font.size("+1.234")[0]) <= 2, "Glyphs should advance like rendered text"
+            misses = cache.stats()["misses"]
+            cache.blit(target, font, "+4.321", (255, 255, 255), (10, 5))
+            stats = cache.stats()
+            assert stats["misses"] == misses and stats["glyph_strings"] == 2, "Numbers should not use the LRU"
+            assert stats["glyph_misses"] == 6, "Each glyph should be rendered once"
+            assert target.get_bounding_rect().colliderect(rect), "Glyphs should be drawn"
+        finally:
+            pygame.quit()
+        assert not cache._fonts, "pygame.quit() should drop cached fonts"
+    run_test(result, "Text cache reuses renders and composes numbers from glyphs", test_text_cache)
+
+    def test_timing_tower_rows():
+        import pygame
+        import config
+        from assets.colors import get_team_color
+        from race.race_engine import RaceEngine
+        from ui.timing_screen import TimingScreen, ROW_START_Y, ROW_HEIGHT
+        reset_runtime_config()
+        pygame.init()
+        try:
+            engine = RaceEngine(circuit_id="monza", seed=1)
+            engine.start_race()
+            for _ in range(600):
+                engine.step()
+            screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            timing = TimingScreen(screen)
+            timing.render(engine, now=0.0)
+            rendered = timing.rows_rendered
+            assert rendered == len(engine.cars), f"First frame renders every row, got {rendered}"
+            timing.render(engine, now=0.01)
+            assert timing.rows_rendered == rendered, "Unchanged rows should not be re-rendered"
+
+            engine.cars[5].gap_to_ahead_time += 0.5
+            timing.render(engine, now=0.1)
+            assert timing.rows_rendered == rendered, "Gaps should refresh at TIMING_GAP_UPDATE_HZ"
+            timing.render(engine, now=0.1 + 1.0 / config.TIMING_GAP_UPDATE_HZ)
+            assert timing.rows_rendered == rendered + 1, "Only the changed row should be re-rendered"
+
+            # Drop P3 to the back: the cars behind it move up with their existing rows
+            engine.cars.append(engine.cars.pop(2))
+            for position, car in enumerate(engine.cars, 1):
+                car.position = position
+            timing.render(engine, now=0.35)
+            assert timing.rows_rendered == rendered + 1, "Reordered rows should be reused"
+            y = ROW_START_Y + 2 * ROW_HEIGHT
+            assert timing.timing_surface.get_at((12, y))[:3] == tuple(get_team_color(engine.cars[2].team))
+        finally:
+            pygame.quit()
+    run_test(result, "Timing tower only redraws rows that changed", test_timing_tower_rows)
+
+    def test_dirty_rect_frame():
+        import pygame
+        import config
+        from race.race_engine import RaceEngine
+        from ui.renderer import TrackRenderer
+        from ui.timing_screen import TimingScreen
+        reset_runtime_config()
+        pygame.init()
+        try:
+            engine = RaceEngine(circuit_id="monza", seed=1)
+            engine.start_race()
+            size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+
+            screen = pygame.Surface(size)
+            track, timing = TrackRenderer(screen), TimingScreen(screen)
+            assert track.render(engine, dirty=True) == [track.track_surface.get_rect()], \
+                "The first frame should be drawn in full"
+            timing.render(engine, now=0.0)
+            for _ in range(120):
+                engine.step()
+            rects = track.render(engine, dirty=True) + timing.render(engine, now=1.0, dirty=True)
+            area = sum(rect.width * rect.height for rect in rects)
+            assert 0 < area < size[0] * size[1] // 4, f"Only changed areas should be redrawn, got {area} px"
+
+            full = pygame.Surface(size)
+            TrackRenderer(full).render(engine)
+            TimingScreen(full).render(engine, now=1.0)
+            assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(full, "RGB"), \
+                "A dirty frame should match a full redraw"
+        finally:
+            pygame.quit()
+    run_test(result, "Dirty-rect frames match full redraws", test_dirty_rect_frame)
+
+    def test_results_screen_events():
+        import pygame
+        import config
+        from race.race_engine import RaceEngine
+        from ui.results_screen import ResultsScreen
+        rc = reset_runtime_config()
+        rc.race_laps = 3
+        pygame.init()
+        try:
+            engine = RaceEngine(circuit_id="monza", seed=3)
+            screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            results = ResultsScreen(screen, engine.events)
+            assert engine.events.wants("fastest_lap") and not engine.events.wants("overtake")
+            engine.start_race()
+            engine.run_to_finish()
+
+            best = min((t, car.driver_number) for car in engine.cars for t in car.lap_times)
+            assert results.fastest_lap.data["lap_time"] == best[0]
+            assert results.fastest_lap.driver_number == best[1]
+            assert results.finish.data["winner"] == engine.cars[0].driver_number
+            resized = ResultsScreen(screen, engine.events, results)
+            assert resized.fastest_lap is results.fastest_lap and resized.finish is results.finish
+            resized.render(engine)
+            resized.close()
+            assert not engine.events, "Closed results screens should unsubscribe"
+        finally:
+            pygame.quit()
+    run_test(result, "Results screen takes fastest lap and finish from race events", test_results_screen_events)
+
+    def test_track_surface_cache():
+        import pygame
+        import config
+        from race.track import Track
+        from ui.renderer import TrackRenderer
+        from ui.track_cache import TrackSurfaceCache
+        reset_runtime_config()
+        pygame.init()
+        try:
+            track = Track(circuit_id="monaco")
+            size = (config.TRACK_VIEW_WIDTH, config.SCREEN_HEIGHT)
+            build = TrackRenderer(pygame.Surface(size))._create_static_track_surface
+            with tempfile.TemporaryDirectory() as directory:
+                cache = TrackSurfaceCache(max_entries=1, directory=directory, min_build_ms=0)
+                surface = cache.get(track, size, build)
+                assert cache.get(track, size, build) is surface, "A restart should reuse the surface"
+                cache.wait()
+                assert (cache.hits, cache.disk_hits, cache.misses) == (1, 0, 1)
+                assert len(os.listdir(directory)) == 1, "The surface should be saved as a PNG"
+
+                smaller = (size[0] // 2, size[1] // 2)
+                assert cache.key(track, smaller) != cache.key(track, size)
+                assert cache.key(Track(circuit_id="monza"), size) != cache.key(track, size)
+                cache.get(track, smaller, lambda t: pygame.Surface(smaller))
+                cache.wait()
+                assert cache.get(track, size, build) is not surface, "LRU entry should be evicted"
+                assert cache.disk_hits == 1, "An evicted surface should come back from disk"
+
+                relaunched = TrackSurfaceCache(directory=directory)
+                loaded = relaunched.get(track, size, build)
+                assert (relaunched.disk_hits, relaunched.misses) == (1, 0)
+                assert pygame.image.tobytes(loaded, "RGB") == pygame.image.tobytes(surface, "RGB"), \
+                    "The PNG copy should match the drawn surface"
+        finally:
+            pygame.quit()
+    run_test(result, "Static track surfaces are cached in memory and on disk", test_track_surface_cache)
     
     # Test: SDL_VIDEODRIVER is dummy
     def test_sdl_driver():
@@ -622,6 +1596,7 @@ def main():
         "persistence": test_persistence,
         "race": test_race,
         "integration": test_integration,
+        "batch": test_batch,
         "pygame": test_pygame,
     }
     
@@ -33,6 +33,8 @@ from datetime import datetime
 from tkinter import filedialog
 import tkinter as tk
 
+from race.track_geometry import TrackGeometry
+
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 900
@@ -106,6 +108,9 @@ class TrackEditor:
         self.racing_line_surface = None
         self.racing_line_dirty = True
 
+        # Arc-length geometry of the waypoints, as the game uses (rebuilt when they change)
+        self.geometry = None
+
     def run(self):
         """Main editor loop"""
         running = True
@@ -184,6 +189,7 @@ class TrackEditor:
                 self.waypoints.append((x, y))
                 self.selected_waypoint = len(self.waypoints) - 1
                 self.racing_line_dirty = True
+                self.geometry = None
                 self.show_message(f"Waypoint {len(self.waypoints)} placed")
 
         elif button == 3:  # Right click
@@ -193,6 +199,7 @@ class TrackEditor:
                 self.waypoints.pop(clicked_idx)
                 self.selected_waypoint = None
                 self.racing_line_dirty = True
+                self.geometry = None
                 self.show_message(f"Waypoint deleted ({len(self.waypoints)} remaining)")
 
     def handle_mouse_up(self, button):
@@ -217,6 +224,7 @@ class TrackEditor:
             y = max(0, min(y, TRACK_VIEW_HEIGHT - 1))
             self.waypoints[self.selected_waypoint] = (x, y)
             self.racing_line_dirty = True
+            self.geometry = None
 
     def get_waypoint_at_pos(self, pos):
         """Get index of waypoint at mouse position, or None"""
@@ -235,6 +243,7 @@ class TrackEditor:
             self.waypoints.pop(self.selected_waypoint)
             self.selected_waypoint = None
             self.racing_line_dirty = True
+            self.geometry = None
             self.show_message(f"Waypoint deleted ({len(self.waypoints)} remaining)")
 
     def clear_waypoints(self):
@@ -243,6 +252,7 @@ class TrackEditor:
         self.selected_waypoint = None
         self.preview_progress = 0.0
         self.racing_line_dirty = True
+        self.geometry = None
         self.show_message("All waypoints cleared")
 
     def save_track(self):
@@ -304,6 +314,7 @@ class TrackEditor:
             self.preview_progress = 0.0
             self.current_file = files[0]
             self.racing_line_dirty = True
+            self.geometry = None
 
             # Load background image if present
             if 'background_image' in data and data['background_image']:
@@ -437,23 +448,13 @@ class TrackEditor:
                 self.preview_progress = 0.0
 
     def get_position_on_track(self, progress):
-        """Get x, y position at given progress (0.0 to 1.0) along track"""
+        """Get x, y position at given progress (0.0 to 1.0) along track, by arc length as in the game"""
         if len(self.waypoints) < 2:
             return None
 
-        track_length = len(self.waypoints)
-        index = int(progress * track_length) % track_length
-        next_index = (index + 1) % track_length
-
-        # Interpolate between waypoints
-        t = (progress * track_length) % 1.0
-        x1, y1 = self.waypoints[index]
-        x2, y2 = self.waypoints[next_index]
-
-        x = x1 + (x2 - x1) * t
-        y = y1 + (y2 - y1) * t
-
-        return (x, y)
+        if self.geometry is None:
+            self.geometry = TrackGeometry(self.waypoints)
+        return self.geometry.position(progress)
 
     def draw(self):
         """Draw everything"""
@@ -0,0 +1,96 @@
+"""
+Car Sprites - Pre-rendered car markers for the track view
+
+Drawing a car used to take three circles and a fresh text render of its
+position number, for every car on every frame. CarSpriteAtlas renders each
+team colour x position number once, shadow included, into a single surface.
+A car is then one blit, and the whole field is one Surface.blits() call.
+
+The atlas only depends on the teams, the field size and config.CAR_SIZE, so
+it is built once per race and rebuilt only when the window is resized.
+"""
+import pygame
+
+import config
+from assets.colors import get_team_color
+
+SHADOW_OFFSET = 2             # Shadow is drawn this far down and right of the car
+SHADOW_COLOR = (20, 20, 20)
+OUTLINE_COLOR = (255, 255, 255)
+NUMBER_COLOR = (255, 255, 255)
+NUMBER_FONT_SIZE = 18
+
+
+class CarSpriteAtlas:
+    """Every team colour x position number, pre-rendered on one surface"""
+
+    def __init__(self, teams, positions, car_size=None):
+        """
+        Args:
+            teams: Team names (one row of sprites each)
+            positions: Highest position number (one column each, 1..positions)
+            car_size: Car radius in pixels (default: config.CAR_SIZE)
+        """
+        self.car_size = car_size if car_size is not None else config.CAR_SIZE
+        self.teams = tuple(teams)
+        self.positions = positions
+
+        # Each cell holds one car and its shadow, with a pixel spare for antialiasing
+        radius = self.car_size
+        self.center = radius + 1
+        cell = 2 * radius + SHADOW_OFFSET + 2
+        self.cell = cell
+        self.surface = pygame.Surface((cell * positions, cell * max(1, len(self.teams))), pygame.SRCALPHA)
+        self._areas = {}
+
+        font = pygame.font.Font(None, NUMBER_FONT_SIZE)
+        numbers = [font.render(str(position), True, NUMBER_COLOR) for position in range(1, positions + 1)]
+        for row, team in enumerate(self.teams):
+            color = get_team_color(team)
+            for column, number in enumerate(numbers):
+                area = pygame.Rect(column * cell, row * cell, cell, cell)
+                center = (area.x + self.center, area.y + self.center)
+                shadow = (center[0] + SHADOW_OFFSET, center[1] + SHADOW_OFFSET)
+                pygame.draw.circle(self.surface, SHADOW_COLOR, shadow, radius)
+                pygame.draw.circle(self.surface, color, center, radius)
+                pygame.draw.circle(self.surface, OUTLINE_COLOR, center, radius, 2)
+                self.surface.blit(number, number.get_rect(center=center))
+                self._areas[(team, column + 1)] = area
+
+    @classmethod
+    def for_cars(cls, cars):
+        """Atlas covering a field of cars (their teams, positions 1..len(cars))."""
+        return cls(sorted({car.team for car in cars}), len(cars))
+
+    def covers(self, cars):
+        """
+        Check the atlas can still draw this field at the current car size.
+
+        Cheap enough to call every frame (teams don't change during a race).
+        """
+        return self.car_size == config.CAR_SIZE and len(cars) <= self.positions
+
+    def area(self, team, position):
+        """Atlas rectangle of a car's sprite."""
+        return self._areas[(team, position)]
+
+    def draw(self, target, cars, track):
+        """
+        Draw every car at its display position in one blits() call.
+
+        Args:
+            target: Surface to draw on
+            cars: Cars to draw (in draw order)
+            track: Track (for display positions)
+
+        Returns:
+            list: Rect covered by each car
+        """
+        atlas = self.surface
+        center = self.center
+        areas = self._areas
+        blits = []
+        for car in cars:
+            x, y = car.get_display_position(track)
+            blits.append((atlas, (x - center, y - center), areas[(car.team, car.position)]))
+        return target.blits(blits)
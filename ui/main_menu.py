@@ -3,6 +3,7 @@ Main Menu - F1 Manager game main menu with navigation
 """
 import pygame
 import config
+from ui.text_cache import text_cache
 
 
 class MenuItem:
@@ -25,11 +26,11 @@ class MainMenu:
         self.menu_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         
         # Fonts
-        self.font_title = pygame.font.Font(None, 96)
-        self.font_subtitle = pygame.font.Font(None, 36)
-        self.font_menu = pygame.font.Font(None, 48)
-        self.font_menu_small = pygame.font.Font(None, 28)
-        self.font_hint = pygame.font.Font(None, 24)
+        self.font_title = text_cache.font(96)
+        self.font_subtitle = text_cache.font(36)
+        self.font_menu = text_cache.font(48)
+        self.font_menu_small = text_cache.font(28)
+        self.font_hint = text_cache.font(24)
         
         # Colors
         self.color_title = (255, 255, 255)
@@ -197,12 +198,12 @@ class MainMenu:
         center_x = config.SCREEN_WIDTH // 2
         
         # Main title
-        title_text = self.font_title.render("F1 MANAGER", True, self.color_title)
+        title_text = text_cache.render(self.font_title, "F1 MANAGER", True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 120 + self.title_offset))
         self.menu_surface.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_subtitle.render("2025 SEASON", True, self.color_subtitle)
+        subtitle_text = text_cache.render(self.font_subtitle, "2025 SEASON", True, self.color_subtitle)
         subtitle_rect = subtitle_text.get_rect(center=(center_x, 170))
         self.menu_surface.blit(subtitle_text, subtitle_rect)
     
@@ -228,12 +229,12 @@ class MainMenu:
             if is_selected and item.enabled:
                 # Draw bracket indicators
                 indicator_offset = 180
-                indicator_text = self.font_menu.render(">", True, self.color_accent)
+                indicator_text = text_cache.render(self.font_menu, ">", True, self.color_accent)
                 self.menu_surface.blit(
                     indicator_text,
                     (center_x - indicator_offset, y_pos - 5)
                 )
-                indicator_text = self.font_menu.render("<", True, self.color_accent)
+                indicator_text = text_cache.render(self.font_menu, "<", True, self.color_accent)
                 self.menu_surface.blit(
                     indicator_text,
                     (center_x + indicator_offset - 20, y_pos - 5)
@@ -263,7 +264,7 @@ class MainMenu:
                 )
             
             # Draw menu text
-            menu_text = self.font_menu.render(item.text, True, text_color)
+            menu_text = text_cache.render(self.font_menu, item.text, True, text_color)
             menu_rect = menu_text.get_rect(center=(center_x, y_pos + 10))
             self.menu_surface.blit(menu_text, menu_rect)
             
@@ -277,7 +278,7 @@ class MainMenu:
             
             # Draw subtitle if present
             if item.subtitle:
-                subtitle_text = self.font_menu_small.render(
+                subtitle_text = text_cache.render(self.font_menu_small,
                     item.subtitle, True, self.color_subtitle
                 )
                 subtitle_rect = subtitle_text.get_rect(center=(center_x, y_pos + 40))
@@ -289,7 +290,7 @@ class MainMenu:
         footer_y = config.SCREEN_HEIGHT - 50
         
         # Controls hint
-        hint_text = self.font_hint.render(
+        hint_text = text_cache.render(self.font_hint,
             "Use Arrow Keys or Mouse to navigate  |  Enter to select  |  ESC to quit",
             True,
             self.color_subtitle
@@ -298,7 +299,7 @@ class MainMenu:
         self.menu_surface.blit(hint_text, hint_rect)
         
         # Version info
-        version_text = self.font_hint.render(
+        version_text = text_cache.render(self.font_hint,
             "v0.1.0 - Phase 1",
             True,
             (80, 80, 80)
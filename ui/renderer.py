@@ -1,11 +1,19 @@
 """
 Track Renderer - Visualizes the F1 circuit and cars
+
+render(dirty=True) draws a frame incrementally. Only the cars, the race
+status and the speed controls change between frames, so the areas they
+covered last frame are restored from static_surface, they are drawn again,
+and only those rectangles are copied to the screen and returned for
+pygame.display.update().
 """
 import pygame
 import math
 import random
 import config
-from assets.colors import get_team_color
+from ui.car_sprites import CarSpriteAtlas
+from ui.text_cache import text_cache
+from ui.track_cache import track_surface_cache
 
 
 class TrackRenderer:
@@ -15,13 +23,14 @@ class TrackRenderer:
         self.surface = surface
         self.track_surface = pygame.Surface((config.TRACK_VIEW_WIDTH, config.SCREEN_HEIGHT))
         self.static_surface = None  # Cache for static track elements
+        self.car_sprites = None     # CarSpriteAtlas (built on the first frame of a race)
+        self.drawn_rects = []       # Areas drawn over static_surface last frame
         
         # Cache fonts for performance (avoid creating fonts every frame)
-        self.font_car_position = pygame.font.Font(None, 18)
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_instructions = pygame.font.Font(None, 28)
-        self.font_speed = pygame.font.Font(None, 20)
+        self.font_large = text_cache.font(48)
+        self.font_small = text_cache.font(24)
+        self.font_instructions = text_cache.font(28)
+        self.font_speed = text_cache.font(20)
         
         # Speed control button dimensions
         self.speed_button_width = 35
@@ -31,32 +40,61 @@ class TrackRenderer:
     def reset_cache(self):
         """Clear cached static track surface when track changes"""
         self.static_surface = None
+        self.car_sprites = None
+
+    def render(self, race_engine, dirty=False):
+        """
+        Render the track and all cars.
+
+        Args:
+            race_engine: Race engine or view to show
+            dirty: Only redraw what changed since the last frame (falls back
+                   to a full redraw on the first frame or after a resize)
 
-    def render(self, race_engine):
-        """Render the track and all cars"""
-        # Clear track surface
-        self.track_surface.fill(config.TRACK_BG_COLOR)
+        Returns:
+            list: Screen rectangles that changed
+        """
+        previous = self.drawn_rects
+        if dirty and self.static_surface is not None and self.car_sprites is not None \
+                and self.car_sprites.covers(race_engine.cars):
+            # Restore what was drawn over the track last frame
+            for rect in previous:
+                self.track_surface.blit(self.static_surface, rect, rect)
+        else:
+            # Clear track surface
+            self.track_surface.fill(config.TRACK_BG_COLOR)
 
-        # Draw track
-        self._draw_track(race_engine.track)
+            # Draw track
+            self._draw_track(race_engine.track)
+            previous = None
 
         # Draw cars
-        self._draw_cars(race_engine)
+        drawn = self._draw_cars(race_engine)
 
         # Draw race status
-        self._draw_race_status(race_engine)
+        drawn += self._draw_race_status(race_engine)
         
         # Draw speed controls
-        self._draw_speed_controls(race_engine)
+        drawn += self._draw_speed_controls(race_engine)
+
+        view = self.track_surface.get_rect()
+        self.drawn_rects = [rect.clip(view) for rect in drawn]
+        if previous is None:
+            # Blit to main surface
+            self.surface.blit(self.track_surface, (0, 0))
+            return [view]
 
-        # Blit to main surface
-        self.surface.blit(self.track_surface, (0, 0))
+        changed = [rect for rect in previous + self.drawn_rects if rect]
+        for rect in changed:
+            self.surface.blit(self.track_surface, rect, rect)
+        return changed
 
     def _draw_track(self, track):
         """Draw the track circuit using waypoints with broadcast-quality visuals"""
-        # Use cached static surface if available
+        # Use cached static surface if available (shared by renderers, see ui/track_cache.py)
         if self.static_surface is None:
-            self.static_surface = self._create_static_track_surface(track)
+            size = (config.TRACK_VIEW_WIDTH, config.SCREEN_HEIGHT)
+            self.static_surface = track_surface_cache.get(track, size, self._create_static_track_surface)
 
         # Blit cached static elements
         self.track_surface.blit(self.static_surface, (0, 0))
@@ -371,67 +409,38 @@ class TrackRenderer:
             )
 
     def _draw_cars(self, race_engine):
-        """Draw all cars on the track with smooth motion"""
-        for car in race_engine.cars:
-            # Use smoothed display position (no int() - pygame-ce supports floats)
-            x, y = car.get_display_position(race_engine.track)
-            color = get_team_color(car.team)
-
-            # Draw car shadow
-            pygame.draw.circle(
-                self.track_surface,
-                (20, 20, 20),
-                (x + 2, y + 2),
-                config.CAR_SIZE
-            )
-
-            # Draw car as a circle with position number
-            pygame.draw.circle(
-                self.track_surface,
-                color,
-                (x, y),
-                config.CAR_SIZE
-            )
-
-            # Draw outline
-            pygame.draw.circle(
-                self.track_surface,
-                (255, 255, 255),
-                (x, y),
-                config.CAR_SIZE,
-                2
-            )
-
-            # Draw position number
-            pos_text = self.font_car_position.render(str(car.position), True, (255, 255, 255))
-            text_rect = pos_text.get_rect(center=(x, y))
-            self.track_surface.blit(pos_text, text_rect)
+        """Draw all cars on the track, one sprite blit each (see ui/car_sprites.py)"""
+        cars = race_engine.cars
+        if self.car_sprites is None or not self.car_sprites.covers(cars):
+            # First frame, or the window was resized
+            self.car_sprites = CarSpriteAtlas.for_cars(cars)
+        return self.car_sprites.draw(self.track_surface, cars, race_engine.track)
 
     def _draw_race_status(self, race_engine):
-        """Draw race status at top of track view"""
+        """Draw race status at top of track view, returning the areas drawn"""
         # Race status (LAP X/Y)
-        status_text = self.font_large.render(
+        status_text = text_cache.render(self.font_large,
             race_engine.get_race_status(),
             True,
             config.TEXT_COLOR
         )
         status_rect = status_text.get_rect(center=(config.TRACK_VIEW_WIDTH // 2, 40))
-        self.track_surface.blit(status_text, status_rect)
+        drawn = [self.track_surface.blit(status_text, status_rect)]
 
         # Race time
         minutes = int(race_engine.race_time // 60)
         seconds = int(race_engine.race_time % 60)
-        time_text = self.font_small.render(
+        time_text = text_cache.render(self.font_small,
             f"{minutes:02d}:{seconds:02d}",
             True,
             config.TEXT_GRAY
         )
         time_rect = time_text.get_rect(center=(config.TRACK_VIEW_WIDTH // 2, 75))
-        self.track_surface.blit(time_text, time_rect)
+        drawn.append(self.track_surface.blit(time_text, time_rect))
 
         # Instructions at bottom
         if not race_engine.race_started:
-            inst_text = self.font_instructions.render(
+            inst_text = text_cache.render(self.font_instructions,
                 "Press SPACE to start race",
                 True,
                 config.TEXT_COLOR
@@ -439,10 +448,11 @@ class TrackRenderer:
             inst_rect = inst_text.get_rect(
                 center=(config.TRACK_VIEW_WIDTH // 2, config.SCREEN_HEIGHT - 40)
             )
-            self.track_surface.blit(inst_text, inst_rect)
+            drawn.append(self.track_surface.blit(inst_text, inst_rect))
+        return drawn
 
     def _draw_speed_controls(self, race_engine):
-        """Draw speed control buttons in top right"""
+        """Draw speed control buttons in top right, returning the area drawn"""
         options = config.SIMULATION_SPEED_OPTIONS
         current_speed = race_engine.simulation_speed
         
@@ -460,6 +470,9 @@ class TrackRenderer:
             pygame.draw.rect(self.track_surface, (100, 100, 100), (x, y, self.speed_button_width, self.speed_button_height), 1)
             
             # Button text
-            text = self.font_speed.render(f"{speed}x", True, (255, 255, 255))
+            text = text_cache.render(self.font_speed, f"{speed}x", True, (255, 255, 255))
             text_rect = text.get_rect(center=(x + self.speed_button_width // 2, y + self.speed_button_height // 2))
             self.track_surface.blit(text, text_rect)
+
+        width = len(options) * (self.speed_button_width + self.speed_button_margin)
+        return [pygame.Rect(start_x, y, width, self.speed_button_height)]
@@ -1,23 +1,36 @@
 """
 Results Screen - F1-style race results display with scrolling
+
+The race time and fastest lap come from the race's FASTEST_LAP and
+RACE_FINISHED events (race/events.py), collected while the race runs,
+rather than from scanning every car's lap times afterwards.
 """
 import pygame
 import config
 from assets.colors import get_team_color, get_team_short_name
+from race.events import FASTEST_LAP, RACE_FINISHED
+from ui.text_cache import text_cache
 
 
 class ResultsScreen:
     """Displays F1-style race results after race completion"""
 
-    def __init__(self, surface):
+    def __init__(self, surface, events=None, previous=None):
+        """
+        Args:
+            surface: Surface to draw on
+            events: EventBus of the race shown (e.g. RaceView.events)
+            previous: ResultsScreen this one replaces (e.g. after a resize); its
+                      collected race data and subscription are taken over
+        """
         self.surface = surface
         self.results_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_header = pygame.font.Font(None, 36)
-        self.font_large = pygame.font.Font(None, 32)
-        self.font_medium = pygame.font.Font(None, 28)
-        self.font_small = pygame.font.Font(None, 22)
-        self.font_instruction = pygame.font.Font(None, 28)
+        self.font_title = text_cache.font(64)
+        self.font_header = text_cache.font(36)
+        self.font_large = text_cache.font(32)
+        self.font_medium = text_cache.font(28)
+        self.font_small = text_cache.font(22)
+        self.font_instruction = text_cache.font(28)
 
         # Scroll state
         self.scroll_offset = 0
@@ -25,6 +38,30 @@ class ResultsScreen:
         self.visible_rows = 15  # Number of rows visible at once
         self.max_scroll = 0  # Will be calculated based on number of drivers
 
+        # Race data from events
+        self.fastest_lap = None   # FASTEST_LAP event of the race's fastest lap so far
+        self.finish = None        # RACE_FINISHED event
+        self._subscription = None
+        if previous is not None:
+            self.fastest_lap = previous.fastest_lap
+            self.finish = previous.finish
+            previous.close()
+        if events is not None:
+            self._subscription = events.subscribe(self._on_event, kinds=(FASTEST_LAP, RACE_FINISHED))
+
+    def _on_event(self, event):
+        """Keep the latest fastest lap and the finish"""
+        if event.kind == FASTEST_LAP:
+            self.fastest_lap = event
+        else:
+            self.finish = event
+
+    def close(self):
+        """Stop following the race's events"""
+        if self._subscription is not None:
+            self._subscription.cancel()
+            self._subscription = None
+
     def handle_scroll(self, event):
         """Handle scroll events (keyboard and mouse wheel)"""
         if event.type == pygame.KEYDOWN:
@@ -60,13 +97,19 @@ class ResultsScreen:
     def _draw_header(self, race_engine):
         """Draw results screen header"""
         # Title with F1 style
-        title_text = self.font_title.render("RACE RESULTS", True, (255, 255, 255))
+        title_text = text_cache.render(self.font_title, "RACE RESULTS", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(config.SCREEN_WIDTH // 2, 60))
         self.results_surface.blit(title_text, title_rect)
 
         # Subtitle with race info
         subtitle = f"{race_engine.total_laps} LAPS COMPLETE"
-        subtitle_text = self.font_small.render(subtitle, True, config.TEXT_GRAY)
+        if self.finish is not None:
+            subtitle += f"  |  RACE TIME {_format_time(self.finish.race_time)}"
+        if self.fastest_lap is not None:
+            driver = self._driver_short(race_engine, self.fastest_lap.driver_number)
+            lap_time = _format_time(self.fastest_lap.data["lap_time"])
+            subtitle += f"  |  FASTEST LAP {driver} {lap_time} (LAP {self.fastest_lap.lap})"
+        subtitle_text = text_cache.render(self.font_small, subtitle, True, config.TEXT_GRAY)
         subtitle_rect = subtitle_text.get_rect(center=(config.SCREEN_WIDTH // 2, 110))
         self.results_surface.blit(subtitle_text, subtitle_rect)
 
@@ -79,6 +122,13 @@ class ResultsScreen:
             2
         )
 
+    def _driver_short(self, race_engine, driver_number):
+        """Short name of a driver in the race"""
+        for car in race_engine.get_cars_by_position():
+            if car.driver_number == driver_number:
+                return car.driver_short
+        return str(driver_number)
+
     def _draw_results_table(self, race_engine):
         """Draw the results table with all finishing positions"""
         # Table start position
@@ -102,7 +152,7 @@ class ResultsScreen:
         ]
 
         for header, x_pos in headers:
-            text = self.font_small.render(header, True, config.TEXT_GRAY)
+            text = text_cache.render(self.font_small, header, True, config.TEXT_GRAY)
             self.results_surface.blit(text, (x_pos, header_y))
 
         # Draw separator line under headers
@@ -174,20 +224,20 @@ class ResultsScreen:
             )
 
             # Position number
-            pos_text = self.font_medium.render(str(car.position), True, config.TEXT_COLOR)
+            pos_text = text_cache.render(self.font_medium, str(car.position), True, config.TEXT_COLOR)
             self.results_surface.blit(pos_text, (pos_x, y_pos))
 
             # Driver name
-            driver_text = self.font_medium.render(car.driver_name, True, config.TEXT_COLOR)
+            driver_text = text_cache.render(self.font_medium, car.driver_name, True, config.TEXT_COLOR)
             self.results_surface.blit(driver_text, (driver_x, y_pos))
 
             # Team name
-            team_text = self.font_small.render(car.team, True, config.TEXT_GRAY)
+            team_text = text_cache.render(self.font_small, car.team, True, config.TEXT_GRAY)
             self.results_surface.blit(team_text, (team_x, y_pos + 3))
 
             # Gap to winner
             if car.position == 1:
-                gap_text = self.font_medium.render("WINNER", True, (0, 255, 100))
+                gap_text = text_cache.render(self.font_medium, "WINNER", True, (0, 255, 100))
             else:
                 # Calculate time gap in seconds (approximate)
                 gap_seconds = car.gap_to_leader * 60  # Rough conversion
@@ -196,13 +246,13 @@ class ResultsScreen:
                         # More than a lap down
                         laps_down = int(car.gap_to_leader)
                         gap_str = f"+{laps_down} LAP" if laps_down == 1 else f"+{laps_down} LAPS"
-                        gap_text = self.font_medium.render(gap_str, True, (255, 100, 100))
+                        gap_text = text_cache.render(self.font_medium, gap_str, True, (255, 100, 100))
                     else:
                         gap_str = f"+{gap_seconds:.1f}s"
-                        gap_text = self.font_medium.render(gap_str, True, config.TEXT_GRAY)
+                        gap_text = text_cache.render(self.font_medium, gap_str, True, config.TEXT_GRAY)
                 else:
                     gap_str = f"+{gap_seconds:.2f}s"
-                    gap_text = self.font_medium.render(gap_str, True, config.TEXT_GRAY)
+                    gap_text = text_cache.render(self.font_medium, gap_str, True, config.TEXT_GRAY)
 
             self.results_surface.blit(gap_text, (gap_x, y_pos))
 
@@ -216,12 +266,12 @@ class ResultsScreen:
 
         # Up arrow if not at top
         if self.scroll_offset > 0:
-            up_text = self.font_large.render("▲", True, (255, 255, 255))
+            up_text = text_cache.render(self.font_large, "▲", True, (255, 255, 255))
             self.results_surface.blit(up_text, (indicator_x, scroll_area_top + 10))
 
         # Down arrow if not at bottom
         if self.scroll_offset < self.max_scroll:
-            down_text = self.font_large.render("▼", True, (255, 255, 255))
+            down_text = text_cache.render(self.font_large, "▼", True, (255, 255, 255))
             self.results_surface.blit(down_text, (indicator_x, scroll_area_bottom - 40))
 
         # Position indicator (e.g., "1-15 of 20")
@@ -229,7 +279,7 @@ class ResultsScreen:
         last_shown = min(self.scroll_offset + self.visible_rows, self.max_scroll + self.visible_rows)
         total = self.max_scroll + self.visible_rows
         position_text = f"{first_shown}-{last_shown} of {total}"
-        pos_render = self.font_small.render(position_text, True, config.TEXT_GRAY)
+        pos_render = text_cache.render(self.font_small, position_text, True, config.TEXT_GRAY)
         pos_rect = pos_render.get_rect(center=(indicator_x + 10, (scroll_area_top + scroll_area_bottom) // 2))
         self.results_surface.blit(pos_render, pos_rect)
 
@@ -246,12 +296,12 @@ class ResultsScreen:
 
         # Instructions text - now includes scroll instructions
         instruction1 = "↑↓ or Mouse Wheel to scroll"
-        instruction2 = "R to restart | SPACE for new race"
+        instruction2 = "R to restart | V to watch replay | SPACE for new race"
         instruction3 = "ESC to quit"
 
-        inst1_text = self.font_instruction.render(instruction1, True, config.TEXT_COLOR)
-        inst2_text = self.font_instruction.render(instruction2, True, config.TEXT_COLOR)
-        inst3_text = self.font_instruction.render(instruction3, True, config.TEXT_GRAY)
+        inst1_text = text_cache.render(self.font_instruction, instruction1, True, config.TEXT_COLOR)
+        inst2_text = text_cache.render(self.font_instruction, instruction2, True, config.TEXT_COLOR)
+        inst3_text = text_cache.render(self.font_instruction, instruction3, True, config.TEXT_GRAY)
 
         # Center align all instructions
         inst1_rect = inst1_text.get_rect(center=(config.SCREEN_WIDTH // 2 - 350, instructions_y + 10))
@@ -270,3 +320,9 @@ class ResultsScreen:
             (config.SCREEN_WIDTH, instructions_y - 10),
             2
         )
+
+
+def _format_time(seconds):
+    """Format a race or lap time as M:SS.sss"""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}:{seconds:06.3f}"
@@ -4,6 +4,7 @@ Provides common rendering and navigation patterns.
 """
 import pygame
 import config
+from ui.text_cache import text_cache
 
 
 class SettingItem:
@@ -70,11 +71,11 @@ class BaseSettingsScreen:
         self.title = title
         
         # Fonts (cached)
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_item = pygame.font.Font(None, 36)
-        self.font_value = pygame.font.Font(None, 36)
-        self.font_hint = pygame.font.Font(None, 24)
+        self.font_title = text_cache.font(72)
+        self.font_subtitle = text_cache.font(32)
+        self.font_item = text_cache.font(36)
+        self.font_value = text_cache.font(36)
+        self.font_hint = text_cache.font(24)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -243,7 +244,7 @@ class BaseSettingsScreen:
         """Draw the screen title."""
         center_x = config.SCREEN_WIDTH // 2
         
-        title_text = self.font_title.render(self.title, True, self.color_title)
+        title_text = text_cache.render(self.font_title, self.title, True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 80))
         self.screen_surface.blit(title_text, title_rect)
     
@@ -278,25 +279,25 @@ class BaseSettingsScreen:
             
             # Draw selection indicator
             if is_selected:
-                indicator_text = self.font_item.render(">", True, self.color_accent)
+                indicator_text = text_cache.render(self.font_item, ">", True, self.color_accent)
                 self.screen_surface.blit(indicator_text, (item_rect.left - 25, y_pos + 10))
             
             # Draw item name
             name_color = self.color_item_selected if is_selected else self.color_item
-            name_text = self.font_item.render(item.name, True, name_color)
+            name_text = text_cache.render(self.font_item, item.name, True, name_color)
             self.screen_surface.blit(name_text, (item_rect.left + 20, y_pos + 12))
             
             # Draw value with arrows
             if item.value is not None:
                 value_str = item.get_display_value()
-                value_text = self.font_value.render(value_str, True, self.color_value)
+                value_text = text_cache.render(self.font_value, value_str, True, self.color_value)
                 value_x = item_rect.right - value_text.get_width() - 50
                 self.screen_surface.blit(value_text, (value_x, y_pos + 12))
                 
                 # Draw adjustment arrows
                 if is_selected:
-                    left_arrow = self.font_value.render("<", True, self.color_accent)
-                    right_arrow = self.font_value.render(">", True, self.color_accent)
+                    left_arrow = text_cache.render(self.font_value, "<", True, self.color_accent)
+                    right_arrow = text_cache.render(self.font_value, ">", True, self.color_accent)
                     self.screen_surface.blit(left_arrow, (value_x - 25, y_pos + 12))
                     self.screen_surface.blit(right_arrow, (item_rect.right - 30, y_pos + 12))
         
@@ -319,7 +320,7 @@ class BaseSettingsScreen:
         pygame.draw.rect(self.screen_surface, border_color, back_rect, width=2, border_radius=5)
         
         back_color = self.color_item_selected if is_back_selected else self.color_item
-        back_text = self.font_item.render("BACK", True, back_color)
+        back_text = text_cache.render(self.font_item, "BACK", True, back_color)
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.screen_surface.blit(back_text, back_text_rect)
     
@@ -328,7 +329,7 @@ class BaseSettingsScreen:
         center_x = config.SCREEN_WIDTH // 2
         footer_y = config.SCREEN_HEIGHT - 50
         
-        hint_text = self.font_hint.render(
+        hint_text = text_cache.render(self.font_hint,
             "Arrow Keys to navigate  |  Left/Right to adjust  |  ESC to go back",
             True,
             self.color_subtitle
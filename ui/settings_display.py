@@ -4,6 +4,7 @@ Shows resolution info and display options with ability to change them.
 """
 import pygame
 import config
+from ui.text_cache import text_cache
 
 
 class SettingsDisplayScreen:
@@ -24,12 +25,12 @@ class SettingsDisplayScreen:
                 break
         
         # Fonts (cached)
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_item = pygame.font.Font(None, 36)
-        self.font_value = pygame.font.Font(None, 36)
-        self.font_hint = pygame.font.Font(None, 24)
-        self.font_button = pygame.font.Font(None, 28)
+        self.font_title = text_cache.font(72)
+        self.font_subtitle = text_cache.font(32)
+        self.font_item = text_cache.font(36)
+        self.font_value = text_cache.font(36)
+        self.font_hint = text_cache.font(24)
+        self.font_button = text_cache.font(28)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -193,12 +194,12 @@ class SettingsDisplayScreen:
         """Draw the screen title."""
         center_x = config.SCREEN_WIDTH // 2
         
-        title_text = self.font_title.render("SETTINGS", True, self.color_title)
+        title_text = text_cache.render(self.font_title, "SETTINGS", True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 80))
         self.screen_surface.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_subtitle.render("Display Options", True, self.color_subtitle)
+        subtitle_text = text_cache.render(self.font_subtitle, "Display Options", True, self.color_subtitle)
         subtitle_rect = subtitle_text.get_rect(center=(center_x, 120))
         self.screen_surface.blit(subtitle_text, subtitle_rect)
     
@@ -246,12 +247,12 @@ class SettingsDisplayScreen:
         pygame.draw.rect(self.screen_surface, border_color, rect, width=2, border_radius=8)
         
         # Label
-        label_text = self.font_item.render("Resolution", True, self.color_item)
+        label_text = text_cache.render(self.font_item, "Resolution", True, self.color_item)
         self.screen_surface.blit(label_text, (rect.left + 20, y_pos + 15))
         
         # Value with arrows
         res_text = f"< {self.pending_resolution[0]} x {self.pending_resolution[1]} >"
-        value_text = self.font_value.render(res_text, True, self.color_value if is_selected else self.color_subtitle)
+        value_text = text_cache.render(self.font_value, res_text, True, self.color_value if is_selected else self.color_subtitle)
         value_x = rect.right - value_text.get_width() - 20
         self.screen_surface.blit(value_text, (value_x, y_pos + 15))
     
@@ -268,12 +269,12 @@ class SettingsDisplayScreen:
         pygame.draw.rect(self.screen_surface, border_color, rect, width=2, border_radius=8)
         
         # Label
-        label_text = self.font_item.render("Display Mode", True, self.color_item)
+        label_text = text_cache.render(self.font_item, "Display Mode", True, self.color_item)
         self.screen_surface.blit(label_text, (rect.left + 20, y_pos + 15))
         
         # Value
         mode_text = "Fullscreen" if self.pending_fullscreen else "Windowed"
-        value_text = self.font_value.render(mode_text, True, self.color_value if is_selected else self.color_subtitle)
+        value_text = text_cache.render(self.font_value, mode_text, True, self.color_value if is_selected else self.color_subtitle)
         value_x = rect.right - value_text.get_width() - 20
         self.screen_surface.blit(value_text, (value_x, y_pos + 15))
     
@@ -288,13 +289,13 @@ class SettingsDisplayScreen:
         # Current resolution
         current_text = f"Current: {self.current_resolution[0]}x{self.current_resolution[1]} "
         current_text += f"({'Fullscreen' if self.is_fullscreen else 'Windowed'})"
-        info_text = self.font_hint.render(current_text, True, self.color_subtitle)
+        info_text = text_cache.render(self.font_hint, current_text, True, self.color_subtitle)
         info_x = rect.centerx - info_text.get_width() // 2
         self.screen_surface.blit(info_text, (info_x, y_pos + 10))
         
         # UI Scale
         scale_text = f"UI Scale: {config.SCALE_FACTOR:.2f}x"
-        scale_surface = self.font_hint.render(scale_text, True, self.color_subtitle)
+        scale_surface = text_cache.render(self.font_hint, scale_text, True, self.color_subtitle)
         scale_x = rect.centerx - scale_surface.get_width() // 2
         self.screen_surface.blit(scale_surface, (scale_x, y_pos + 30))
     
@@ -319,7 +320,7 @@ class SettingsDisplayScreen:
         
         # Text
         text = "APPLY CHANGES" if self.has_changes else "APPLY"
-        button_text = self.font_item.render(text, True, self.color_title if is_selected else self.color_item)
+        button_text = text_cache.render(self.font_item, text, True, self.color_title if is_selected else self.color_item)
         text_rect = button_text.get_rect(center=rect.center)
         self.screen_surface.blit(button_text, text_rect)
     
@@ -339,7 +340,7 @@ class SettingsDisplayScreen:
         pygame.draw.rect(self.screen_surface, border_color, rect, width=2, border_radius=8)
         
         # Text
-        button_text = self.font_item.render("BACK", True, self.color_title if is_selected else self.color_item)
+        button_text = text_cache.render(self.font_item, "BACK", True, self.color_title if is_selected else self.color_item)
         text_rect = button_text.get_rect(center=rect.center)
         self.screen_surface.blit(button_text, text_rect)
     
@@ -348,7 +349,7 @@ class SettingsDisplayScreen:
         center_x = config.SCREEN_WIDTH // 2
         footer_y = config.SCREEN_HEIGHT - 50
         
-        hint_text = self.font_hint.render(
+        hint_text = text_cache.render(self.font_hint,
             "Arrow Keys to navigate/change  |  ENTER to select  |  ESC to go back",
             True,
             self.color_subtitle
@@ -6,6 +6,7 @@ import pygame
 import config
 from settings.runtime_config import runtime_config
 from settings.persistence import SettingsPersistence
+from ui.text_cache import text_cache
 
 
 class SettingsDisplayScreen:
@@ -17,11 +18,11 @@ class SettingsDisplayScreen:
         self.native_resolution = native_resolution
         
         # Fonts (cached)
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_item = pygame.font.Font(None, 36)
-        self.font_value = pygame.font.Font(None, 36)
-        self.font_hint = pygame.font.Font(None, 24)
+        self.font_title = text_cache.font(72)
+        self.font_subtitle = text_cache.font(32)
+        self.font_item = text_cache.font(36)
+        self.font_value = text_cache.font(36)
+        self.font_hint = text_cache.font(24)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -210,12 +211,12 @@ class SettingsDisplayScreen:
         """Draw the screen title."""
         center_x = config.SCREEN_WIDTH // 2
         
-        title_text = self.font_title.render("SETTINGS", True, self.color_title)
+        title_text = text_cache.render(self.font_title, "SETTINGS", True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 80))
         self.screen_surface.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_text = self.font_subtitle.render("Display Options", True, self.color_subtitle)
+        subtitle_text = text_cache.render(self.font_subtitle, "Display Options", True, self.color_subtitle)
         subtitle_rect = subtitle_text.get_rect(center=(center_x, 120))
         self.screen_surface.blit(subtitle_text, subtitle_rect)
     
@@ -247,7 +248,7 @@ class SettingsDisplayScreen:
             pygame.draw.rect(self.screen_surface, border_color, item_rect, width=2, border_radius=8)
             
             # Draw item name
-            name_text = self.font_item.render(item["name"], True, self.color_item)
+            name_text = text_cache.render(self.font_item, item["name"], True, self.color_item)
             self.screen_surface.blit(name_text, (item_rect.left + 20, y_pos + 15))
             
             # Draw value based on type
@@ -255,7 +256,7 @@ class SettingsDisplayScreen:
                 # Draw arrows and current value
                 current_option = item["options"][item["current"]]
                 value_text = f"< {current_option[0]} x {current_option[1]} >"
-                value_surface = self.font_value.render(value_text, True, self.color_value)
+                value_surface = text_cache.render(self.font_value, value_text, True, self.color_value)
                 value_x = item_rect.right - value_surface.get_width() - 20
                 self.screen_surface.blit(value_surface, (value_x, y_pos + 15))
                 
@@ -263,13 +264,13 @@ class SettingsDisplayScreen:
                 # Draw toggle state
                 value_text = "ON" if item["value"] else "OFF"
                 color = self.color_value if item["value"] else self.color_subtitle
-                value_surface = self.font_value.render(value_text, True, color)
+                value_surface = text_cache.render(self.font_value, value_text, True, color)
                 value_x = item_rect.right - value_surface.get_width() - 20
                 self.screen_surface.blit(value_surface, (value_x, y_pos + 15))
                 
             elif item["type"] == "display":
                 # Draw read-only value
-                value_surface = self.font_value.render(item["value"], True, self.color_subtitle)
+                value_surface = text_cache.render(self.font_value, item["value"], True, self.color_subtitle)
                 value_x = item_rect.right - value_surface.get_width() - 20
                 self.screen_surface.blit(value_surface, (value_x, y_pos + 15))
         
@@ -292,7 +293,7 @@ class SettingsDisplayScreen:
             border_color = (0, 255, 0) if is_apply_selected else (0, 150, 0)
             pygame.draw.rect(self.screen_surface, border_color, self.apply_rect, width=2, border_radius=8)
             
-            apply_text = self.font_item.render("APPLY", True, self.color_title)
+            apply_text = text_cache.render(self.font_item, "APPLY", True, self.color_title)
             apply_text_rect = apply_text.get_rect(center=self.apply_rect.center)
             self.screen_surface.blit(apply_text, apply_text_rect)
             
@@ -318,7 +319,7 @@ class SettingsDisplayScreen:
         border_color = self.color_accent if is_back_selected else self.color_box_border
         pygame.draw.rect(self.screen_surface, border_color, self.back_rect, width=2, border_radius=8)
         
-        back_text = self.font_item.render("BACK", True, self.color_title if is_back_selected else self.color_item)
+        back_text = text_cache.render(self.font_item, "BACK", True, self.color_title if is_back_selected else self.color_item)
         back_text_rect = back_text.get_rect(center=self.back_rect.center)
         self.screen_surface.blit(back_text, back_text_rect)
     
@@ -327,7 +328,7 @@ class SettingsDisplayScreen:
         center_x = config.SCREEN_WIDTH // 2
         footer_y = config.SCREEN_HEIGHT - 50
         
-        hint_text = self.font_hint.render(
+        hint_text = text_cache.render(self.font_hint,
             "Arrow Keys to navigate/change  |  ENTER to apply  |  ESC to go back",
             True,
             self.color_subtitle
@@ -336,7 +337,7 @@ class SettingsDisplayScreen:
         self.screen_surface.blit(hint_text, hint_rect)
         
         if self.has_changes:
-            warning_text = self.font_hint.render(
+            warning_text = text_cache.render(self.font_hint,
                 "Changes require game restart",
                 True,
                 (255, 200, 0)  # Yellow warning
@@ -5,6 +5,7 @@ import pygame
 import config
 from settings.runtime_config import runtime_config
 from settings.presets import PresetManager, BUILTIN_PRESETS
+from ui.text_cache import text_cache
 
 
 class SettingsPresetsScreen:
@@ -15,12 +16,12 @@ class SettingsPresetsScreen:
         self.screen_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         
         # Fonts (cached)
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_preset = pygame.font.Font(None, 36)
-        self.font_preset_desc = pygame.font.Font(None, 24)
-        self.font_hint = pygame.font.Font(None, 24)
-        self.font_input = pygame.font.Font(None, 32)
+        self.font_title = text_cache.font(72)
+        self.font_subtitle = text_cache.font(32)
+        self.font_preset = text_cache.font(36)
+        self.font_preset_desc = text_cache.font(24)
+        self.font_hint = text_cache.font(24)
+        self.font_input = text_cache.font(32)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -320,7 +321,7 @@ class SettingsPresetsScreen:
         """Draw the screen title."""
         center_x = config.SCREEN_WIDTH // 2
         
-        title_text = self.font_title.render("PRESETS", True, self.color_title)
+        title_text = text_cache.render(self.font_title, "PRESETS", True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 80))
         self.screen_surface.blit(title_text, title_rect)
     
@@ -357,7 +358,7 @@ class SettingsPresetsScreen:
             
             # Draw selection indicator
             if is_selected:
-                indicator_text = self.font_preset.render(">", True, self.color_accent)
+                indicator_text = text_cache.render(self.font_preset, ">", True, self.color_accent)
                 self.screen_surface.blit(indicator_text, (item_rect.left - 25, y_pos + 12))
             
             if item["type"] == "preset":
@@ -366,23 +367,23 @@ class SettingsPresetsScreen:
                 
                 # Draw preset name
                 name_color = self.color_preset_selected if is_selected else self.color_preset
-                name_text = self.font_preset.render(preset["name"], True, name_color)
+                name_text = text_cache.render(self.font_preset, preset["name"], True, name_color)
                 self.screen_surface.blit(name_text, (item_rect.left + 20, y_pos + 8))
                 
                 # Draw type badge
                 badge_color = self.color_builtin if is_builtin else self.color_custom
                 badge_text = "BUILT-IN" if is_builtin else "CUSTOM"
-                badge = self.font_preset_desc.render(badge_text, True, badge_color)
+                badge = text_cache.render(self.font_preset_desc, badge_text, True, badge_color)
                 self.screen_surface.blit(badge, (item_rect.right - badge.get_width() - 15, y_pos + 12))
                 
                 # Draw description
-                desc_text = self.font_preset_desc.render(preset.get("description", ""), True, self.color_subtitle)
+                desc_text = text_cache.render(self.font_preset_desc, preset.get("description", ""), True, self.color_subtitle)
                 self.screen_surface.blit(desc_text, (item_rect.left + 20, y_pos + 38))
             
             else:
                 # Action item
                 name_color = self.color_preset_selected if is_selected else self.color_preset
-                name_text = self.font_preset.render(item["name"], True, name_color)
+                name_text = text_cache.render(self.font_preset, item["name"], True, name_color)
                 name_rect = name_text.get_rect(center=item_rect.center)
                 self.screen_surface.blit(name_text, name_rect)
     
@@ -405,12 +406,12 @@ class SettingsPresetsScreen:
         pygame.draw.rect(self.screen_surface, self.color_accent, dialog_rect, width=2, border_radius=10)
         
         # Title
-        title = self.font_subtitle.render("SAVE PRESET", True, self.color_title)
+        title = text_cache.render(self.font_subtitle, "SAVE PRESET", True, self.color_title)
         title_rect = title.get_rect(center=(center_x, dialog_rect.top + 30))
         self.screen_surface.blit(title, title_rect)
         
         # Name field
-        name_label = self.font_preset_desc.render("Name:", True, self.color_subtitle)
+        name_label = text_cache.render(self.font_preset_desc, "Name:", True, self.color_subtitle)
         self.screen_surface.blit(name_label, (dialog_rect.left + 30, dialog_rect.top + 70))
         
         name_box = pygame.Rect(dialog_rect.left + 30, dialog_rect.top + 95, dialog_width - 60, 35)
@@ -418,11 +419,11 @@ class SettingsPresetsScreen:
         pygame.draw.rect(self.screen_surface, (20, 20, 20), name_box)
         pygame.draw.rect(self.screen_surface, box_color, name_box, width=2)
         
-        name_text = self.font_input.render(self.save_name + ("|" if self.save_field == 0 else ""), True, self.color_title)
+        name_text = text_cache.render(self.font_input, self.save_name + ("|" if self.save_field == 0 else ""), True, self.color_title)
         self.screen_surface.blit(name_text, (name_box.left + 10, name_box.top + 5))
         
         # Description field
-        desc_label = self.font_preset_desc.render("Description:", True, self.color_subtitle)
+        desc_label = text_cache.render(self.font_preset_desc, "Description:", True, self.color_subtitle)
         self.screen_surface.blit(desc_label, (dialog_rect.left + 30, dialog_rect.top + 140))
         
         desc_box = pygame.Rect(dialog_rect.left + 30, dialog_rect.top + 165, dialog_width - 60, 35)
@@ -430,11 +431,11 @@ class SettingsPresetsScreen:
         pygame.draw.rect(self.screen_surface, (20, 20, 20), desc_box)
         pygame.draw.rect(self.screen_surface, box_color, desc_box, width=2)
         
-        desc_text = self.font_input.render(self.save_description + ("|" if self.save_field == 1 else ""), True, self.color_title)
+        desc_text = text_cache.render(self.font_input, self.save_description + ("|" if self.save_field == 1 else ""), True, self.color_title)
         self.screen_surface.blit(desc_text, (desc_box.left + 10, desc_box.top + 5))
         
         # Instructions
-        hint = self.font_preset_desc.render("Tab to switch fields | Enter to save | ESC to cancel", True, self.color_subtitle)
+        hint = text_cache.render(self.font_preset_desc, "Tab to switch fields | Enter to save | ESC to cancel", True, self.color_subtitle)
         hint_rect = hint.get_rect(center=(center_x, dialog_rect.bottom - 20))
         self.screen_surface.blit(hint, hint_rect)
     
@@ -442,7 +443,7 @@ class SettingsPresetsScreen:
         """Draw status message."""
         center_x = config.SCREEN_WIDTH // 2
         
-        status_text = self.font_subtitle.render(self.status_message, True, self.color_custom)
+        status_text = text_cache.render(self.font_subtitle, self.status_message, True, self.color_custom)
         status_rect = status_text.get_rect(center=(center_x, config.SCREEN_HEIGHT - 100))
         self.screen_surface.blit(status_text, status_rect)
     
@@ -452,6 +453,6 @@ class SettingsPresetsScreen:
         footer_y = config.SCREEN_HEIGHT - 50
         
         hint = "Enter to load  |  U to update  |  Delete to remove  |  ESC to go back"
-        hint_text = self.font_hint.render(hint, True, self.color_subtitle)
+        hint_text = text_cache.render(self.font_hint, hint, True, self.color_subtitle)
         hint_rect = hint_text.get_rect(center=(center_x, footer_y))
         self.screen_surface.blit(hint_text, hint_rect)
@@ -5,6 +5,7 @@ import pygame
 import config
 from settings.runtime_config import runtime_config
 from settings.persistence import SettingsPersistence
+from ui.text_cache import text_cache
 
 
 class SettingsCategory:
@@ -26,11 +27,11 @@ class SettingsScreen:
         self.screen_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         
         # Fonts (cached)
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_category = pygame.font.Font(None, 42)
-        self.font_category_sub = pygame.font.Font(None, 24)
-        self.font_hint = pygame.font.Font(None, 24)
+        self.font_title = text_cache.font(72)
+        self.font_subtitle = text_cache.font(32)
+        self.font_category = text_cache.font(42)
+        self.font_category_sub = text_cache.font(24)
+        self.font_hint = text_cache.font(24)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -249,7 +250,7 @@ class SettingsScreen:
         """Draw the screen title."""
         center_x = config.SCREEN_WIDTH // 2
         
-        title_text = self.font_title.render("CONFIG", True, self.color_title)
+        title_text = text_cache.render(self.font_title, "CONFIG", True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 80))
         self.screen_surface.blit(title_text, title_rect)
     
@@ -293,17 +294,17 @@ class SettingsScreen:
             
             # Draw selection indicator
             if is_selected and category.enabled:
-                indicator_text = self.font_category.render(">", True, self.color_accent)
+                indicator_text = text_cache.render(self.font_category, ">", True, self.color_accent)
                 self.screen_surface.blit(indicator_text, (item_rect.left - 30, y_pos + 8))
             
             # Draw category name
-            name_text = self.font_category.render(category.name, True, text_color)
+            name_text = text_cache.render(self.font_category, category.name, True, text_color)
             self.screen_surface.blit(name_text, (item_rect.left + 20, y_pos + 8))
             
             # Draw subtitle
             if category.subtitle:
                 sub_color = self.color_subtitle if category.enabled else self.color_category_disabled
-                sub_text = self.font_category_sub.render(category.subtitle, True, sub_color)
+                sub_text = text_cache.render(self.font_category_sub, category.subtitle, True, sub_color)
                 self.screen_surface.blit(sub_text, (item_rect.left + 20, y_pos + 38))
     
     def _draw_footer(self):
@@ -311,7 +312,7 @@ class SettingsScreen:
         center_x = config.SCREEN_WIDTH // 2
         footer_y = config.SCREEN_HEIGHT - 50
         
-        hint_text = self.font_hint.render(
+        hint_text = text_cache.render(self.font_hint,
             "Arrow Keys to navigate  |  Enter to select  |  ESC to go back",
             True,
             self.color_subtitle
@@ -3,6 +3,7 @@ SettingsTeamsScreen - Placeholder for team settings (Phase 3)
 """
 import pygame
 import config
+from ui.text_cache import text_cache
 
 
 class SettingsTeamsScreen:
@@ -13,9 +14,9 @@ class SettingsTeamsScreen:
         self.screen_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         
         # Fonts (cached)
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_message = pygame.font.Font(None, 36)
-        self.font_hint = pygame.font.Font(None, 24)
+        self.font_title = text_cache.font(72)
+        self.font_message = text_cache.font(36)
+        self.font_hint = text_cache.font(24)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -42,17 +43,17 @@ class SettingsTeamsScreen:
         center_y = config.SCREEN_HEIGHT // 2
         
         # Title
-        title = self.font_title.render("TEAM SETTINGS", True, self.color_title)
+        title = text_cache.render(self.font_title, "TEAM SETTINGS", True, self.color_title)
         title_rect = title.get_rect(center=(center_x, center_y - 60))
         self.screen_surface.blit(title, title_rect)
         
         # Coming soon message
-        message = self.font_message.render("Coming in Phase 3", True, self.color_subtitle)
+        message = text_cache.render(self.font_message, "Coming in Phase 3", True, self.color_subtitle)
         message_rect = message.get_rect(center=(center_x, center_y + 10))
         self.screen_surface.blit(message, message_rect)
         
         # Hint
-        hint = self.font_hint.render("Press ESC or Enter to go back", True, self.color_subtitle)
+        hint = text_cache.render(self.font_hint, "Press ESC or Enter to go back", True, self.color_subtitle)
         hint_rect = hint.get_rect(center=(center_x, config.SCREEN_HEIGHT - 50))
         self.screen_surface.blit(hint, hint_rect)
         
@@ -0,0 +1,173 @@
+"""
+Text Cache - Shared text rendering for every screen
+
+Most text on screen is the same from one frame to the next (names, labels,
+headers), yet screens called font.render for all of it every frame. The
+shared text_cache keeps rendered strings in an LRU keyed by (font, text,
+antialias, colour, background), and hands out shared fonts so screens that
+are created again (e.g. for each race) keep hitting the same entries.
+
+Numbers that change constantly (gaps like "+1.234", lap counts, tyre ages)
+would churn the LRU instead, so blit() composes strings made only of
+GLYPH_CHARS from a per-font glyph atlas: one cached surface per character,
+drawn with a single Surface.blits() call.
+
+Cached surfaces are shared between callers and must not be drawn on.
+Hit/miss counters are available from stats() for profiling.
+"""
+import collections
+
+import pygame
+
+import config
+
+# Characters blit() composes from glyphs instead of rendering the whole string
+GLYPH_CHARS = frozenset("0123456789+-.:L ")
+
+
+class TextCache:
+    """LRU of rendered strings plus per-font glyph atlases"""
+
+    def __init__(self, max_entries=None):
+        """
+        Args:
+            max_entries: Rendered strings kept (default: config.TEXT_CACHE_SIZE)
+        """
+        self.max_entries = max_entries or config.TEXT_CACHE_SIZE
+        self._surfaces = collections.OrderedDict()
+        self._glyphs = {}   # (font, antialias, colour) -> {char: (surface, advance)}
+        self._fonts = {}    # (name, size) -> Font
+        self._quit_hook = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.glyph_strings = 0  # Strings composed from glyphs
+        self.glyph_misses = 0   # Glyphs rendered for the atlas
+
+    def font(self, size, name=None):
+        """
+        Shared Font for a size (same object for every caller, so cached text is shared).
+
+        Args:
+            size: Font size in points
+            name: Font file (default: pygame's default font)
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not self._quit_hook:
+                # Fonts (and text rendered with them) don't outlive pygame.quit()
+                pygame.register_quit(self.clear)
+                self._quit_hook = True
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, font, text, antialias, color, background=None):
+        """
+        Cached font.render(text, antialias, color, background).
+
+        Returns:
+            pygame.Surface: Shared surface (don't draw on it)
+        """
+        key = (font, text, antialias, _hashable(color), _hashable(background))
+        surfaces = self._surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        surfaces[key] = surface
+        if len(surfaces) > self.max_entries:
+            surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def blit(self, target, font, text, color, dest, anchor="topleft", antialias=True):
+        """
+        Draw text onto target, composing numeric strings from cached glyphs.
+
+        Args:
+            target: Surface to draw on
+            font: Font (preferably from font())
+            text: Text to draw
+            color: Text colour
+            dest: Anchor point, e.g. (x, y)
+            anchor: Rect attribute dest refers to ("topleft", "center", "midright", ...)
+            antialias: Antialiased text
+
+        Returns:
+            pygame.Rect: Area drawn
+        """
+        if not GLYPH_CHARS.issuperset(text):
+            surface = self.render(font, text, antialias, color)
+            rect = surface.get_rect(**{anchor: dest})
+            target.blit(surface, rect)
+            return rect
+
+        glyphs = self._glyph_atlas(font, antialias, color)
+        for char in text:
+            if char not in glyphs:
+                self._add_glyph(glyphs, font, char, antialias, color)
+        self.glyph_strings += 1
+
+        rect = pygame.Rect(0, 0, sum(glyphs[char][1] for char in text), font.get_height())
+        setattr(rect, anchor, dest)
+        x, y = rect.topleft
+        sequence = []
+        for char in text:
+            surface, advance = glyphs[char]
+            sequence.append((surface, (x, y)))
+            x += advance
+        target.blits(sequence, doreturn=False)
+        return rect
+
+    def _glyph_atlas(self, font, antialias, color):
+        """Glyphs of one font and colour (created empty, filled on demand)."""
+        key = (font, antialias, _hashable(color))
+        glyphs = self._glyphs.get(key)
+        if glyphs is None:
+            glyphs = self._glyphs[key] = {}
+        return glyphs
+
+    def _add_glyph(self, glyphs, font, char, antialias, color):
+        """Render one character into a glyph atlas."""
+        self.glyph_misses += 1
+        advance = font.metrics(char)[0][4]
+        glyphs[char] = (font.render(char, antialias, color), advance)
+
+    def stats(self):
+        """
+        Counters for profiling.
+
+        Returns:
+            dict: hits, misses, evictions, entries, glyph_strings, glyph_misses, hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._surfaces),
+            "glyph_strings": self.glyph_strings,
+            "glyph_misses": self.glyph_misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """Drop every cached surface, glyph and font (counters are kept)."""
+        self._surfaces.clear()
+        self._glyphs.clear()
+        self._fonts.clear()
+        self._quit_hook = False
+
+
+def _hashable(color):
+    """Colours may be lists or pygame.Color; use a tuple for cache keys."""
+    return color if color is None or type(color) is tuple else tuple(color)
+
+
+# Shared instance used by all screens
+text_cache = TextCache()
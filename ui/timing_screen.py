@@ -1,9 +1,31 @@
 """
 Timing Screen - F1-style live timing display
+
+The tower is drawn incrementally. The header, row stripes and position
+numbers never change during a race, so they live on a background surface
+drawn once. Each car has its own row surface, re-rendered only when
+something it shows changes; a slot on the tower is redrawn only when it
+shows a different row than last frame, so cars moving up or down the order
+just blit their existing rows into new slots.
+
+Gaps would otherwise change every frame, so like broadcast graphics they
+refresh at config.TIMING_GAP_UPDATE_HZ (a car's gap still updates at once
+when its position changes).
+
+With render(dirty=True) only the redrawn slots are copied to the screen.
 """
+import time
+
 import pygame
 import config
 from assets.colors import get_team_color, get_team_short_name
+from ui.text_cache import text_cache
+
+ROW_START_Y = 105
+ROW_HEIGHT = 38
+STRIPE_COLOR = (25, 25, 25)
+LAPPED_COLOR = (255, 100, 100)
+
 
 class TimingScreen:
     """Renders F1-style live timing screen"""
@@ -11,29 +33,74 @@ class TimingScreen:
     def __init__(self, surface):
         self.surface = surface
         self.timing_surface = pygame.Surface((config.TIMING_VIEW_WIDTH, config.SCREEN_HEIGHT))
-        self.font_large = pygame.font.Font(None, 32)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 20)
+        self.font_large = text_cache.font(32)
+        self.font_medium = text_cache.font(24)
+        self.font_small = text_cache.font(20)
+
+        self.background = None   # Header, stripes and position numbers
+        self.field_size = 0      # Cars the background was drawn for
+        self._slots = []         # Row drawn in each slot (None = needs drawing)
+        self._rows = {}          # driver_number -> (key, surface)
+        self._gaps = {}          # driver_number -> (position, gap text, colour)
+        self._gaps_at = None     # Clock time gaps were last refreshed
+        self.rows_rendered = 0   # Row surfaces rendered (for profiling)
+
+    def render(self, race_engine, now=None, dirty=False):
+        """
+        Render the timing screen.
+
+        Args:
+            race_engine: Race engine or view to show
+            now: Clock time in seconds for the gap refresh rate (default: time.perf_counter())
+            dirty: Only copy the slots that changed to the screen
+
+        Returns:
+            list: Screen rectangles that changed
+        """
+        cars = race_engine.get_cars_by_position()
+        if self.background is None or len(cars) != self.field_size:
+            self._draw_background(len(cars))
+            dirty = False
+
+        refresh_gaps = self._gaps_due(time.perf_counter() if now is None else now)
+        changed = self._draw_timing_rows(cars, race_engine.race_time, refresh_gaps)
+
+        offset = (config.TIMING_VIEW_X, 0)
+        if not dirty:
+            # Blit to main surface
+            return [self.surface.blit(self.timing_surface, offset)]
+        return [self.surface.blit(self.timing_surface, rect.move(offset), rect) for rect in changed]
+
+    def _draw_background(self, field_size):
+        """Draw everything that doesn't change during a race, then the whole tower from scratch"""
+        self.field_size = field_size
+        self.background = pygame.Surface(self.timing_surface.get_size())
+        self.background.fill(config.TIMING_BG_COLOR)
+        self._draw_header()
 
-    def render(self, race_engine):
-        """Render the timing screen"""
-        # Clear timing surface
-        self.timing_surface.fill(config.TIMING_BG_COLOR)
+        slots = min(field_size, (config.SCREEN_HEIGHT - ROW_START_Y + 3 + ROW_HEIGHT - 1) // ROW_HEIGHT)
+        for i in range(slots):
+            y_pos = ROW_START_Y + i * ROW_HEIGHT
 
-        # Draw header
-        self._draw_header()
+            # Alternating row background
+            if i % 2 == 0:
+                pygame.draw.rect(
+                    self.background,
+                    STRIPE_COLOR,
+                    (10, y_pos - 3, config.TIMING_VIEW_WIDTH - 20, ROW_HEIGHT - 2)
+                )
 
-        # Draw timing rows
-        self._draw_timing_rows(race_engine)
+            # Position (the slot's, whichever car is in it)
+            text_cache.blit(self.background, self.font_medium, str(i + 1), config.TEXT_COLOR, (25, y_pos))
 
-        # Blit to main surface
-        self.surface.blit(self.timing_surface, (config.TIMING_VIEW_X, 0))
+        self.timing_surface.blit(self.background, (0, 0))
+        self._slots = [None] * slots
 
     def _draw_header(self):
         """Draw timing screen header"""
         # Title
-        title_text = self.font_large.render("LIVE TIMING", True, config.TEXT_COLOR)
-        self.timing_surface.blit(title_text, (20, 20))
+        title_text = text_cache.render(self.font_large, "LIVE TIMING", True, config.TEXT_COLOR)
+        self.background.blit(title_text, (20, 20))
 
         # Column headers
         y_pos = 70
@@ -46,92 +113,136 @@ class TimingScreen:
         ]
 
         for header, x_pos in headers:
-            text = self.font_small.render(header, True, config.TEXT_GRAY)
-            self.timing_surface.blit(text, (x_pos, y_pos))
+            text = text_cache.render(self.font_small, header, True, config.TEXT_GRAY)
+            self.background.blit(text, (x_pos, y_pos))
 
         # Draw separator line
         pygame.draw.line(
-            self.timing_surface,
+            self.background,
             config.TRACK_LINE_COLOR,
             (10, 95),
             (config.TIMING_VIEW_WIDTH - 10, 95),
             1
         )
 
-    def _draw_timing_rows(self, race_engine):
-        """Draw timing information for all cars"""
-        start_y = 105
-        row_height = 38
-
-        cars = race_engine.get_cars_by_position()
-
-        for i, car in enumerate(cars):
-            y_pos = start_y + i * row_height
-
-            # Alternating row background
-            if i % 2 == 0:
-                pygame.draw.rect(
-                    self.timing_surface,
-                    (25, 25, 25),
-                    (10, y_pos - 3, config.TIMING_VIEW_WIDTH - 20, row_height - 2)
-                )
-
-            # Team color bar
-            team_color = get_team_color(car.team)
-            pygame.draw.rect(
-                self.timing_surface,
-                team_color,
-                (10, y_pos - 3, 5, row_height - 2)
-            )
-
-            # Position
-            pos_text = self.font_medium.render(str(car.position), True, config.TEXT_COLOR)
-            self.timing_surface.blit(pos_text, (25, y_pos))
-
-            # Driver name (short)
-            driver_text = self.font_medium.render(car.driver_short, True, config.TEXT_COLOR)
-            self.timing_surface.blit(driver_text, (70, y_pos))
-
-            # Team (short name)
-            team_short = get_team_short_name(car.team)
-            team_text = self.font_small.render(team_short, True, config.TEXT_GRAY)
-            self.timing_surface.blit(team_text, (130, y_pos + 2))
-
-            # Gap to leader or ahead
-            if car.position == 1:
-                gap_text = self.font_medium.render("LEADER", True, config.TEXT_COLOR)
-            elif car.gap_to_leader >= 1.0:
-                # Show lapped indicator if a full lap behind (progress-based check)
-                laps_down = int(car.gap_to_leader)
-                gap_str = f"+{laps_down}L"
-                gap_text = self.font_medium.render(gap_str, True, (255, 100, 100))
-            else:
-                # Show time gap to car ahead (in seconds)
-                gap_str = f"+{car.gap_to_ahead_time:.3f}"
-                gap_text = self.font_medium.render(gap_str, True, config.TEXT_GRAY)
-
-            self.timing_surface.blit(gap_text, (280, y_pos))
-
-            # Current lap
-            lap_text = self.font_medium.render(str(car.lap), True, config.TEXT_COLOR)
-            self.timing_surface.blit(lap_text, (380, y_pos))
-
-            # Tire compound
-            self._draw_tire_indicator(car, 450, y_pos + 5)
-
-    def _draw_tire_indicator(self, car, x, y):
+    def _gaps_due(self, now):
+        """Check whether gaps refresh this frame (at most TIMING_GAP_UPDATE_HZ times a second)"""
+        rate = config.TIMING_GAP_UPDATE_HZ
+        if not rate or self._gaps_at is None or now - self._gaps_at >= 1.0 / rate or now < self._gaps_at:
+            self._gaps_at = now
+            return True
+        return False
+
+    def _draw_timing_rows(self, cars, race_time, refresh_gaps):
+        """Redraw the slots whose row changed, returning their rectangles"""
+        surface = self.timing_surface
+        changed = []
+        for i, car in enumerate(cars[:len(self._slots)]):
+            gap = self._gap(car, refresh_gaps)
+            arrow = self._position_change(car, race_time)
+            key = (car.driver_short, car.team, gap, car.lap, car.tire_compound, car.tire_age, arrow)
+            row = self._rows.get(car.driver_number)
+            if row is None or row[0] != key:
+                row = (key, self._render_row(car, gap, arrow))
+                self._rows[car.driver_number] = row
+                self.rows_rendered += 1
+
+            if self._slots[i] is not row:
+                rect = pygame.Rect(0, ROW_START_Y + i * ROW_HEIGHT - 3, config.TIMING_VIEW_WIDTH, ROW_HEIGHT)
+                surface.blit(self.background, rect, rect)
+                surface.blit(row[1], rect)
+                self._slots[i] = row
+                changed.append(rect)
+        return changed
+
+    def _gap(self, car, refresh):
+        """Gap text and colour shown for a car (recomputed on refresh or a position change)"""
+        shown = self._gaps.get(car.driver_number)
+        if shown is not None and not refresh and shown[0] == car.position:
+            return shown[1:]
+
+        if car.position == 1:
+            gap = ("LEADER", config.TEXT_COLOR)
+        elif car.gap_to_leader >= 1.0:
+            # Show lapped indicator if a full lap behind (progress-based check)
+            laps_down = int(car.gap_to_leader)
+            gap = (f"+{laps_down}L", LAPPED_COLOR)
+        else:
+            # Show time gap to car ahead (in seconds)
+            gap = (f"+{car.gap_to_ahead_time:.3f}", config.TEXT_GRAY)
+        self._gaps[car.driver_number] = (car.position,) + gap
+        return gap
+
+    def _position_change(self, car, race_time):
+        """Direction of the gain/loss arrow shown for a car (1, -1, or 0 for none)"""
+        if car.position_change_time is None or car.position_change == 0:
+            return 0
+        if race_time - car.position_change_time > config.POSITION_CHANGE_DISPLAY_TIME:
+            return 0
+        return 1 if car.position_change > 0 else -1
+
+    def _render_row(self, car, gap, arrow):
+        """
+        Render a car's row (everything but the stripe and position number).
+
+        Returns:
+            pygame.Surface: Transparent row, ROW_HEIGHT high, to blit over its slot
+        """
+        row = pygame.Surface((config.TIMING_VIEW_WIDTH, ROW_HEIGHT), pygame.SRCALPHA)
+        y_pos = 3
+
+        # Team color bar
+        team_color = get_team_color(car.team)
+        pygame.draw.rect(row, team_color, (10, y_pos - 3, 5, ROW_HEIGHT - 2))
+
+        self._draw_position_change(row, arrow, 52, y_pos + 8)
+
+        # Driver name (short)
+        driver_text = text_cache.render(self.font_medium, car.driver_short, True, config.TEXT_COLOR)
+        row.blit(driver_text, (70, y_pos))
+
+        # Team (short name)
+        team_short = get_team_short_name(car.team)
+        team_text = text_cache.render(self.font_small, team_short, True, config.TEXT_GRAY)
+        row.blit(team_text, (130, y_pos + 2))
+
+        # Gap to leader or ahead
+        gap_str, gap_color = gap
+        text_cache.blit(row, self.font_medium, gap_str, gap_color, (280, y_pos))
+
+        # Current lap
+        text_cache.blit(row, self.font_medium, str(car.lap), config.TEXT_COLOR, (380, y_pos))
+
+        # Tire compound
+        self._draw_tire_indicator(row, car, 450, y_pos + 5)
+        return row
+
+    def _draw_position_change(self, row, arrow, x, y):
+        """Draw a gain/loss arrow"""
+        if arrow == 0:
+            return
+
+        if arrow > 0:
+            points = [(x, y + 6), (x + 8, y + 6), (x + 4, y)]
+            color = config.POSITION_GAIN_COLOR
+        else:
+            points = [(x, y), (x + 8, y), (x + 4, y + 6)]
+            color = config.POSITION_LOSS_COLOR
+        pygame.draw.polygon(row, color, points)
+
+    def _draw_tire_indicator(self, row, car, x, y):
         """Draw tire compound indicator"""
         tire_color = config.TIRE_COLORS.get(car.tire_compound, (255, 255, 255))
 
         # Draw tire circle
         pygame.draw.circle(
-            self.timing_surface,
+            row,
             tire_color,
             (x + 10, y + 10),
             8
         )
         pygame.draw.circle(
-            self.timing_surface,
+            row,
             (255, 255, 255),
             (x + 10, y + 10),
             8,
@@ -139,5 +250,4 @@ class TimingScreen:
         )
 
         # Draw tire age
-        age_text = self.font_small.render(str(car.tire_age), True, config.TEXT_GRAY)
-        self.timing_surface.blit(age_text, (x + 25, y + 3))
+        text_cache.blit(row, self.font_small, str(car.tire_age), config.TEXT_GRAY, (x + 25, y + 3))
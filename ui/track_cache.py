@@ -0,0 +1,185 @@
+"""
+Track Cache - Pre-rendered static track surfaces, in memory and on disk
+
+Every race (and every restart) creates a new TrackRenderer, which used to
+draw the static track again: every quad, kerb, gravel and grass polygon.
+track_surface_cache keeps the finished surfaces in an LRU keyed by the
+track's content, the surface size and the scale factor, and saves the slow
+ones as PNGs under config.TRACK_CACHE_DIRECTORY so later launches load them
+instead of drawing them.
+
+The key hashes everything the drawing depends on (waypoints, decorations,
+track colours and CACHE_VERSION), so an edited track or a new resolution
+gets a new entry rather than a stale one. Bump CACHE_VERSION when the way
+tracks are drawn changes.
+
+Loading a PNG is not free either (about as slow as drawing an undecorated
+circuit), so only surfaces that took config.TRACK_CACHE_DISK_MIN_BUILD_MS
+or more to draw are saved, on a background thread, since encoding a large
+PNG takes several times longer than drawing it.
+
+Cached surfaces are shared between renderers and must not be drawn on.
+The disk copy is a best-effort cache: it is skipped if it can't be read or
+written.
+"""
+import collections
+import hashlib
+import json
+import os
+import threading
+import time
+
+import pygame
+
+import config
+
+CACHE_VERSION = 1
+
+# Config values the static track surface is drawn with
+STYLE_SETTINGS = ("TRACK_BG_COLOR", "TRACK_COLOR", "TRACK_LINE_COLOR", "GRASS_COLOR", "GRAVEL_COLOR",
+                  "GRAVEL_BORDER_COLOR", "KERB_RED", "KERB_WHITE", "KERB_WIDTH", "KERB_MIN_CORNER_ANGLE")
+
+
+class TrackSurfaceCache:
+    """LRU of static track surfaces backed by PNG files"""
+
+    def __init__(self, max_entries=None, directory=None, max_files=None, min_build_ms=None):
+        """
+        Args:
+            max_entries: Surfaces kept in memory (default: config.TRACK_CACHE_SIZE)
+            directory: Directory for PNG copies (default: config.TRACK_CACHE_DIRECTORY;
+                       "" or None there means memory only)
+            max_files: PNG copies kept, oldest removed first (default: config.TRACK_CACHE_DISK_ENTRIES)
+            min_build_ms: Only save surfaces that took this long to draw
+                          (default: config.TRACK_CACHE_DISK_MIN_BUILD_MS)
+        """
+        self.max_entries = max_entries or config.TRACK_CACHE_SIZE
+        self.directory = directory if directory is not None else config.TRACK_CACHE_DIRECTORY
+        self.max_files = max_files or config.TRACK_CACHE_DISK_ENTRIES
+        self.min_build_ms = min_build_ms if min_build_ms is not None else config.TRACK_CACHE_DISK_MIN_BUILD_MS
+        self._surfaces = collections.OrderedDict()
+        self._writers = []
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, track, size):
+        """
+        Cache key for a track drawn at a surface size.
+
+        Returns:
+            str: Hex digest
+        """
+        content = {
+            "version": CACHE_VERSION,
+            "size": list(size),
+            "scale": config.SCALE_FACTOR,
+            "waypoints": [list(point) for point in track.waypoints],
+            "decorations": track.decorations,
+            "style": [getattr(config, name, None) for name in STYLE_SETTINGS],
+        }
+        data = json.dumps(content, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, track, size, build):
+        """
+        Static surface for a track: from memory, else from disk, else build(track).
+
+        Args:
+            track: Track to draw
+            size: Surface size (width, height)
+            build: Function drawing the surface for a track
+
+        Returns:
+            pygame.Surface: Shared surface (don't draw on it)
+        """
+        key = self.key(track, size)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = self._load(key, size)
+        if surface is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            start = time.perf_counter()
+            surface = build(track)
+            if (time.perf_counter() - start) * 1000.0 >= self.min_build_ms:
+                self._save(key, surface)
+
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop the surfaces kept in memory (PNG copies are kept)."""
+        self._surfaces.clear()
+
+    def wait(self):
+        """Wait for PNG copies still being written."""
+        for writer in self._writers:
+            writer.join()
+        self._writers = []
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"track_{key}.png")
+
+    def _load(self, key, size):
+        """Surface saved for a key, or None."""
+        if not self.directory:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            surface = pygame.image.load(path)
+            os.utime(path)  # Mark as recently used for pruning
+        except (pygame.error, OSError):
+            return None
+        if surface.get_size() != tuple(size):
+            return None
+        if pygame.display.get_surface() is not None:
+            # Match the display format so blits don't convert every frame
+            surface = surface.convert()
+        return surface
+
+    def _save(self, key, surface):
+        """Start writing a surface's PNG copy in the background."""
+        if not self.directory:
+            return
+        self._writers = [writer for writer in self._writers if writer.is_alive()]
+        writer = threading.Thread(target=self._write, args=(key, surface.copy()),
+                                  name="track-cache-writer")
+        writer.start()
+        self._writers.append(writer)
+
+    def _write(self, key, surface):
+        """Write a PNG copy (to a temporary file first, so readers never see half a file)."""
+        path = self._path(key)
+        temporary = f"{path}.{os.getpid()}.tmp.png"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            pygame.image.save(surface, temporary)
+            os.replace(temporary, path)
+            self._prune()
+        except (pygame.error, OSError):
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _prune(self):
+        """Remove the least recently used PNG copies beyond max_files."""
+        paths = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.startswith("track_") and name.endswith(".png") and ".tmp." not in name]
+        if len(paths) <= self.max_files:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_files]:
+            os.remove(path)
+
+
+# Shared instance used by every TrackRenderer
+track_surface_cache = TrackSurfaceCache()
@@ -5,6 +5,7 @@ import pygame
 import config
 from race.track_loader import get_available_tracks, load_track_waypoints, load_track_with_decorations, get_default_waypoints
 from data.circuits import get_all_circuits, get_circuit_by_id, get_circuit_name
+from ui.text_cache import text_cache
 
 
 class TrackSelectionScreen:
@@ -15,12 +16,12 @@ class TrackSelectionScreen:
         self.selection_surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
 
         # Fonts
-        self.font_title = pygame.font.Font(None, 72)
-        self.font_subtitle = pygame.font.Font(None, 32)
-        self.font_track = pygame.font.Font(None, 42)
-        self.font_track_info = pygame.font.Font(None, 24)
-        self.font_hint = pygame.font.Font(None, 24)
-        self.font_preview_label = pygame.font.Font(None, 28)
+        self.font_title = text_cache.font(72)
+        self.font_subtitle = text_cache.font(32)
+        self.font_track = text_cache.font(42)
+        self.font_track_info = text_cache.font(24)
+        self.font_hint = text_cache.font(24)
+        self.font_preview_label = text_cache.font(28)
         
         # Colors
         self.color_bg = (15, 15, 15)
@@ -317,14 +318,14 @@ class TrackSelectionScreen:
         center_x = config.SCREEN_WIDTH // 2
         
         # Main title
-        title_text = self.font_title.render("SELECT TRACK", True, self.color_title)
+        title_text = text_cache.render(self.font_title, "SELECT TRACK", True, self.color_title)
         title_rect = title_text.get_rect(center=(center_x, 80))
         self.selection_surface.blit(title_text, title_rect)
         
         # Subtitle
         track_count = len(self.tracks)
         subtitle = f"{track_count} track{'s' if track_count != 1 else ''} available"
-        subtitle_text = self.font_subtitle.render(subtitle, True, self.color_subtitle)
+        subtitle_text = text_cache.render(self.font_subtitle, subtitle, True, self.color_subtitle)
         subtitle_rect = subtitle_text.get_rect(center=(center_x, 130))
         self.selection_surface.blit(subtitle_text, subtitle_rect)
     
@@ -375,7 +376,7 @@ class TrackSelectionScreen:
             # Draw hover indicator (arrow)
             if is_hovered:
                 indicator_x = item_rect.left - 30
-                indicator_text = self.font_track.render(">", True, self.color_accent)
+                indicator_text = text_cache.render(self.font_track, ">", True, self.color_accent)
                 self.selection_surface.blit(indicator_text, (indicator_x, y_pos + 10))
             
             # Draw track name - green only if selected, white if hovered, gray otherwise
@@ -385,12 +386,12 @@ class TrackSelectionScreen:
                 name_color = self.color_track_hover
             else:
                 name_color = self.color_track
-            name_text = self.font_track.render(track['name'], True, name_color)
+            name_text = text_cache.render(self.font_track, track['name'], True, name_color)
             self.selection_surface.blit(name_text, (item_rect.left + 20, y_pos + 8))
             
             # Draw "SELECTED" badge if this is the current selection
             if is_current_selection:
-                badge_text = self.font_track_info.render("SELECTED", True, self.color_selected_badge)
+                badge_text = text_cache.render(self.font_track_info, "SELECTED", True, self.color_selected_badge)
                 badge_x = item_rect.right - badge_text.get_width() - 15
                 self.selection_surface.blit(badge_text, (badge_x, y_pos + 15))
             
@@ -411,7 +412,7 @@ class TrackSelectionScreen:
                 info_parts.append(f"{track.get('num_waypoints', '?')} waypoints")
 
             info_str = " | ".join(info_parts)
-            info_text = self.font_track_info.render(info_str, True, self.color_subtitle)
+            info_text = text_cache.render(self.font_track_info, info_str, True, self.color_subtitle)
             self.selection_surface.blit(info_text, (item_rect.left + 20, y_pos + 38))
         
         # Draw scroll indicators if there are more tracks than visible
@@ -424,13 +425,13 @@ class TrackSelectionScreen:
         
         # Up arrow if we can scroll up
         if self.scroll_offset > 0:
-            up_text = self.font_track.render("▲", True, self.color_track)
+            up_text = text_cache.render(self.font_track, "▲", True, self.color_track)
             self.selection_surface.blit(up_text, (indicator_x, start_y - 30))
         
         # Down arrow if we can scroll down
         if self.scroll_offset < self.max_scroll:
             down_y = start_y + self.max_visible * item_height - 10
-            down_text = self.font_track.render("▼", True, self.color_track)
+            down_text = text_cache.render(self.font_track, "▼", True, self.color_track)
             self.selection_surface.blit(down_text, (indicator_x, down_y))
         
         # Position counter (e.g., "1-8 of 25")
@@ -438,7 +439,7 @@ class TrackSelectionScreen:
         last_shown = min(self.scroll_offset + self.max_visible, len(self.tracks))
         total = len(self.tracks)
         position_text = f"{first_shown}-{last_shown} of {total}"
-        pos_render = self.font_track_info.render(position_text, True, self.color_subtitle)
+        pos_render = text_cache.render(self.font_track_info, position_text, True, self.color_subtitle)
         pos_rect = pos_render.get_rect(center=(center_x, start_y + self.max_visible * item_height + 20))
         self.selection_surface.blit(pos_render, pos_rect)
     
@@ -448,7 +449,7 @@ class TrackSelectionScreen:
         footer_y = config.SCREEN_HEIGHT - 50
         
         # Controls hint
-        hint_text = self.font_hint.render(
+        hint_text = text_cache.render(self.font_hint,
             "↑↓/Wheel to scroll  |  Enter to select  |  PgUp/PgDn for pages  |  ESC to confirm",
             True,
             self.color_subtitle
@@ -476,7 +477,7 @@ class TrackSelectionScreen:
 
         # Draw label
         label = "CIRCUIT PREVIEW"
-        label_text = self.font_preview_label.render(label, True, self.color_subtitle)
+        label_text = text_cache.render(self.font_preview_label, label, True, self.color_subtitle)
         label_rect = label_text.get_rect(center=(self.preview_x + self.preview_size // 2, self.preview_y - 20))
         self.selection_surface.blit(label_text, label_rect)
 
@@ -591,7 +592,7 @@ class TrackSelectionScreen:
                 5
             )
             # Draw start/finish text
-            start_label = self.font_track_info.render("START", True, (200, 200, 200))
+            start_label = text_cache.render(self.font_track_info, "START", True, (200, 200, 200))
             self.selection_surface.blit(start_label, (int(start_x) + 10, int(start_y) - 10))
 
     def _draw_track_characteristics(self):
@@ -623,7 +624,7 @@ class TrackSelectionScreen:
         pygame.draw.rect(self.selection_surface, self.color_box_border, char_rect, width=2, border_radius=8)
 
         # Draw title
-        title_text = self.font_preview_label.render("TRACK CHARACTERISTICS", True, self.color_subtitle)
+        title_text = text_cache.render(self.font_preview_label, "TRACK CHARACTERISTICS", True, self.color_subtitle)
         title_rect = title_text.get_rect(center=(char_x + char_width // 2, char_y - 20))
         self.selection_surface.blit(title_text, title_rect)
 
@@ -677,34 +678,34 @@ class TrackSelectionScreen:
 
         # Font for labels and values
         label_font = self.font_track_info
-        value_font = pygame.font.Font(None, 24)  # Slightly larger for emphasis
+        value_font = text_cache.font(24)  # Slightly larger for emphasis
 
         # 1. Track Type
-        label = label_font.render("Track Type:", True, self.color_subtitle)
+        label = text_cache.render(label_font, "Track Type:", True, self.color_subtitle)
         self.selection_surface.blit(label, (label_x, start_y))
-        value = value_font.render(track_type_text, True, self.color_track)
+        value = text_cache.render(value_font, track_type_text, True, self.color_track)
         value_rect = value.get_rect(right=value_x, y=start_y)
         self.selection_surface.blit(value, value_rect)
 
         # 2. Tire Degradation
-        label = label_font.render("Tire Wear:", True, self.color_subtitle)
+        label = text_cache.render(label_font, "Tire Wear:", True, self.color_subtitle)
         self.selection_surface.blit(label, (label_x, start_y + line_height))
-        value = value_font.render(tire_deg_text, True, tire_deg_color)
+        value = text_cache.render(value_font, tire_deg_text, True, tire_deg_color)
         value_rect = value.get_rect(right=value_x, y=start_y + line_height)
         self.selection_surface.blit(value, value_rect)
 
         # 3. DRS Zones
-        label = label_font.render("DRS Zones:", True, self.color_subtitle)
+        label = text_cache.render(label_font, "DRS Zones:", True, self.color_subtitle)
         self.selection_surface.blit(label, (label_x, start_y + line_height * 2))
         drs_text = f"{drs_count} zone{'s' if drs_count != 1 else ''}"
-        value = value_font.render(drs_text, True, self.color_track)
+        value = text_cache.render(value_font, drs_text, True, self.color_track)
         value_rect = value.get_rect(right=value_x, y=start_y + line_height * 2)
         self.selection_surface.blit(value, value_rect)
 
         # 4. Overtaking Difficulty
-        label = label_font.render("Overtaking:", True, self.color_subtitle)
+        label = text_cache.render(label_font, "Overtaking:", True, self.color_subtitle)
         self.selection_surface.blit(label, (label_x, start_y + line_height * 3))
-        value = value_font.render(overtaking_display, True, overtaking_color)
+        value = text_cache.render(value_font, overtaking_display, True, overtaking_color)
         value_rect = value.get_rect(right=value_x, y=start_y + line_height * 3)
         self.selection_surface.blit(value, value_rect)
 